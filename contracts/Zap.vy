@@ -13,6 +13,11 @@ interface Pool:
     def assets(_i: uint256) -> address: view
     def add_liquidity(_amounts: DynArray[uint256, 32], _min_lp_amount: uint256, _receiver: address) -> uint256: nonpayable
 
+struct Signature:
+    v: uint8
+    r: bytes32
+    s: bytes32
+
 token: public(immutable(address))
 pool: public(immutable(address))
 staking: public(immutable(address))
@@ -63,6 +68,38 @@ def add_liquidity(
     @param _receiver Account to receive the LP tokens
     @return Tuple with the amount of LP tokens minted and the amount of staking shares minted
     """
+    return self._add_liquidity(_amounts, _min_lp_amount, _receiver, 0, [])
+
+@external
+def add_liquidity_permit(
+    _amounts: DynArray[uint256, 32], 
+    _min_lp_amount: uint256, 
+    _deadline: uint256,
+    _signatures: DynArray[Signature, 32],
+    _receiver: address = msg.sender
+) -> (uint256, uint256):
+    """
+    @notice Deposit assets into the pool and stake, approving the assets with EIP-2612 permits
+    @param _amounts Array of amount for each asset to take from caller
+    @param _min_lp_amount Minimum amount of LP tokens to mint
+    @param _deadline Deadline of the permits
+    @param _signatures 
+        Array of permit signature for each asset, for the asset amount with this contract as spender.
+        Assets with an empty signature have to be approved beforehand
+    @param _receiver Account to receive the LP tokens
+    @return Tuple with the amount of LP tokens minted and the amount of staking shares minted
+    @dev A failed permit is accepted if the allowance is already sufficient, as permits can be front-run
+    """
+    return self._add_liquidity(_amounts, _min_lp_amount, _receiver, _deadline, _signatures)
+
+@internal
+def _add_liquidity(
+    _amounts: DynArray[uint256, 32], 
+    _min_lp_amount: uint256, 
+    _receiver: address,
+    _deadline: uint256,
+    _signatures: DynArray[Signature, 32]
+) -> (uint256, uint256):
     num_assets: uint256 = Pool(pool).num_assets()
     for i in range(32):
         if i == num_assets:
@@ -71,6 +108,19 @@ def add_liquidity(
         if amount == 0:
             continue
         asset: address = Pool(pool).assets(i)
+        if i < len(_signatures) and _signatures[i].v != 0:
+            signature: Signature = _signatures[i]
+            permitted: bool = raw_call(
+                asset,
+                _abi_encode(
+                    msg.sender, self, amount, _deadline, signature.v, signature.r, signature.s,
+                    method_id=method_id('permit(address,address,uint256,uint256,uint8,bytes32,bytes32)')
+                ),
+                revert_on_failure=False
+            )
+            if not permitted:
+                # a failed permit is tolerated if the allowance is already set, e.g. by a front-run permit
+                assert ERC20(asset).allowance(msg.sender, self) >= amount
         assert ERC20(asset).transferFrom(msg.sender, self, amount, default_return_value=True)
 
     lp_amount: uint256 = Pool(pool).add_liquidity(_amounts, _min_lp_amount, self)
@@ -82,11 +82,39 @@ def vote_weight(_account: address) -> uint256:
     @param _account Account to get vote weight for
     @return Account vote weight
     """
+    return self._vote_weight(_account, 0, 0, False)
+
+@external
+@view
+def vote_weights(_accounts: DynArray[address, 256]) -> DynArray[uint256, 256]:
+    """
+    @notice Get vote weight of multiple accounts
+    @param _accounts Accounts to get vote weight for
+    @return Account vote weights
+    @dev Bootstrap vote weight and deposits are shared by all accounts and only queried once
+    """
+    bootstrap_weight: uint256 = 0
+    deposited: uint256 = 0
+    bootstrap_weight, deposited = self._bootstrap()
+    weights: DynArray[uint256, 256] = []
+    for account in _accounts:
+        weights.append(self._vote_weight(account, bootstrap_weight, deposited, True))
+    return weights
+
+@internal
+@view
+def _vote_weight(_account: address, _bootstrap_weight: uint256, _deposited: uint256, _shared: bool) -> uint256:
+    """
+    @notice Get account vote weight, optionally with shared bootstrap values
+    """
     weight: uint256 = Bootstrap(bootstrap).deposits(_account)
     if weight > 0:
-        deposited: uint256 = Bootstrap(bootstrap).deposited()
+        bootstrap_weight: uint256 = _bootstrap_weight
+        deposited: uint256 = _deposited
+        if not _shared:
+            bootstrap_weight, deposited = self._bootstrap()
         if deposited > 0:
-            weight = weight * staking.vote_weight(bootstrap) / deposited
+            weight = weight * bootstrap_weight / deposited
         else:
             weight = 0
     weight += staking.vote_weight(_account)
@@ -96,7 +124,15 @@ def vote_weight(_account: address) -> uint256:
         weight += delegated_staking.vote_weight(delegated) * self.delegate_multiplier / DELEGATE_SCALE
 
     return weight
-    
+
+@internal
+@view
+def _bootstrap() -> (uint256, uint256):
+    """
+    @notice Get the bootstrap vote weight and deposits
+    """
+    return staking.vote_weight(bootstrap), Bootstrap(bootstrap).deposited()
+
 @external
 def set_delegate_multiplier(_multiplier: uint256):
     """
@@ -18,6 +18,11 @@ implements: Measure
 last_supply: public(uint256)
 last_balances: public(HashMap[address, uint256])
 
+# optional append-only history of last balances
+history: public(immutable(bool))
+num_checkpoints: public(HashMap[address, uint256]) # account => number of checkpoints
+checkpoints: public(HashMap[address, HashMap[uint256, uint256]]) # account => idx => packed last balance
+
 # ERC20 state
 totalSupply: public(uint256)
 balanceOf: public(HashMap[address, uint256])
@@ -63,13 +68,15 @@ INCREMENT: constant(bool) = True
 DECREMENT: constant(bool) = False
 
 @external
-def __init__(_asset: address):
+def __init__(_asset: address, _history: bool):
     """
     @notice Constructor
     @param _asset The underlying asset
+    @param _history Whether to keep a history of balance checkpoints
     """
     assert _asset != empty(address)
     asset = _asset
+    history = _history
     log Transfer(empty(address), msg.sender, 0)
 
 @external
@@ -352,6 +359,37 @@ def vote_weight(_account: address) -> uint256:
         return shift(last, BAL_SHIFT)
     return self.balanceOf[_account]
 
+@external
+@view
+def vote_weight_at(_account: address, _week: uint256) -> uint256:
+    """
+    @notice Get the voting weight of an account at the end of a past week
+    @dev Requires the checkpoint history to be enabled
+    @param _account Account to get the vote weight for
+    @param _week Week number, has to be before the current week
+    @return Vote weight
+    """
+    assert history
+    assert _week < block.timestamp / WEEK_LENGTH
+
+    # binary search for the first checkpoint after the week, which contains the 
+    # balance at the end of the week before it. balance is unchanged since the week
+    n: uint256 = self.num_checkpoints[_account]
+    lo: uint256 = 0
+    hi: uint256 = n
+    for i in range(17):
+        if lo == hi:
+            break
+        mid: uint256 = (lo + hi) / 2
+        if self.checkpoints[_account][mid] & WEEK_MASK > _week:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    if lo == n:
+        return self.balanceOf[_account]
+    return shift(self.checkpoints[_account][lo], BAL_SHIFT)
+
 @internal
 def _deposit(_amount: uint256, _receiver: address):
     """
@@ -413,7 +451,12 @@ def _update_last(_account: address):
     week: uint256 = self.last_balances[_account] & WEEK_MASK
     current_week: uint256 = block.timestamp / WEEK_LENGTH
     if current_week > week:
-        self.last_balances[_account] = self._pack_balance(current_week, self.balanceOf[_account])
+        last: uint256 = self._pack_balance(current_week, self.balanceOf[_account])
+        self.last_balances[_account] = last
+        if history:
+            n: uint256 = self.num_checkpoints[_account]
+            self.checkpoints[_account][n] = last
+            self.num_checkpoints[_account] = n + 1
 
 @internal
 @pure
@@ -84,13 +84,7 @@ def execute_single(_to: address, _data: Bytes[2048]):
     assert len(_data) >= 4
     identifier: bytes4 = convert(slice(_data, 0, 4), bytes4)
     target: uint256 = self._pack_target(_to, identifier)
-
-    # check access control
-    access: Access = self.access[target]
-    if access == Access.BLACKLIST:
-        assert not self.blacklisted[target][msg.sender]
-    elif access == Access.WHITELIST:
-        assert self.whitelisted[target][msg.sender]
+    assert self._has_access(target, msg.sender)
 
     proxy.execute(_to, _data)
     log Execute(msg.sender, _to, _data)
@@ -118,11 +112,7 @@ def execute(_script: Bytes[2048]):
         assert size >= 4 and size <= 2048
 
         # check access control
-        access: Access = self.access[target]
-        if access == Access.BLACKLIST:
-            assert not self.blacklisted[target][msg.sender]
-        elif access == Access.WHITELIST:
-            assert self.whitelisted[target][msg.sender]
+        assert self._has_access(target, msg.sender)
 
         contract: address = empty(address)
         identifier: bytes4 = empty(bytes4)
@@ -137,6 +127,40 @@ def execute(_script: Bytes[2048]):
 
     assert i == len(_script)
 
+@external
+@view
+def check_script(_governor: address, _script: Bytes[2048]) -> bool:
+    """
+    @notice
+        Check whether a governor is allowed to execute all calls in a script.
+        Reverts if the script is malformed
+    @param _governor Governor
+    @param _script Script to check
+    @return True: script can be executed by the governor, False: not allowed
+    """
+    if not self.governors[_governor]:
+        return False
+
+    i: uint256 = 0
+    for x in range(32):
+        if i == len(_script):
+            break
+        assert i + 32 <= len(_script)
+
+        target: uint256 = extract32(_script, i, output_type=uint256) # calldata size (64) | address (160) | identifier (32)
+        size: uint256 = shift(target, -192)
+        target &= TARGET_MASK
+        i += 28 # calldata size (8 bytes) + address (20 bytes)
+        assert size >= 4 and size <= 2048
+        i += size
+        assert i <= len(_script)
+
+        if not self._has_access(target, _governor):
+            return False
+
+    assert i == len(_script)
+    return True
+
 @external
 @pure
 def script(_to: address, _data: Bytes[2048]) -> Bytes[2080]:
@@ -282,6 +306,19 @@ def accept_management():
     self.management = msg.sender
     log SetManagement(msg.sender)
 
+@internal
+@view
+def _has_access(_target: uint256, _governor: address) -> bool:
+    """
+    @notice Check access control of a governor for a packed contract+identifier
+    """
+    access: Access = self.access[_target]
+    if access == Access.BLACKLIST:
+        return not self.blacklisted[_target][_governor]
+    if access == Access.WHITELIST:
+        return self.whitelisted[_target][_governor]
+    return True
+
 @internal
 @pure
 def _pack_target(_contract: address, _identifier: bytes4) -> uint256:
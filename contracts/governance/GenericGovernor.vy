@@ -37,6 +37,7 @@ management: public(address)
 pending_management: public(address)
 
 measure: public(address)
+router: public(address)
 executor: public(address)
 packed_quorum: uint256 # current (120) | previous (120) | epoch (16)
 packed_majority: uint256 # current (120) | previous (120) | epoch (16)
@@ -74,6 +75,9 @@ event Enact:
 event SetMeasure:
     measure: indexed(address)
 
+event SetRouter:
+    router: indexed(address)
+
 event SetExecutor:
     executor: indexed(address)
 
@@ -405,7 +409,7 @@ def vote_yea(_idx: uint256):
     @notice Vote in favor of a proposal
     @param _idx Proposal index
     """
-    self._vote(_idx, VOTE_SCALE, 0, 0)
+    self._vote(msg.sender, _idx, VOTE_SCALE, 0, 0, self._vote_weight(msg.sender))
 
 @external
 def vote_nay(_idx: uint256):
@@ -413,7 +417,7 @@ def vote_nay(_idx: uint256):
     @notice Vote in opposition of a proposal
     @param _idx Proposal index
     """
-    self._vote(_idx, 0, VOTE_SCALE, 0)
+    self._vote(msg.sender, _idx, 0, VOTE_SCALE, 0, self._vote_weight(msg.sender))
 
 @external
 def vote_abstain(_idx: uint256):
@@ -421,7 +425,7 @@ def vote_abstain(_idx: uint256):
     @notice Vote in abstention of a proposal
     @param _idx Proposal index
     """
-    self._vote(_idx, 0, 0, VOTE_SCALE)
+    self._vote(msg.sender, _idx, 0, 0, VOTE_SCALE, self._vote_weight(msg.sender))
 
 @external
 def vote(_idx: uint256, _yea: uint256, _nay: uint256, _abstain: uint256):
@@ -432,35 +436,82 @@ def vote(_idx: uint256, _yea: uint256, _nay: uint256, _abstain: uint256):
     @param _nay Fraction of votes in opposition
     @param _abstain Fraction of abstained votes
     """
-    self._vote(_idx, _yea, _nay, _abstain)
+    self._vote(msg.sender, _idx, _yea, _nay, _abstain, self._vote_weight(msg.sender))
+
+@external
+def vote_many(_idx: DynArray[uint256, 32], _yea: DynArray[uint256, 32], _nay: DynArray[uint256, 32], _abstain: DynArray[uint256, 32]):
+    """
+    @notice Weighted vote on multiple proposals at once
+    @param _idx Proposal indices
+    @param _yea Fractions of votes in favor, one per proposal
+    @param _nay Fractions of votes in opposition, one per proposal
+    @param _abstain Fractions of abstained votes, one per proposal
+    """
+    self._vote_many(msg.sender, _idx, _yea, _nay, _abstain)
+
+@external
+def vote_many_for(_account: address, _idx: DynArray[uint256, 32], _yea: DynArray[uint256, 32], _nay: DynArray[uint256, 32], _abstain: DynArray[uint256, 32]):
+    """
+    @notice Weighted vote on multiple proposals on behalf of an account. Only callable by the vote router
+    @param _account Account to vote for
+    @param _idx Proposal indices
+    @param _yea Fractions of votes in favor, one per proposal
+    @param _nay Fractions of votes in opposition, one per proposal
+    @param _abstain Fractions of abstained votes, one per proposal
+    """
+    assert msg.sender == self.router
+    self._vote_many(_account, _idx, _yea, _nay, _abstain)
 
 @internal
-def _vote(_idx: uint256, _yea: uint256, _nay: uint256, _abstain: uint256):
+def _vote_many(_account: address, _idx: DynArray[uint256, 32], _yea: DynArray[uint256, 32], _nay: DynArray[uint256, 32], _abstain: DynArray[uint256, 32]):
     """
-    @notice Weighted vote on a proposal
+    @notice Weighted vote on multiple proposals, assumes caller is authorized
+    """
+    n: uint256 = len(_idx)
+    assert n > 0 and len(_yea) == n and len(_nay) == n and len(_abstain) == n
+
+    # vote weight is queried once and applied to all proposals
+    weight: uint256 = self._vote_weight(_account)
+    for i in range(32):
+        if i == n:
+            break
+        self._vote(_account, _idx[i], _yea[i], _nay[i], _abstain[i], weight)
+
+@internal
+@view
+def _vote_weight(_account: address) -> uint256:
+    """
+    @notice Get the vote weight of an account
     """
     assert self._vote_open()
+    weight: uint256 = Measure(self.measure).vote_weight(_account)
+    assert weight > 0
+    return weight
+
+@internal
+def _vote(_account: address, _idx: uint256, _yea: uint256, _nay: uint256, _abstain: uint256, _weight: uint256):
+    """
+    @notice Weighted vote on a proposal
+    """
     assert self.proposals[_idx].epoch == self._epoch()
     assert self.proposals[_idx].state == STATE_PROPOSED
-    assert not self.voted[msg.sender][_idx]
+    assert not self.voted[_account][_idx]
     assert _yea + _nay + _abstain == VOTE_SCALE
 
-    weight: uint256 = Measure(self.measure).vote_weight(msg.sender)
-    assert weight > 0
-    self.voted[msg.sender][_idx] = True
+    self.voted[_account][_idx] = True
     yea: uint256 = 0
     if _yea > 0:
-        yea = weight * _yea / VOTE_SCALE
+        yea = _weight * _yea / VOTE_SCALE
         self.proposals[_idx].yea += yea
     nay: uint256 = 0
     if _nay > 0:
-        nay = weight * _nay / VOTE_SCALE
+        nay = _weight * _nay / VOTE_SCALE
         self.proposals[_idx].nay += nay
     abstain: uint256 = 0
     if _abstain > 0:
-        abstain = weight * _abstain / VOTE_SCALE
+        abstain = _weight * _abstain / VOTE_SCALE
         self.proposals[_idx].abstain += abstain
-    log Vote(msg.sender, _idx, yea, nay, abstain)
+    log Vote(_account, _idx, yea, nay, abstain)
 
 @external
 def enact(_idx: uint256, _script: Bytes[2048]):
@@ -489,6 +540,17 @@ def set_measure(_measure: address):
     self.measure = _measure
     log SetMeasure(_measure)
 
+@external
+def set_router(_router: address):
+    """
+    @notice Set vote router, allowed to vote on behalf of accounts. Cannot be changed during the vote
+    @param _router New vote router
+    """
+    assert msg.sender == self.management
+    assert not self._vote_open()
+    self.router = _router
+    log SetRouter(_router)
+
 @external
 def set_executor(_executor: address):
     """
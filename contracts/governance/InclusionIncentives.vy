@@ -32,6 +32,9 @@ incentives: public(HashMap[uint256, HashMap[address, HashMap[address, uint256]]]
 incentives_depositor: public(HashMap[address, HashMap[uint256, HashMap[address, HashMap[address, uint256]]]]) # depositor => epoch => candidate => incentive token => incentive amount
 unclaimed: public(HashMap[uint256, HashMap[address, uint256]]) # epoch => incentive token => incentive amount
 user_claimed: public(HashMap[address, HashMap[uint256, HashMap[address, bool]]]) # account => epoch => incentive token => claimed?
+num_tokens: public(HashMap[uint256, uint256]) # epoch => number of incentive tokens
+tokens: public(HashMap[uint256, HashMap[uint256, address]]) # epoch => idx => incentive token
+token_registered: public(HashMap[uint256, HashMap[address, bool]]) # epoch => incentive token => registered?
 deposit_deadline: public(uint256)
 claim_deadline: public(uint256)
 
@@ -129,6 +132,11 @@ def deposit(_candidate: address, _token: address, _amount: uint256):
     self.incentives[epoch][_candidate][_token] += _amount - fee
     self.incentives_depositor[msg.sender][epoch][_candidate][_token] += _amount
     self.unclaimed[epoch][_token] += _amount
+    if not self.token_registered[epoch][_token]:
+        self.token_registered[epoch][_token] = True
+        n: uint256 = self.num_tokens[epoch]
+        self.tokens[epoch][n] = _token
+        self.num_tokens[epoch] = n + 1
 
     assert ERC20(_token).transferFrom(msg.sender, self, _amount, default_return_value=True)
     log Deposit(epoch, _candidate, _token, _amount, msg.sender)
@@ -152,19 +160,65 @@ def claimable(_epoch: uint256, _token: address, _account: address) -> uint256:
     votes: uint256 = voting.votes_user(_account, _epoch)
     return self.incentives[_epoch][winner][_token] * votes / total_votes
 
+@external
+@view
+def claimable_all(_account: address, _epoch: uint256, _offset: uint256 = 0) -> (DynArray[address, 64], DynArray[uint256, 64]):
+    """
+    @notice Query the amount of incentives that can be claimed by a specific account, for all tokens in an epoch
+    @param _account Claimer to query for
+    @param _epoch Epoch to query for
+    @param _offset Index of first token to query, to paginate through epochs with more than 64 tokens
+    @return Tuple of list of incentive tokens and list of claimable amounts
+    """
+    tokens: DynArray[address, 64] = []
+    amounts: DynArray[uint256, 64] = []
+    n: uint256 = self.num_tokens[_epoch]
+    if _offset >= n:
+        return tokens, amounts
+    n = min(n - _offset, 64)
+
+    votes: uint256 = 0
+    total_votes: uint256 = 0
+    winner: address = empty(address)
+    if voting.latest_finalized_epoch() >= _epoch:
+        total_votes = voting.total_votes(_epoch)
+        if total_votes > 0:
+            votes = voting.votes_user(_account, _epoch)
+            winner = voting.winners(_epoch)
+
+    for i in range(64):
+        if i == n:
+            break
+        token: address = self.tokens[_epoch][_offset + i]
+        tokens.append(token)
+        if votes == 0 or self.user_claimed[_account][_epoch][token]:
+            amounts.append(0)
+        else:
+            amounts.append(self.incentives[_epoch][winner][token] * votes / total_votes)
+    return tokens, amounts
+
 @external
 def claim_many(_epochs: DynArray[uint256, 16], _tokens: DynArray[address, 16], _account: address = msg.sender):
     """
-    @notice Claim one or multiple incentives at once
+    @notice 
+        Claim one or multiple incentives at once. Vote results are read once for every
+        run of consecutive entries with the same epoch, so entries should be grouped by epoch
     @param _epochs List of epochs to claim for
     @param _tokens List of tokens to claim for, corresponding to the list of epochs
     @param _account Account to claim for
     """
     assert len(_epochs) == len(_tokens)
+    epoch: uint256 = 0
+    winner: address = empty(address)
+    total_votes: uint256 = 0
+    votes: uint256 = 0
     for i in range(16):
         if i == len(_epochs):
             break
-        self._claim(_epochs[i], _tokens[i], _account)
+        if i == 0 or _epochs[i] != epoch:
+            epoch = _epochs[i]
+            winner, total_votes, votes = self._vote_result(epoch, _account)
+        self._claim(epoch, _tokens[i], _account, winner, total_votes, votes)
 
 @external
 def claim(_epoch: uint256, _token: address, _account: address = msg.sender):
@@ -177,20 +231,32 @@ def claim(_epoch: uint256, _token: address, _account: address = msg.sender):
     @param _token Tokens to claim for
     @param _account Account to claim for
     """
-    self._claim(_epoch, _token, _account)
+    winner: address = empty(address)
+    total_votes: uint256 = 0
+    votes: uint256 = 0
+    winner, total_votes, votes = self._vote_result(_epoch, _account)
+    self._claim(_epoch, _token, _account, winner, total_votes, votes)
 
 @internal
-def _claim(_epoch: uint256, _token: address, _account: address):
+@view
+def _vote_result(_epoch: uint256, _account: address) -> (address, uint256, uint256):
     """
-    @notice Claim an incentive
+    @notice Get the winner, total votes and account votes of a finalized epoch
     """
     assert voting.latest_finalized_epoch() >= _epoch
-    winner: address = voting.winners(_epoch)
     total_votes: uint256 = voting.total_votes(_epoch)
     if total_votes == 0:
+        return empty(address), 0, 0
+    return voting.winners(_epoch), total_votes, voting.votes_user(_account, _epoch)
+
+@internal
+def _claim(_epoch: uint256, _token: address, _account: address, _winner: address, _total_votes: uint256, _votes: uint256):
+    """
+    @notice Claim an incentive, given the vote result of the epoch
+    """
+    if _total_votes == 0:
         return
-    votes: uint256 = voting.votes_user(_account, _epoch)
-    amount: uint256 = self.incentives[_epoch][winner][_token] * votes / total_votes
+    amount: uint256 = self.incentives[_epoch][_winner][_token] * _votes / _total_votes
     if self.user_claimed[_account][_epoch][_token] or amount == 0:
         return
     self.user_claimed[_account][_epoch][_token] = True
@@ -30,6 +30,7 @@ pending_management: public(address)
 operator: public(address)
 treasury: public(address)
 measure: public(address)
+router: public(address)
 enable_epoch: public(uint256)
 finalized_epoch: uint256
 num_candidates: public(HashMap[uint256, uint256]) # epoch => number of candidates
@@ -91,6 +92,9 @@ event SetFees:
 event SetMeasure:
     measure: indexed(address)
 
+event SetRouter:
+    router: indexed(address)
+
 event PendingManagement:
     management: indexed(address)
 
@@ -290,17 +294,34 @@ def vote(_votes: DynArray[uint256, 33]):
         Votes are in basispoints and must add to 100%
     @param _votes List of votes in bps
     """
+    self._vote(msg.sender, _votes)
+
+@external
+def vote_for(_account: address, _votes: DynArray[uint256, 33]):
+    """
+    @notice Vote on behalf of an account. Only callable by the vote router
+    @param _account Account to vote for
+    @param _votes List of votes in bps
+    """
+    assert msg.sender == self.router
+    self._vote(_account, _votes)
+
+@internal
+def _vote(_account: address, _votes: DynArray[uint256, 33]):
+    """
+    @notice Vote on behalf of an account, assumes caller is authorized
+    """
     epoch: uint256 = self._epoch()
     assert self._vote_open()
-    assert self.votes_user[msg.sender][epoch] == 0
+    assert self.votes_user[_account][epoch] == 0
 
     n: uint256 = self.num_candidates[epoch] + 1
     assert len(_votes) <= n
 
-    weight: uint256 = Measure(self.measure).vote_weight(msg.sender)
+    weight: uint256 = Measure(self.measure).vote_weight(_account)
     assert weight > 0
     self.total_votes[epoch] += weight
-    self.votes_user[msg.sender][epoch] = weight
+    self.votes_user[_account][epoch] = weight
 
     total: uint256 = 0
     for i in range(33):
@@ -315,7 +336,7 @@ def vote(_votes: DynArray[uint256, 33]):
         total += _votes[i]
 
     assert total == VOTE_SCALE
-    log Vote(epoch, msg.sender, weight, _votes)
+    log Vote(epoch, _account, weight, _votes)
 
 @external
 @view
@@ -471,6 +492,17 @@ def set_application_fees(_initial: uint256, _subsequent: uint256):
     self.subsequent_fee = _subsequent
     log SetFees(_initial, _subsequent)
 
+@external
+def set_router(_router: address):
+    """
+    @notice Set vote router, allowed to vote on behalf of accounts. Cannot be changed during the vote
+    @param _router New vote router
+    """
+    assert msg.sender == self.management
+    assert not self._vote_open()
+    self.router = _router
+    log SetRouter(_router)
+
 @external
 def set_management(_management: address):
     """
@@ -0,0 +1,190 @@
+# @version 0.3.10
+"""
+@title Vote router
+@author 0xkorin, Yearn Finance
+@license GNU AGPLv3
+@notice
+    Casts all votes of an account for the epoch in a single transaction:
+    the weight vote, the inclusion vote and any number of generic governor proposals.
+    The router doubles as the vote weight measure of the voting contracts. It wraps
+    the actual measure and caches the weight of the voter in transient storage for
+    the duration of the vote, so the underlying measure is only queried once.
+    Outside of a routed vote, weights are forwarded to the underlying measure.
+"""
+
+interface Measure:
+    def vote_weight(_account: address) -> uint256: view
+
+interface PoolVote:
+    def vote_open() -> bool: view
+    def vote_for(_account: address, _votes: DynArray[uint256, 33]): nonpayable
+
+interface Governor:
+    def vote_open() -> bool: view
+    def vote_many_for(_account: address, _idx: DynArray[uint256, 32], _yea: DynArray[uint256, 32], _nay: DynArray[uint256, 32], _abstain: DynArray[uint256, 32]): nonpayable
+
+management: public(address)
+pending_management: public(address)
+
+measure: public(address)
+weight_vote: public(address)
+inclusion_vote: public(address)
+governor: public(address)
+
+cached_account: transient(address)
+cached_weight: transient(uint256)
+
+event SetMeasure:
+    measure: indexed(address)
+
+event SetWeightVote:
+    weight_vote: indexed(address)
+
+event SetInclusionVote:
+    inclusion_vote: indexed(address)
+
+event SetGovernor:
+    governor: indexed(address)
+
+event PendingManagement:
+    management: indexed(address)
+
+event SetManagement:
+    management: indexed(address)
+
+@external
+def __init__(_measure: address):
+    """
+    @notice Constructor
+    @param _measure Underlying vote weight measure
+    """
+    assert _measure != empty(address)
+    self.management = msg.sender
+    self.measure = _measure
+
+@external
+@view
+def vote_weight(_account: address) -> uint256:
+    """
+    @notice
+        Get the vote weight of an account. Reads from the cache
+        during a routed vote, otherwise from the underlying measure
+    @param _account Account to query the vote weight for
+    @return Vote weight
+    """
+    if _account == self.cached_account:
+        return self.cached_weight
+    return Measure(self.measure).vote_weight(_account)
+
+@external
+def vote(
+    _weight_votes: DynArray[uint256, 33],
+    _inclusion_votes: DynArray[uint256, 33],
+    _idx: DynArray[uint256, 32],
+    _yea: DynArray[uint256, 32],
+    _nay: DynArray[uint256, 32],
+    _abstain: DynArray[uint256, 32]
+):
+    """
+    @notice
+        Cast multiple votes at once. Empty lists are skipped.
+        Each vote is subject to the same rules as a direct vote on the voting contract
+    @param _weight_votes List of weight votes in bps, see `WeightVote.vote`
+    @param _inclusion_votes List of inclusion votes in bps, see `InclusionVote.vote`
+    @param _idx Generic governor proposal indices
+    @param _yea Fractions of votes in favor, one per proposal
+    @param _nay Fractions of votes in opposition, one per proposal
+    @param _abstain Fractions of abstained votes, one per proposal
+    """
+    weight: uint256 = Measure(self.measure).vote_weight(msg.sender)
+    assert weight > 0
+    self.cached_account = msg.sender
+    self.cached_weight = weight
+
+    if len(_weight_votes) > 0:
+        PoolVote(self.weight_vote).vote_for(msg.sender, _weight_votes)
+    if len(_inclusion_votes) > 0:
+        PoolVote(self.inclusion_vote).vote_for(msg.sender, _inclusion_votes)
+    if len(_idx) > 0:
+        Governor(self.governor).vote_many_for(msg.sender, _idx, _yea, _nay, _abstain)
+
+    self.cached_account = empty(address)
+    self.cached_weight = 0
+
+@external
+def set_measure(_measure: address):
+    """
+    @notice Set underlying vote weight measure contract. Cannot be changed while a routed vote is open
+    @param _measure New vote weight measure
+    """
+    assert msg.sender == self.management
+    assert _measure != empty(address)
+    assert not self._vote_open()
+    self.measure = _measure
+    log SetMeasure(_measure)
+
+@external
+def set_weight_vote(_weight_vote: address):
+    """
+    @notice Set weight vote contract
+    @param _weight_vote New weight vote contract
+    """
+    assert msg.sender == self.management
+    self.weight_vote = _weight_vote
+    log SetWeightVote(_weight_vote)
+
+@external
+def set_inclusion_vote(_inclusion_vote: address):
+    """
+    @notice Set inclusion vote contract
+    @param _inclusion_vote New inclusion vote contract
+    """
+    assert msg.sender == self.management
+    self.inclusion_vote = _inclusion_vote
+    log SetInclusionVote(_inclusion_vote)
+
+@external
+def set_governor(_governor: address):
+    """
+    @notice Set generic governor contract
+    @param _governor New generic governor contract
+    """
+    assert msg.sender == self.management
+    self.governor = _governor
+    log SetGovernor(_governor)
+
+@external
+def set_management(_management: address):
+    """
+    @notice
+        Set the pending management address.
+        Needs to be accepted by that account separately to transfer management over
+    @param _management New pending management address
+    """
+    assert msg.sender == self.management
+    self.pending_management = _management
+    log PendingManagement(_management)
+
+@external
+def accept_management():
+    """
+    @notice
+        Accept management role.
+        Can only be called by account previously marked as pending management by current management
+    """
+    assert msg.sender == self.pending_management
+    self.pending_management = empty(address)
+    self.management = msg.sender
+    log SetManagement(msg.sender)
+
+@internal
+@view
+def _vote_open() -> bool:
+    """
+    @notice Query whether any of the routed votes is currently open
+    """
+    if self.weight_vote != empty(address) and PoolVote(self.weight_vote).vote_open():
+        return True
+    if self.inclusion_vote != empty(address) and PoolVote(self.inclusion_vote).vote_open():
+        return True
+    return self.governor != empty(address) and Governor(self.governor).vote_open()
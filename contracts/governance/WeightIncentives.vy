@@ -19,6 +19,7 @@ interface Voting:
     def genesis() -> uint256: view
     def votes(_epoch: uint256, _idx: uint256) -> uint256: view
     def votes_user(_account: address, _epoch: uint256, _idx: uint256) -> uint256: view
+    def user_votes(_account: address, _epoch: uint256) -> uint256[33]: view
 
 genesis: public(immutable(uint256))
 pool: public(immutable(Pool))
@@ -30,6 +31,9 @@ fee_rate: public(uint256)
 incentives: public(HashMap[uint256, HashMap[uint256, HashMap[address, uint256]]]) # epoch => idx => incentive token => incentive amount
 unclaimed: public(HashMap[uint256, HashMap[address, uint256]]) # epoch => incentive token => incentive amount
 user_claimed: public(HashMap[address, HashMap[uint256, HashMap[uint256, HashMap[address, bool]]]]) # account => epoch => idx => incentive token => claimed?
+num_tokens: public(HashMap[uint256, uint256]) # epoch => number of incentive tokens
+tokens: public(HashMap[uint256, HashMap[uint256, address]]) # epoch => idx => incentive token
+token_registered: public(HashMap[uint256, HashMap[address, bool]]) # epoch => incentive token => registered?
 deposit_deadline: public(uint256)
 claim_deadline: public(uint256)
 
@@ -116,6 +120,11 @@ def deposit(_idx: uint256, _token: address, _amount: uint256):
     fee: uint256 = _amount * self.fee_rate / FEE_SCALE
     self.incentives[epoch][_idx][_token] += _amount - fee
     self.unclaimed[epoch][_token] += _amount
+    if not self.token_registered[epoch][_token]:
+        self.token_registered[epoch][_token] = True
+        n: uint256 = self.num_tokens[epoch]
+        self.tokens[epoch][n] = _token
+        self.num_tokens[epoch] = n + 1
 
     assert ERC20(_token).transferFrom(msg.sender, self, _amount, default_return_value=True)
     log Deposit(epoch, _idx, _token, _amount, msg.sender)
@@ -139,6 +148,43 @@ def claimable(_epoch: uint256, _idx: uint256, _token: address, _account: address
     votes: uint256 = voting.votes_user(_account, _epoch, _idx)
     return self.incentives[_epoch][_idx][_token] * votes / total_votes
 
+@external
+@view
+def claimable_all(_account: address, _epoch: uint256, _offset: uint256 = 0) -> (DynArray[address, 64], DynArray[uint256, 64]):
+    """
+    @notice Query the amount of incentives that can be claimed by a specific account, for all tokens in an epoch
+    @param _account Claimer to query for
+    @param _epoch Epoch to query for
+    @param _offset Index of first token to query, to paginate through epochs with more than 64 tokens
+    @return Tuple of list of incentive tokens and list of claimable amounts, summed over all assets
+    """
+    tokens: DynArray[address, 64] = []
+    amounts: DynArray[uint256, 64] = []
+    n: uint256 = self.num_tokens[_epoch]
+    if _offset >= n:
+        return tokens, amounts
+    n = min(n - _offset, 64)
+    for i in range(64):
+        if i == n:
+            break
+        tokens.append(self.tokens[_epoch][_offset + i])
+        amounts.append(0)
+    if self._epoch() <= _epoch:
+        return tokens, amounts
+
+    votes: uint256[33] = voting.user_votes(_account, _epoch)
+    for idx in range(33):
+        if votes[idx] == 0:
+            continue
+        total_votes: uint256 = voting.votes(_epoch, idx)
+        for i in range(64):
+            if i == n:
+                break
+            if self.user_claimed[_account][_epoch][idx][tokens[i]]:
+                continue
+            amounts[i] += self.incentives[_epoch][idx][tokens[i]] * votes[idx] / total_votes
+    return tokens, amounts
+
 @external
 def claim_many(_epochs: DynArray[uint256, 16], _idx: DynArray[uint256, 16], _tokens: DynArray[address, 16], _account: address = msg.sender):
     """
@@ -155,6 +201,42 @@ def claim_many(_epochs: DynArray[uint256, 16], _idx: DynArray[uint256, 16], _tok
             break
         self._claim(_epochs[i], _idx[i], _tokens[i], _account)
 
+@external
+def claim_all(_epoch: uint256, _tokens: DynArray[address, 32], _account: address = msg.sender):
+    """
+    @notice
+        Claim incentives in multiple tokens on all assets the account voted for in an epoch.
+        The vote allocation of the account is read once and each token is transferred once
+    @param _epoch Epoch to claim for
+    @param _tokens List of incentive tokens to claim
+    @param _account Account to claim for
+    """
+    assert self._epoch() > _epoch
+    votes: uint256[33] = voting.user_votes(_account, _epoch)
+    amounts: uint256[32] = empty(uint256[32])
+
+    for idx in range(33):
+        if votes[idx] == 0:
+            continue
+        total_votes: uint256 = voting.votes(_epoch, idx)
+        for i in range(32):
+            if i == len(_tokens):
+                break
+            token: address = _tokens[i]
+            amount: uint256 = self.incentives[_epoch][idx][token] * votes[idx] / total_votes
+            if self.user_claimed[_account][_epoch][idx][token] or amount == 0:
+                continue
+            self.user_claimed[_account][_epoch][idx][token] = True
+            self.unclaimed[_epoch][token] -= amount
+            amounts[i] += amount
+            log Claim(_epoch, idx, token, amount, _account)
+
+    for i in range(32):
+        if i == len(_tokens):
+            break
+        if amounts[i] > 0:
+            assert ERC20(_tokens[i]).transfer(_account, amounts[i], default_return_value=True)
+
 @external
 def claim(_epoch: uint256, _idx: uint256, _token: address, _account: address = msg.sender):
     """
@@ -24,10 +24,10 @@ management: public(address)
 pending_management: public(address)
 
 measure: public(address)
+router: public(address)
 total_votes: public(HashMap[uint256, uint256]) # epoch => total votes
 votes: public(HashMap[uint256, uint256[33]]) # epoch => [blank vote, ..protocol votes..]
-votes_user: public(HashMap[address, HashMap[uint256, uint256[33]]]) # user => epoch => [blank vote, ..protocol votes..]
-voted: public(HashMap[address, HashMap[uint256, bool]]) # user => epoch => voted?
+packed_votes_user: HashMap[address, HashMap[uint256, uint256[3]]] # user => epoch => [bps 0..17, bps 18..32, weight]
 
 event Vote:
     epoch: indexed(uint256)
@@ -38,6 +38,9 @@ event Vote:
 event SetMeasure:
     measure: indexed(address)
 
+event SetRouter:
+    router: indexed(address)
+
 event PendingManagement:
     management: indexed(address)
 
@@ -49,6 +52,9 @@ EPOCH_LENGTH: constant(uint256) = 4 * WEEK
 VOTE_LENGTH: constant(uint256) = WEEK
 VOTE_START: constant(uint256) = EPOCH_LENGTH - VOTE_LENGTH
 VOTE_SCALE: constant(uint256) = 10_000
+VOTE_BITS: constant(uint256) = 14
+VOTE_MASK: constant(uint256) = 2**VOTE_BITS - 1
+VOTES_PER_SLOT: constant(uint256) = 18
 
 @external
 def __init__(_genesis: uint256, _pool: address, _measure: address):
@@ -101,6 +107,53 @@ def _vote_open() -> bool:
     """
     return (block.timestamp - genesis) % EPOCH_LENGTH >= VOTE_START
 
+@external
+@view
+def votes_user(_account: address, _epoch: uint256, _idx: uint256) -> uint256:
+    """
+    @notice Get the votes of a user on a specific option in an epoch
+    @param _account User address
+    @param _epoch Epoch number
+    @param _idx Option index. 0 for the blank vote, asset index plus one for the pool assets
+    @return Amount of votes
+    """
+    if _idx >= 33:
+        return 0
+    packed: uint256 = self.packed_votes_user[_account][_epoch][_idx / VOTES_PER_SLOT]
+    offset: uint256 = _idx % VOTES_PER_SLOT * VOTE_BITS
+    bps: uint256 = (packed >> offset) & VOTE_MASK
+    return bps * self.packed_votes_user[_account][_epoch][2] / VOTE_SCALE
+
+@external
+@view
+def user_votes(_account: address, _epoch: uint256) -> uint256[33]:
+    """
+    @notice Get the votes of a user on all options in an epoch
+    @param _account User address
+    @param _epoch Epoch number
+    @return Amount of votes for each option. Blank vote first, followed by the pool assets
+    """
+    votes: uint256[33] = empty(uint256[33])
+    weight: uint256 = self.packed_votes_user[_account][_epoch][2]
+    if weight == 0:
+        return votes
+    packed: uint256[2] = [self.packed_votes_user[_account][_epoch][0], self.packed_votes_user[_account][_epoch][1]]
+    for i in range(33):
+        bps: uint256 = (packed[i / VOTES_PER_SLOT] >> (i % VOTES_PER_SLOT * VOTE_BITS)) & VOTE_MASK
+        votes[i] = bps * weight / VOTE_SCALE
+    return votes
+
+@external
+@view
+def voted(_account: address, _epoch: uint256) -> bool:
+    """
+    @notice Query whether a user has voted in an epoch
+    @param _account User address
+    @param _epoch Epoch number
+    @return True: user has voted, False: user has not voted
+    """
+    return self.packed_votes_user[_account][_epoch][2] > 0
+
 @external
 def vote(_votes: DynArray[uint256, 33]):
     """
@@ -110,33 +163,56 @@ def vote(_votes: DynArray[uint256, 33]):
         Votes are in basispoints and must add to 100%
     @param _votes List of votes in bps
     """
+    self._vote(msg.sender, _votes)
+
+@external
+def vote_for(_account: address, _votes: DynArray[uint256, 33]):
+    """
+    @notice Vote on behalf of an account. Only callable by the vote router
+    @param _account Account to vote for
+    @param _votes List of votes in bps
+    """
+    assert msg.sender == self.router
+    self._vote(_account, _votes)
+
+@internal
+def _vote(_account: address, _votes: DynArray[uint256, 33]):
+    """
+    @notice Vote on behalf of an account, assumes caller is authorized
+    """
     epoch: uint256 = self._epoch()
     assert self._vote_open()
-    assert not self.voted[msg.sender][epoch]
+    assert self.packed_votes_user[_account][epoch][2] == 0
 
     n: uint256 = Pool(pool).num_assets()
     assert n > 0
     assert len(_votes) <= n + 1
 
-    weight: uint256 = Measure(self.measure).vote_weight(msg.sender)
+    weight: uint256 = Measure(self.measure).vote_weight(_account)
     assert weight > 0
     self.total_votes[epoch] += weight
-    self.voted[msg.sender][epoch] = True
 
+    # user votes are stored as 14 bit bps values, packed 18 per slot,
+    # and converted into votes on read
     total: uint256 = 0
+    packed: uint256[2] = empty(uint256[2])
     for i in range(33):
         if i == len(_votes):
             break
         if _votes[i] == 0:
             continue
+        assert _votes[i] <= VOTE_SCALE
 
-        votes: uint256 = _votes[i] * weight / VOTE_SCALE
-        self.votes[epoch][i] += votes
-        self.votes_user[msg.sender][epoch][i] = votes
+        self.votes[epoch][i] += _votes[i] * weight / VOTE_SCALE
+        packed[i / VOTES_PER_SLOT] |= _votes[i] << (i % VOTES_PER_SLOT * VOTE_BITS)
         total += _votes[i]
 
     assert total == VOTE_SCALE
-    log Vote(epoch, msg.sender, weight, _votes)
+    self.packed_votes_user[_account][epoch][0] = packed[0]
+    if packed[1] > 0:
+        self.packed_votes_user[_account][epoch][1] = packed[1]
+    self.packed_votes_user[_account][epoch][2] = weight
+    log Vote(epoch, _account, weight, _votes)
 
 @external
 def set_measure(_measure: address):
@@ -150,6 +226,17 @@ def set_measure(_measure: address):
     self.measure = _measure
     log SetMeasure(_measure)
 
+@external
+def set_router(_router: address):
+    """
+    @notice Set vote router, allowed to vote on behalf of accounts. Cannot be changed during the vote
+    @param _router New vote router
+    """
+    assert msg.sender == self.management
+    assert not self._vote_open()
+    self.router = _router
+    log SetRouter(_router)
+
 @external
 def set_management(_management: address):
     """
@@ -1,12 +1,23 @@
 # @version 0.3.10
 
+from vyper.interfaces import ERC20
+
 interface Pool:
     def num_assets() -> uint256: view
     def killed() -> bool: view
 implements: Pool
 
+interface Token:
+    def mint(_account: address, _value: uint256): nonpayable
+
 num_assets: public(uint256)
 killed: public(bool)
+weight: public(HashMap[uint256, uint256])
+amplification: public(uint256)
+ramp_weights: public(DynArray[uint256, 32])
+ramp_duration: public(uint256)
+token: public(address)
+assets: public(HashMap[uint256, address])
 
 @external
 def set_num_assets(_num_assets: uint256):
@@ -15,3 +26,50 @@ def set_num_assets(_num_assets: uint256):
 @external
 def set_killed(_killed: bool):
     self.killed = _killed
+
+@external
+def set_weights(_weights: DynArray[uint256, 32]):
+    self.num_assets = len(_weights)
+    for i in range(32):
+        if i == len(_weights):
+            break
+        self.weight[i] = _weights[i]
+
+@external
+def set_ramp(_amplification: uint256, _weights: DynArray[uint256, 32], _duration: uint256):
+    self.amplification = _amplification
+    self.ramp_weights = _weights
+    self.ramp_duration = _duration
+
+@external
+def add_asset(
+    _asset: address, _rate_provider: address, _weight: uint256, _lower: uint256, _upper: uint256,
+    _amount: uint256, _amplification: uint256, _min_lp_amount: uint256, _receiver: address
+):
+    self.assets[self.num_assets] = _asset
+    self.weight[self.num_assets] = _weight
+    self.num_assets += 1
+
+@external
+def set_assets(_token: address, _assets: DynArray[address, 32]):
+    self.token = _token
+    self.num_assets = len(_assets)
+    for i in range(32):
+        if i == len(_assets):
+            break
+        self.assets[i] = _assets[i]
+
+@external
+def add_liquidity(_amounts: DynArray[uint256, 32], _min_lp_amount: uint256, _receiver: address) -> uint256:
+    # mint 1:1
+    lp_amount: uint256 = 0
+    for i in range(32):
+        if i == len(_amounts):
+            break
+        if _amounts[i] == 0:
+            continue
+        assert ERC20(self.assets[i]).transferFrom(msg.sender, self, _amounts[i], default_return_value=True)
+        lp_amount += _amounts[i]
+    assert lp_amount >= _min_lp_amount
+    Token(self.token).mint(_receiver, lp_amount)
+    return lp_amount
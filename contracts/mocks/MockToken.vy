@@ -10,6 +10,10 @@ allowance: public(HashMap[address, HashMap[address, uint256]])
 name: public(constant(String[9])) = "MockToken"
 symbol: public(constant(String[4])) = "MOCK"
 decimals: public(constant(uint8)) = 18
+nonces: public(HashMap[address, uint256])
+
+EIP712_TYPEHASH: constant(bytes32) = keccak256("EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+PERMIT_TYPEHASH: constant(bytes32) = keccak256("Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)")
 
 event Transfer:
     sender: indexed(address)
@@ -48,6 +52,27 @@ def approve(_spender: address, _value: uint256) -> bool:
     log Approval(msg.sender, _spender, _value)
     return True
 
+@external
+def permit(_owner: address, _spender: address, _value: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32) -> bool:
+    assert _owner != empty(address)
+    assert _deadline >= block.timestamp
+    nonce: uint256 = self.nonces[_owner]
+    digest: bytes32 = keccak256(concat(
+        b"\x19\x01",
+        self._domain_separator(),
+        keccak256(_abi_encode(PERMIT_TYPEHASH, _owner, _spender, _value, nonce, _deadline))
+    ))
+    assert ecrecover(digest, _v, _r, _s) == _owner
+    self.nonces[_owner] = nonce + 1
+    self.allowance[_owner][_spender] = _value
+    log Approval(_owner, _spender, _value)
+    return True
+
+@external
+@view
+def DOMAIN_SEPARATOR() -> bytes32:
+    return self._domain_separator()
+
 @external
 def mint(_account: address, _value: uint256):
     self.totalSupply += _value
@@ -59,3 +84,8 @@ def burn(_account: address, _value: uint256):
     self.totalSupply -= _value
     self.balanceOf[_account] -= _value
     log Transfer(_account, empty(address), _value)
+
+@internal
+@view
+def _domain_separator() -> bytes32:
+    return keccak256(_abi_encode(EIP712_TYPEHASH, keccak256(name), keccak256("1"), chain.id, self))
@@ -0,0 +1,21 @@
+# Shared multicall helper of the script modules.
+#
+#   from _multicall import batched
+#   results = batched([(pool.weight, i) for i in range(num_assets)])
+
+from ape_ethereum import multicall
+
+BATCH_SIZE = 100 # calls per multicall
+
+def batched(calls, size=BATCH_SIZE, block_id=None):
+    """
+    Execute a list of (method, *args) in multicall batches at a block, defaults to the latest block.
+    Returns the results in order
+    """
+    results = []
+    for i in range(0, len(calls), size):
+        call = multicall.Call()
+        for method, *args in calls[i:i+size]:
+            call.add(method, *args)
+        results.extend(call(block_id=block_id))
+    return results
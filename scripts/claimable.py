@@ -0,0 +1,47 @@
+# Export the claimable weight and inclusion vote incentives of all voters to CSV.
+#
+#   ape run claimable --network ethereum:mainnet \
+#       --weight-incentives <address> --inclusion-incentives <address> \
+#       --epochs 3-5 --start-block 19000000 --output claimable.csv
+#
+# Voters are discovered from the vote events of each epoch, unless an accounts
+# file with one address per line is given. Amounts are written in the smallest
+# unit of each token, as incentive tokens can have any number of decimals.
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+from governance._incentives import claimable_matrix, voters
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--weight-incentives', default=None, help='Address of the weight incentives contract')
+@click.option('--inclusion-incentives', default=None, help='Address of the inclusion incentives contract')
+@click.option('--epochs', required=True, help='Epoch or inclusive range of epochs, e.g. 3-5')
+@click.option('--accounts', default=None, type=click.File('r'), help='File with one account per line')
+@click.option('--start-block', default=0, help='Block to start searching for votes from')
+@click.option('--output', default='-', type=click.File('w'), help='CSV file to write')
+def cli(weight_incentives, inclusion_incentives, epochs, accounts, start_block, output):
+    first, _, last = epochs.partition('-')
+    epochs = list(range(int(first), int(last or first) + 1))
+    if accounts is not None:
+        accounts = [line.strip() for line in accounts if line.strip() != '']
+
+    contracts = []
+    if weight_incentives is not None:
+        incentives = project.WeightIncentives.at(weight_incentives)
+        contracts.append(('weight', incentives, project.WeightVote.at(incentives.voting())))
+    if inclusion_incentives is not None:
+        incentives = project.InclusionIncentives.at(inclusion_incentives)
+        contracts.append(('inclusion', incentives, project.InclusionVote.at(incentives.voting())))
+    if len(contracts) == 0:
+        raise click.ClickException('no incentives contract supplied')
+
+    output.write('account,type,epoch,token,amount\n')
+    for name, incentives, voting in contracts:
+        for epoch in epochs:
+            epoch_accounts = accounts if accounts is not None else voters(voting, epoch, start_block)
+            matrix = claimable_matrix(incentives, epoch_accounts, [epoch])
+            for (account, _), claimable in matrix.items():
+                for token, amount in claimable.items():
+                    output.write(f'{account},{name},{epoch},{token},{amount}\n')
+            click.echo(f'{name} epoch {epoch}: {len(matrix)}/{len(epoch_accounts)} accounts with claimable incentives', err=True)
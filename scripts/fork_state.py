@@ -0,0 +1,149 @@
+# Record and replay the mainnet state used by the fork tests.
+#
+# `record` runs a JSON-RPC proxy in front of a real mainnet node. All requests are
+# pinned to a single block and every response (accounts, code, storage slots, blocks)
+# is captured. On exit the responses are written to a compressed state pack.
+#
+#   ape run fork_state record --upstream https://<mainnet rpc> --block 19000000
+#
+# `serve` answers the same requests from the state pack, without network access.
+# Anvil forks from it as if it was a mainnet node, so the fork tests run offline
+# and deterministically:
+#
+#   ape run fork_state serve
+#
+# In both cases point the upstream of the fork at the proxy in `ape-config.yaml`:
+#
+#   node:
+#     ethereum:
+#       mainnet:
+#         uri: http://127.0.0.1:8547
+#
+# Recording merges into an existing pack, so the suite can be recorded in parts.
+
+import click
+import gzip
+import json
+import signal
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock
+from urllib.request import Request, urlopen
+
+DEFAULT_PACK = 'tests/state/mainnet.json.gz'
+DEFAULT_PORT = 8547
+BLOCK_TAGS = ['latest', 'pending', 'safe', 'finalized']
+
+@click.group()
+def cli():
+    pass
+
+@cli.command()
+@click.option('--upstream', required=True, help='Mainnet RPC to record from')
+@click.option('--block', default=None, type=int, help='Block to pin to, defaults to the latest block')
+@click.option('--pack', default=DEFAULT_PACK, help='State pack to write')
+@click.option('--port', default=DEFAULT_PORT, help='Port to listen on')
+def record(upstream, block, pack, port):
+    pack = Path(pack)
+    state = load(pack) if pack.exists() else {'block': block, 'responses': {}}
+    if block is None:
+        block = state['block'] or int(forward(upstream, rpc('eth_blockNumber', []))['result'], 16)
+    assert state['block'] in [None, block], f'pack is pinned to block {state["block"]}'
+    state['block'] = block
+    lock = Lock()
+
+    def handle(request):
+        method, params = pin(request['method'], request.get('params', []), block)
+        if method == 'eth_blockNumber':
+            return {'result': hex(block)}
+        response = forward(upstream, rpc(method, params))
+        if 'result' in response:
+            with lock:
+                state['responses'][key(method, params)] = response['result']
+        return response
+
+    def save(*_):
+        with lock:
+            dump(pack, state)
+        click.echo(f'recorded {len(state["responses"])} responses at block {block} to {pack}')
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, save)
+    signal.signal(signal.SIGTERM, save)
+    click.echo(f'recording block {block} on port {port}')
+    serve_forever(handle, port)
+
+@cli.command()
+@click.option('--pack', default=DEFAULT_PACK, help='State pack to read')
+@click.option('--port', default=DEFAULT_PORT, help='Port to listen on')
+def serve(pack, port):
+    state = load(Path(pack))
+    block = state['block']
+    responses = state['responses']
+
+    def handle(request):
+        method, params = pin(request['method'], request.get('params', []), block)
+        if method == 'eth_blockNumber':
+            return {'result': hex(block)}
+        k = key(method, params)
+        if k not in responses:
+            click.echo(f'missing from state pack: {k}', err=True)
+            return {'error': {'code': -32000, 'message': f'missing from state pack: {k}'}}
+        return {'result': responses[k]}
+
+    click.echo(f'serving block {block} from {pack} on port {port}')
+    serve_forever(handle, port)
+
+def serve_forever(handle, port):
+    """
+    Serve single and batched JSON-RPC requests with the supplied handler
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            if isinstance(body, list):
+                response = [{'jsonrpc': '2.0', 'id': r.get('id'), **handle(r)} for r in body]
+            else:
+                response = {'jsonrpc': '2.0', 'id': body.get('id'), **handle(body)}
+            data = json.dumps(response).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer(('127.0.0.1', port), Handler).serve_forever()
+
+def pin(method, params, block):
+    """
+    Replace relative block tags with the pinned block number
+    """
+    params = [hex(block) if p in BLOCK_TAGS else p for p in params]
+    if method == 'eth_call' and len(params) == 1:
+        params.append(hex(block))
+    return method, params
+
+def key(method, params):
+    return json.dumps([method, params], sort_keys=True, separators=(',', ':')).lower()
+
+def rpc(method, params):
+    return {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params}
+
+def forward(upstream, request):
+    data = json.dumps(request).encode()
+    headers = {'Content-Type': 'application/json', 'User-Agent': 'yeth-fork-state'}
+    with urlopen(Request(upstream, data=data, headers=headers)) as response:
+        return json.loads(response.read())
+
+def load(pack):
+    with gzip.open(pack, 'rt') as f:
+        return json.load(f)
+
+def dump(pack, state):
+    pack.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(pack, 'wt') as f:
+        json.dump(state, f, sort_keys=True)
@@ -0,0 +1,33 @@
+# Build the claimable incentives of many accounts from the on-chain token index.
+# `claimable_all` is paged per 64 tokens, calls are batched through multicall.
+
+from ape import chain
+from _multicall import batched
+
+PAGE_SIZE = 64 # tokens returned per `claimable_all` call
+
+def voters(voting, epoch, start_block=0):
+    """
+    Get all accounts that voted in an epoch, from the `Vote` events
+    """
+    logs = voting.Vote.range(start_block, chain.blocks.height + 1, search_topics={'epoch': epoch})
+    return list(dict.fromkeys(log.account for log in logs))
+
+def claimable_matrix(incentives, accounts, epochs):
+    """
+    Get the claimable incentives of every account in every epoch.
+    Returns a dict (account, epoch) => {token: amount}, omitting zero amounts
+    """
+    pages = batched([(incentives.num_tokens, epoch) for epoch in epochs])
+    calls = []
+    for epoch, num_tokens in zip(epochs, pages):
+        for offset in range(0, num_tokens, PAGE_SIZE):
+            for account in accounts:
+                calls.append((incentives.claimable_all, account, epoch, offset))
+
+    matrix = {}
+    for (_, account, epoch, _), (tokens, amounts) in zip(calls, batched(calls)):
+        for token, amount in zip(tokens, amounts):
+            if amount > 0:
+                matrix.setdefault((account, epoch), {})[token] = amount
+    return matrix
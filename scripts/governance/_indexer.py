@@ -0,0 +1,171 @@
+# Index governance events into a local columnar store.
+#
+# Logs are fetched with `eth_getLogs` over block ranges that are requested concurrently.
+# Ranges rejected by the node (too many results, range too wide) are split in half and
+# retried, successful rounds double the range again. Every segment of blocks is decoded
+# in one batch per contract and written as one parquet file per event:
+#
+#   <output>/<contract>.<event>/<first block>-<last block>.parquet
+#   <output>/state.json
+#
+# The state file records the indexed contracts and the last indexed block, so a later run
+# only fetches the new blocks. Numbers are stored as decimal strings since uint256 values
+# do not fit any native column type, bytes as 0x-prefixed hex.
+#
+#   from governance._indexer import index, load
+#   index(output, {'WeightVote': weight_vote, 'GenericGovernor': governor}, start_block)
+#   votes = load(output, 'WeightVote.Vote').to_pandas()
+
+import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+from ape import chain, networks
+from concurrent.futures import ThreadPoolExecutor
+from eth_utils import keccak
+from pathlib import Path
+
+EVENTS = {
+    'WeightVote': ['Vote'],
+    'InclusionVote': ['Vote', 'Apply', 'Whitelist', 'Finalize'],
+    'GenericGovernor': ['Vote', 'Propose', 'Enact'],
+    'PoolGovernor': ['AddAsset', 'StartRamp'],
+    'WeightIncentives': ['Deposit', 'Claim'],
+    'InclusionIncentives': ['Deposit', 'Claim'],
+    'Executor': ['Execute', 'Whitelist'],
+}
+CHUNK_SIZE = 10_000 # initial blocks per `eth_getLogs` request
+MAX_CHUNK_SIZE = 100_000
+SEGMENT_SIZE = 500_000 # blocks per written file
+WORKERS = 8
+CONFIRMATIONS = 12
+STATE_FILE = 'state.json'
+
+def index(output, contracts, start_block, end_block=None, chunk_size=CHUNK_SIZE, workers=WORKERS, progress=None):
+    """
+    Index the events of a dict name => contract from the last indexed block, or `start_block`
+    on the first run, up to `end_block`. Defaults to the head minus a number of confirmations.
+    Returns the number of stored events
+    """
+    output = Path(output)
+    addresses = {name: contract.address for name, contract in contracts.items()}
+    state = _load_state(output)
+    if state is not None:
+        if state['contracts'] != addresses:
+            raise ValueError(f'{output} indexes different contracts: {state["contracts"]}')
+        start_block = state['block'] + 1
+    if end_block is None:
+        end_block = chain.blocks.head.number - CONFIRMATIONS
+
+    abis = {name: [contract.contract_type.events[event] for event in EVENTS[name]] for name, contract in contracts.items()}
+    topics = list(dict.fromkeys(_topic(abi) for events in abis.values() for abi in events))
+
+    stored = 0
+    for first in range(start_block, end_block + 1, SEGMENT_SIZE):
+        last = min(first + SEGMENT_SIZE - 1, end_block)
+        logs, chunk_size = fetch_logs(list(addresses.values()), topics, first, last, chunk_size, workers)
+        tables = decode(logs, addresses, abis)
+
+        # files of an interrupted run may cover a different range
+        for path in output.glob(f'*/{first}-*.parquet'):
+            path.unlink()
+        for table, rows in tables.items():
+            path = output / table / f'{first}-{last}.parquet'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.Table.from_pylist(rows), path)
+            stored += len(rows)
+        _save_state(output, {'contracts': addresses, 'block': last})
+        if progress is not None:
+            progress(last, len(logs))
+    return stored
+
+def fetch_logs(addresses, topics, first, last, chunk_size=CHUNK_SIZE, workers=WORKERS):
+    """
+    Fetch all logs of a set of contracts and event topics in a block range.
+    Returns the logs ordered by block and log index, and the adapted chunk size
+    """
+    filters = {'address': addresses, 'topics': [topics]}
+    logs = []
+    cursor = first
+    retry = []
+    with ThreadPoolExecutor(workers) as pool:
+        while cursor <= last or len(retry) > 0:
+            ranges, retry = retry, []
+            while len(ranges) < workers and cursor <= last:
+                ranges.append((cursor, min(cursor + chunk_size - 1, last)))
+                cursor = ranges[-1][1] + 1
+
+            futures = [(r, pool.submit(_get_logs, filters, *r)) for r in ranges]
+            for (start, end), future in futures:
+                try:
+                    logs.extend(future.result())
+                except Exception:
+                    if start == end:
+                        raise
+                    middle = (start + end) // 2
+                    retry += [(start, middle), (middle + 1, end)]
+                    chunk_size = max(1, min(chunk_size, (end - start + 1) // 2))
+            if len(retry) == 0:
+                chunk_size = min(2 * chunk_size, MAX_CHUNK_SIZE)
+
+    logs.sort(key=lambda log: (log['blockNumber'], log['logIndex']))
+    return logs, chunk_size
+
+def decode(logs, addresses, abis):
+    """
+    Decode logs in one batch per contract.
+    Returns a dict table => rows, with one table per contract and event
+    """
+    ecosystem = networks.provider.network.ecosystem
+    tables = {}
+    for name, address in addresses.items():
+        contract_logs = [log for log in logs if log['address'].lower() == address.lower()]
+        if len(contract_logs) == 0:
+            continue
+        for log in ecosystem.decode_logs(contract_logs, *abis[name]):
+            row = {
+                'block_number': log.block_number,
+                'transaction_hash': _value(log.transaction_hash),
+                'log_index': log.log_index,
+            }
+            row.update({key: _value(value) for key, value in log.event_arguments.items()})
+            tables.setdefault(f'{name}.{log.event_name}', []).append(row)
+    return tables
+
+def load(output, table):
+    """
+    Read all indexed events of a table, e.g. `WeightVote.Vote`, as a pyarrow table
+    """
+    path = Path(output) / table
+    if not path.exists():
+        return pa.table({})
+    return pq.read_table(path)
+
+def _get_logs(filters, first, last):
+    return networks.provider.web3.eth.get_logs({**filters, 'fromBlock': first, 'toBlock': last})
+
+def _topic(abi):
+    return '0x' + keccak(text=abi.selector).hex()
+
+def _value(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        return [_value(v) for v in value]
+    return str(value)
+
+def _load_state(output):
+    path = output / STATE_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+def _save_state(output, state):
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / STATE_FILE
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
@@ -0,0 +1,31 @@
+# Query the vote weight of an arbitrary number of accounts.
+# Accounts are split into chunks that fit `vote_weights` and the chunks are
+# queried in parallel, all pinned to the same block.
+
+from concurrent.futures import ThreadPoolExecutor
+from ape import chain
+
+CHUNK_SIZE = 256 # maximum number of accounts per `vote_weights` call
+WORKERS = 8
+
+def chunks(items, size):
+    return [items[i:i+size] for i in range(0, len(items), size)]
+
+def vote_weights(measure, accounts, block=None, chunk_size=CHUNK_SIZE, workers=WORKERS):
+    """
+    Get the vote weight of every account at a single block.
+    Returns a dict account => weight, in the order of the input
+    """
+    assert 0 < chunk_size <= CHUNK_SIZE
+    if block is None:
+        block = chain.blocks.head.number
+    accounts = list(dict.fromkeys(accounts))
+
+    def query(chunk):
+        return measure.vote_weights(chunk, block_id=block)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(query, chunks(accounts, chunk_size)))
+    weights = [weight for result in results for weight in result]
+    assert len(weights) == len(accounts)
+    return dict(zip(accounts, weights))
@@ -0,0 +1,153 @@
+# Search the parameters of `PoolGovernor.execute` that minimize arbitrage.
+#
+# Adding an asset rescales the weights of the existing assets and deposits `_amount` of the new
+# asset at `_amplification`. Unless the deposit matches the new weight exactly, the pool is left
+# imbalanced and arbitrageurs extract the difference between the sum of virtual balances and the
+# supply. Afterwards the weights and amplification ramp linearly to their targets over
+# `ramp_duration`; every time the pool is arbitraged back to balance during the ramp, value leaks.
+#
+# The invariant is homogeneous in the balances and supply, so the ramp leak is proportional to
+# the supply after the deposit. It is simulated once per amplification for a unit supply and
+# combined with the deposit leak over an (amount, amplification) grid. The grid is refined
+# around the best point a few times.
+#
+#   from governance._optimizer import optimize, read_inputs
+#   result = optimize(**read_inputs(governor))
+
+import numpy as np
+from ape import Contract
+from _multicall import batched
+from governance._pool_governor import PRECISION, execute_weights, read_state
+from pool._math import balanced, supply
+
+GRID = 64 # points per dimension
+REFINE = 3 # zoom iterations around the best grid point
+STEP = 3600 # seconds between arbitrages during the ramp
+SLIPPAGE = 0.005 # tolerance on the minimum amount of LP tokens
+MIN_BAND = 0.01 # minimum weight band of the new asset
+BAND_PRECISION = 10**6 # bands are packed with 6 decimals
+
+def read_inputs(governor, epoch=None, block_id=None):
+    """
+    Read the pool state and the ramp the governor will schedule when the inclusion winner is added.
+    Returns a dict with the keyword arguments of `optimize`, except for the search ranges
+    """
+    if epoch is None:
+        epoch = governor.epoch(block_id=block_id) - 1
+    state = read_state(governor, epoch, block_id)
+    if not state['included']:
+        raise ValueError(f'no asset to include in epoch {epoch}')
+
+    inclusion = Contract(governor.inclusion_vote(block_id=block_id))
+    winner = inclusion.winners(epoch, block_id=block_id)
+    provider = Contract(inclusion.winner_rate_providers(epoch, block_id=block_id))
+    pool = Contract(governor.pool(block_id=block_id))
+    proxy = Contract(governor.executor(block_id=block_id)).proxy(block_id=block_id)
+    num_assets = len(state['weights'])
+    calls = [(pool.virtual_balance, i) for i in range(num_assets)]
+    calls += [(pool.amplification,), (provider.rate, winner), (Contract(winner).balanceOf, proxy)]
+    calls += [(governor.initial_weight,), (governor.ramp_duration,), (governor.target_amplification,)]
+    results = batched(calls, block_id=block_id)
+    vb = results[:num_assets]
+    amplification, rate, balance, initial_weight, ramp_duration, target_amplification = results[num_assets:]
+
+    targets = execute_weights(**{**state, 'included': True})
+    return {
+        'vb': np.array(vb, dtype=float) / PRECISION,
+        'weights': np.array(state['weights'], dtype=float) / PRECISION,
+        'amplification': amplification / PRECISION,
+        'rate': rate / PRECISION,
+        'max_amount': balance / PRECISION,
+        'initial_weight': initial_weight / PRECISION,
+        'targets': np.array(targets, dtype=float) / PRECISION,
+        'target_amplification': target_amplification / PRECISION,
+        'ramp_duration': ramp_duration,
+    }
+
+def ramp_leak(weights, targets, amplification, target_amplification, steps):
+    """
+    Value leaked to arbitrage per unit of supply while ramping from a balanced pool,
+    for an array of starting amplifications
+    """
+    amplification = np.asarray(amplification, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    vb = np.broadcast_to(weights, amplification.shape + weights.shape)
+    leak = np.zeros(amplification.shape)
+    for k in range(1, steps + 1):
+        f = k / steps
+        w = weights + (targets - weights) * f
+        a = amplification + (target_amplification - amplification) * f
+        s = supply(vb, w, a)
+        leak += vb.sum(axis=-1) - s
+        vb = balanced(s, w)
+    return leak
+
+def evaluate(vb, weights, pool_amplification, rate, initial_weight, targets, target_amplification, ramp_duration, amounts, amplifications, step=STEP):
+    """
+    Evaluate all combinations of amounts and amplifications.
+    Returns dicts of (amounts, amplifications) arrays: leak on deposit, leak during the ramp,
+    supply before and after the deposit and the weight ratio of the new asset after the deposit
+    """
+    vb = np.asarray(vb, dtype=float)
+    new_weights = np.append(np.asarray(weights, dtype=float) * (1 - initial_weight), initial_weight)
+    amounts, amplifications = np.meshgrid(amounts, amplifications, indexing='ij')
+
+    deposit = amounts * rate
+    vb_new = np.concatenate([np.broadcast_to(vb, amounts.shape + vb.shape), deposit[..., None]], axis=-1)
+    supply_after = supply(vb_new, new_weights, amplifications)
+    deposit_leak = vb_new.sum(axis=-1) - supply_after
+
+    steps = max(1, ramp_duration // step)
+    unit_leak = ramp_leak(new_weights, targets, amplifications[0], target_amplification, steps)
+    return {
+        'deposit_leak': deposit_leak,
+        'ramp_leak': supply_after * unit_leak[None, :],
+        'supply_before': np.broadcast_to(supply(vb, weights, pool_amplification), amounts.shape),
+        'supply_after': supply_after,
+        'ratio': deposit / vb_new.sum(axis=-1),
+    }
+
+def optimize(vb, weights, amplification, rate, max_amount, initial_weight, targets, target_amplification, ramp_duration,
+        min_amplification=None, max_amplification=None, grid=GRID, refine=REFINE, step=STEP, slippage=SLIPPAGE, min_band=MIN_BAND):
+    """
+    Find the amount and amplification that minimize the total leak to arbitrage.
+    Returns the arguments of `PoolGovernor.execute` as integers with 18 decimals,
+    together with the expected leaks in ETH
+    """
+    if min_amplification is None:
+        min_amplification = max(target_amplification / 4, 2)
+    if max_amplification is None:
+        max_amplification = target_amplification * 2
+    inputs = (vb, weights, amplification, rate, initial_weight, targets, target_amplification, ramp_duration)
+
+    amount_range = (max_amount / grid, max_amount)
+    amplification_range = (min_amplification, max_amplification)
+    for _ in range(refine + 1):
+        amounts = np.linspace(*amount_range, grid)
+        amplifications = np.linspace(*amplification_range, grid)
+        result = evaluate(*inputs, amounts, amplifications, step)
+        total = result['deposit_leak'] + result['ramp_leak']
+        i, j = np.unravel_index(np.argmin(total), total.shape)
+
+        # zoom in on the neighbouring grid points
+        amount_range = (amounts[max(i - 1, 0)], amounts[min(i + 1, grid - 1)])
+        amplification_range = (amplifications[max(j - 1, 0)], amplifications[min(j + 1, grid - 1)])
+
+    deviation = result['ratio'][i, j] - initial_weight
+    lower = max(-deviation, min_band)
+    upper = max(deviation, min_band)
+    minted = result['supply_after'][i, j] - result['supply_before'][i, j]
+    return {
+        'lower': _band(lower),
+        'upper': _band(upper),
+        'amount': int(amounts[i] * PRECISION),
+        'amplification': int(amplifications[j] * PRECISION),
+        'min_lp_amount': int(minted * (1 - slippage) * PRECISION),
+        'deposit_leak': float(result['deposit_leak'][i, j]),
+        'ramp_leak': float(result['ramp_leak'][i, j]),
+    }
+
+def _band(band):
+    # round up to the packing precision, capped at 100%
+    return min(int(np.ceil(band * BAND_PRECISION)), BAND_PRECISION) * (PRECISION // BAND_PRECISION)
@@ -0,0 +1,209 @@
+# Exact integer model of the weight computation in `PoolGovernor.execute`.
+#
+# `execute_weights` follows the contract line by line, including its integer rounding,
+# and returns the weights passed to `set_ramp`. `sweep` evaluates the same algorithm for
+# many parameter scenarios at once on numpy object arrays, which keeps the arithmetic
+# exact (python integers) while vectorizing over scenarios.
+#
+#   from governance._pool_governor import predict, read_state, sweep
+#   print(predict(governor))
+#   state = read_state(governor)
+#   weights, status = sweep(**state, redistribute_weight=np.linspace(0, UNIT // 10, 1000, dtype=object))
+
+import numpy as np
+from ape import Contract
+from _multicall import batched
+
+PRECISION = 10**18
+APPLICATION_DISABLED = '0x0000000000000000000000000000000000000001'
+ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
+# scenario status returned by `sweep`
+STATUS_OK = 0
+STATUS_NOOP = 1 # no votes and no new asset, `execute` returns without ramp
+STATUS_REVERT = 2 # `execute` would revert
+
+PARAMETERS = ['redistribute_weight', 'ramp_weight', 'min_weight', 'max_weight']
+
+def read_state(governor, epoch=None, block_id=None):
+    """
+    Read all inputs of `execute` for an epoch, defaults to the latest finished epoch.
+    Returns a dict with the keyword arguments of `execute_weights`
+    """
+    if epoch is None:
+        epoch = governor.epoch(block_id=block_id) - 1
+    pool = Contract(governor.pool(block_id=block_id))
+    voting = Contract(governor.weight_vote(block_id=block_id))
+    inclusion = Contract(governor.inclusion_vote(block_id=block_id))
+    num_assets = pool.num_assets(block_id=block_id)
+
+    calls = [(getattr(governor, name),) for name in PARAMETERS]
+    calls += [(inclusion.winners, epoch), (inclusion.winner_rate_providers, epoch), (voting.total_votes, epoch)]
+    calls += [(voting.votes, epoch, i) for i in range(num_assets + 1)]
+    calls += [(pool.weight, i) for i in range(num_assets)]
+    results = batched(calls, block_id=block_id)
+
+    parameters = dict(zip(PARAMETERS, results[:4]))
+    winner, provider, total_votes = results[4:7]
+    votes = results[7:8 + num_assets]
+    weights = [w[0] if isinstance(w, (list, tuple)) else w for w in results[8 + num_assets:]]
+    included = winner != ZERO_ADDRESS and provider not in [ZERO_ADDRESS, APPLICATION_DISABLED]
+    return dict(weights=weights, votes=votes, total_votes=total_votes, included=included, **parameters)
+
+def predict(governor, epoch=None, block_id=None):
+    """
+    Predict the weights `execute` will ramp to, None if it will not ramp
+    """
+    return execute_weights(**read_state(governor, epoch, block_id))
+
+def execute_weights(weights, votes, total_votes, included, redistribute_weight, ramp_weight, min_weight, max_weight):
+    """
+    Compute the `set_ramp` weights of `PoolGovernor.execute`.
+    `weights` are the current pool weights, `votes` the weight votes of the epoch starting
+    with the blank vote. Returns None if no ramp is executed, raises ValueError where the
+    contract would revert
+    """
+    num_assets = len(weights)
+    redistribute = 0
+    if total_votes > 0:
+        blank = votes[0]
+        redistribute = redistribute_weight * (total_votes - blank) // total_votes
+        total_votes -= blank
+    if total_votes == 0 and not included:
+        return None
+    left = redistribute
+    if included:
+        left += ramp_weight
+    left = _sub(PRECISION, left)
+
+    total_weight = 0
+    shortage = 0
+    excess = 0
+    new = []
+    for i in range(num_assets):
+        weight = weights[i] * left // PRECISION
+        if total_votes > 0:
+            weight += redistribute * votes[i + 1] // total_votes
+
+        # clamp
+        if weight < min_weight:
+            shortage += min_weight - weight
+            weight = min_weight
+        elif weight > max_weight:
+            excess += weight - max_weight
+            weight = max_weight
+        else:
+            total_weight += weight
+        new.append(weight)
+
+    # distribute excess/shortage from clamp
+    if shortage > 0 or excess > 0:
+        if total_weight == 0:
+            raise ValueError('all weights clamped')
+        unclamped = total_weight
+        net = _sub(total_weight + excess, shortage)
+        total_weight = 0
+        for i in range(num_assets):
+            weight = new[i]
+            if weight > min_weight and weight < max_weight:
+                weight = net * weight // unclamped
+                new[i] = weight
+            total_weight += weight
+
+    if included:
+        new.append(ramp_weight)
+        total_weight += ramp_weight
+    else:
+        # the contract underflows on an empty ramp
+        num_assets = _sub(num_assets, 1)
+
+    # correct for rounding
+    if total_weight > PRECISION:
+        new[num_assets] = _sub(new[num_assets], total_weight - PRECISION)
+    else:
+        new[num_assets] += PRECISION - total_weight
+    return new
+
+def sweep(weights, votes, total_votes, included, redistribute_weight, ramp_weight, min_weight, max_weight):
+    """
+    Vectorized `execute_weights` over S scenarios. Every argument can either be a single value
+    or have the scenario dimension first: shape (S,) for scalars, (S, n) for weights and
+    (S, n + 1) for votes. Returns the weights as an (S, n + 1) object array, the last column
+    being the weight of the new asset, and an (S,) array with the status of each scenario.
+    Weights of scenarios that are not ok are undefined
+    """
+    weights = _array(weights, 2)
+    votes = _array(votes, 2)
+    total_votes, redistribute_weight, ramp_weight, min_weight, max_weight = [
+        _array(x, 1) for x in [total_votes, redistribute_weight, ramp_weight, min_weight, max_weight]
+    ]
+    included = np.atleast_1d(np.asarray(included, dtype=bool))
+    scenarios = max(len(x) for x in [weights, votes, total_votes, included, redistribute_weight, ramp_weight, min_weight, max_weight])
+    num_assets = weights.shape[1]
+    assert votes.shape[1] == num_assets + 1
+
+    def expand(x):
+        return np.broadcast_to(x, (scenarios,) + x.shape[1:])
+
+    weights, votes = expand(weights), expand(votes)
+    total_votes, included = expand(total_votes), expand(included)
+    redistribute_weight, ramp_weight = expand(redistribute_weight), expand(ramp_weight)
+    min_weight, max_weight = expand(min_weight)[:, None], expand(max_weight)[:, None]
+    revert = np.zeros(scenarios, dtype=bool)
+
+    voted = total_votes > 0
+    safe_votes = np.where(voted, total_votes, 1)
+    redistribute = np.where(voted, redistribute_weight * (total_votes - votes[:, 0]) // safe_votes, 0)
+    total_votes = np.where(voted, total_votes - votes[:, 0], 0)
+    noop = (total_votes == 0) & ~included
+    left = PRECISION - redistribute - np.where(included, ramp_weight, 0)
+    revert |= left < 0
+
+    voted = total_votes > 0
+    safe_votes = np.where(voted, total_votes, 1)[:, None]
+    new = weights * left[:, None] // PRECISION
+    new = new + np.where(voted[:, None], redistribute[:, None] * votes[:, 1:] // safe_votes, 0)
+
+    # clamp
+    low = new < min_weight
+    high = ~low & (new > max_weight)
+    shortage = np.where(low, min_weight - new, 0).sum(axis=1)
+    excess = np.where(high, new - max_weight, 0).sum(axis=1)
+    new = np.where(low, min_weight, np.where(high, max_weight, new))
+    total_weight = np.where(low | high, 0, new).sum(axis=1)
+
+    # distribute excess/shortage from clamp
+    clamped = (shortage > 0) | (excess > 0)
+    revert |= clamped & (total_weight == 0)
+    unclamped = np.where(total_weight > 0, total_weight, 1)[:, None]
+    net = total_weight + excess - shortage
+    revert |= clamped & (net < 0)
+    scale = clamped[:, None] & (new > min_weight) & (new < max_weight)
+    new = np.where(scale, net[:, None] * new // unclamped, new)
+    total_weight = np.where(clamped, new.sum(axis=1), total_weight)
+
+    # new asset
+    new = np.concatenate([new, np.where(included, ramp_weight, 0)[:, None]], axis=1)
+    total_weight = total_weight + np.where(included, ramp_weight, 0)
+
+    # correct for rounding
+    last = np.where(included, num_assets, num_assets - 1)
+    revert |= ~included & (num_assets == 0)
+    rows = np.arange(scenarios)
+    new[rows, last] += PRECISION - total_weight
+    revert |= new[rows, last] < 0
+
+    status = np.where(noop, STATUS_NOOP, np.where(revert, STATUS_REVERT, STATUS_OK))
+    return new, status
+
+def _sub(a, b):
+    # unsigned subtraction, reverts on underflow
+    if b > a:
+        raise ValueError('underflow')
+    return a - b
+
+def _array(x, ndim):
+    x = np.array(x, dtype=object)
+    while x.ndim < ndim:
+        x = x[None]
+    return x
@@ -0,0 +1,76 @@
+# Helpers to encode the votes of an account for `VoteRouter.vote`.
+#
+#   from governance._router import *
+#   args = router_args(
+#       weight={0: 1, 2: 3},           # asset idx => share, blank vote via `blank`
+#       inclusion={1: 1},              # candidate idx => share
+#       proposals={4: 'yea', 5: (1, 1, 0)},
+#   )
+#   router.vote(*args, sender=account)
+
+VOTE_SCALE = 10_000
+MAX_OPTIONS = 33
+MAX_PROPOSALS = 32
+CHOICES = {
+    'yea': (VOTE_SCALE, 0, 0),
+    'nay': (0, VOTE_SCALE, 0),
+    'abstain': (0, 0, VOTE_SCALE),
+}
+
+def to_bps(shares):
+    """
+    Normalize a list of non-negative shares to basis points that add to exactly 100%.
+    Rounding dust is assigned by largest remainder
+    """
+    assert len(shares) > 0 and all(s >= 0 for s in shares)
+    total = sum(shares)
+    assert total > 0
+    exact = [s * VOTE_SCALE / total for s in shares]
+    bps = [int(e) for e in exact]
+    order = sorted(range(len(shares)), key=lambda i: bps[i] - exact[i])
+    for i in order[:VOTE_SCALE - sum(bps)]:
+        bps[i] += 1
+    return bps
+
+def option_votes(shares, blank=0):
+    """
+    Encode votes for `WeightVote` or `InclusionVote`. Shares are keyed by asset or
+    candidate index, the blank option is prepended. Trailing zeroes are omitted
+    """
+    if not shares and blank == 0:
+        return []
+    n = max(shares.keys(), default=-1) + 2
+    assert n <= MAX_OPTIONS
+    votes = [blank] + [shares.get(i, 0) for i in range(n - 1)]
+    return to_bps(votes)
+
+def proposal_votes(proposals):
+    """
+    Encode votes for `GenericGovernor.vote_many`. Each proposal maps to either
+    'yea', 'nay', 'abstain' or a tuple of (yea, nay, abstain) shares
+    """
+    assert len(proposals) <= MAX_PROPOSALS
+    idx, yea, nay, abstain = [], [], [], []
+    for i, choice in sorted(proposals.items()):
+        y, n, a = CHOICES[choice] if isinstance(choice, str) else to_bps(list(choice))
+        idx.append(i)
+        yea.append(y)
+        nay.append(n)
+        abstain.append(a)
+    return idx, yea, nay, abstain
+
+def router_args(weight=None, inclusion=None, proposals=None, weight_blank=0, inclusion_blank=0):
+    """
+    Build the arguments of `VoteRouter.vote`. Omitted votes are skipped by the router
+    """
+    return (
+        option_votes(weight or {}, weight_blank),
+        option_votes(inclusion or {}, inclusion_blank),
+        *proposal_votes(proposals or {}),
+    )
+
+def encode_router_vote(router, **kwargs):
+    """
+    Encode the calldata of `VoteRouter.vote`, e.g. for a multisig or relayer
+    """
+    return router.vote.encode_input(*router_args(**kwargs))
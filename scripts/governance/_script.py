@@ -0,0 +1,96 @@
+# Pack and unpack executor scripts offline.
+#
+# A script is a concatenation of calls, each prefixed by 28 bytes:
+#   calldata size (8 bytes) | target address (20 bytes) | calldata (size bytes)
+# This is the format produced by `Executor.script` and parsed by `Executor.execute`.
+#
+#   from governance._script import *
+#   script = pack([(token, token.mint.encode_input(proxy, UNIT))])
+#   print(describe(script, names={token.address: 'token'}, signatures=['mint(address,uint256)']))
+
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+PREFIX_SIZE = 28
+SIZE_BYTES = 8
+MAX_CALLS = 32 # iterations of the `Executor.execute` loop
+MAX_CALLDATA_SIZE = 2048 # calldata size of a single call
+MAX_SCRIPT_SIZE = 2048 # script size accepted by the governors
+
+def script(to, data):
+    """
+    Encode a single call, identical to `Executor.script`
+    """
+    data = _bytes(data)
+    if len(data) < 4 or len(data) > MAX_CALLDATA_SIZE:
+        raise ValueError(f'calldata size {len(data)} out of range')
+    return len(data).to_bytes(SIZE_BYTES, 'big') + bytes.fromhex(_address(to)[2:]) + data
+
+def pack(calls):
+    """
+    Encode a list of (target, calldata) into a script
+    """
+    if len(calls) > MAX_CALLS:
+        raise ValueError(f'too many calls: {len(calls)} > {MAX_CALLS}')
+    packed = b''.join(script(to, data) for to, data in calls)
+    if len(packed) > MAX_SCRIPT_SIZE:
+        raise ValueError(f'script too large: {len(packed)} > {MAX_SCRIPT_SIZE} bytes')
+    return packed
+
+def unpack(packed):
+    """
+    Decode a script into a list of (target, calldata).
+    Applies the same checks as `Executor.execute`, so any script that
+    decodes successfully is also accepted by the executor
+    """
+    packed = _bytes(packed)
+    if len(packed) > MAX_SCRIPT_SIZE:
+        raise ValueError(f'script too large: {len(packed)} > {MAX_SCRIPT_SIZE} bytes')
+    calls = []
+    i = 0
+    while i < len(packed):
+        if len(calls) == MAX_CALLS:
+            raise ValueError(f'too many calls: more than {MAX_CALLS}')
+        if i + 32 > len(packed):
+            raise ValueError(f'truncated prefix at byte {i}')
+        size = int.from_bytes(packed[i:i+SIZE_BYTES], 'big')
+        to = to_checksum_address(packed[i+SIZE_BYTES:i+PREFIX_SIZE])
+        i += PREFIX_SIZE
+        if size < 4 or size > MAX_CALLDATA_SIZE:
+            raise ValueError(f'calldata size {size} out of range at byte {i - PREFIX_SIZE}')
+        if i + size > len(packed):
+            raise ValueError(f'truncated calldata at byte {i}')
+        calls.append((to, packed[i:i+size]))
+        i += size
+    return calls
+
+def selectors(signatures):
+    """
+    Map 4 byte selectors to function signatures
+    """
+    return {function_signature_to_4byte_selector(s): s for s in signatures}
+
+def describe(packed, names=None, signatures=None):
+    """
+    Human readable description of a script: one line per call with target and function,
+    followed by the arguments as 32 byte words
+    """
+    names = {_address(k): v for k, v in (names or {}).items()}
+    known = selectors(signatures or [])
+    lines = []
+    for n, (to, data) in enumerate(unpack(packed)):
+        target = f'{names[to]} ({to})' if to in names else to
+        selector = data[:4]
+        function = known.get(selector, '0x' + selector.hex())
+        lines.append(f'[{n}] {target}.{function}')
+        args = data[4:]
+        for j in range(0, len(args), 32):
+            lines.append(f'      {j // 32}: 0x{args[j:j+32].hex()}')
+    return '\n'.join(lines)
+
+def _bytes(data):
+    if isinstance(data, str):
+        return bytes.fromhex(data.removeprefix('0x'))
+    return bytes(data)
+
+def _address(address):
+    return to_checksum_address(str(getattr(address, 'address', address)))
@@ -0,0 +1,125 @@
+# Simulate the execution of governance scripts on a fork.
+#
+# The script is executed by impersonating a governor of the executor, so every call
+# goes through `Executor.execute` and `OwnershipProxy.execute` exactly like an enacted
+# proposal would. After each simulation the fork is restored to a snapshot, so the same
+# warm fork can be reused for any number of simulations.
+#
+#   from governance._simulate import Simulator, proposal_script
+#   simulator = Simulator(executor, governor)
+#   ipfs, script = proposal_script(governor, 12)
+#   result = simulator.simulate(script)
+
+from ape import accounts, chain, networks
+from ape.exceptions import ContractLogicError
+from eth_utils import keccak, to_checksum_address
+from governance._script import unpack
+
+UNIT = 1_000_000_000_000_000_000
+
+def proposal_script(governor, idx, start_block=0):
+    """
+    Get the IPFS hash and script of a generic governor proposal from its `Propose` event.
+    The script is verified against the hash stored in the governor
+    """
+    logs = list(governor.Propose.range(start_block, chain.blocks.height + 1, search_topics={'idx': idx}))
+    if len(logs) == 0:
+        raise ValueError(f'proposal {idx} not found')
+    log = logs[0]
+    script = bytes(log.script)
+    if keccak(script) != bytes(governor.proposal(idx).hash):
+        raise ValueError(f'script of proposal {idx} does not match its hash')
+    return bytes(log.ipfs), script
+
+class Simulator:
+    """
+    Execute scripts through the executor on a snapshot of the fork
+    """
+    def __init__(self, executor, governor):
+        self.executor = executor
+        self.governor = str(getattr(governor, 'address', governor))
+        if not executor.governors(self.governor):
+            raise ValueError(f'{self.governor} is not a governor of the executor')
+        self.sender = accounts[self.governor]
+        self.snapshot = chain.snapshot()
+
+    def simulate(self, script):
+        """
+        Execute a script and restore the fork afterwards.
+        Returns a dict with the decoded calls, gas used, events and state diff,
+        or the revert reason if the script failed
+        """
+        result = {'calls': unpack(script), 'reverted': False}
+        try:
+            # fund the governor inside the snapshot, so the balance is restored as well
+            networks.provider.set_balance(self.governor, UNIT)
+            receipt = self.executor.execute(script, sender=self.sender)
+            result['gas'] = receipt.gas_used
+            result['events'] = events(receipt)
+            result['diff'] = state_diff(trace(receipt.txn_hash), self.governor)
+        except ContractLogicError as e:
+            result['reverted'] = True
+            result['error'] = e.message
+        finally:
+            self.restore()
+        return result
+
+    def restore(self):
+        # snapshots are consumed when restored
+        chain.restore(self.snapshot)
+        self.snapshot = chain.snapshot()
+
+def events(receipt):
+    """
+    Decode the events emitted during execution.
+    Events of contracts without a known ABI are returned undecoded
+    """
+    decoded = {log.log_index: log for log in receipt.decode_logs()}
+    result = []
+    for i, log in enumerate(receipt.logs):
+        index = int(log.get('logIndex', i))
+        if index in decoded:
+            event = decoded[index]
+            result.append((event.contract_address, event.event_name, dict(event.event_arguments)))
+        else:
+            topics = ['0x' + bytes(t).hex() for t in log['topics']]
+            result.append((log['address'], None, {'topics': topics, 'data': '0x' + bytes(log['data']).hex()}))
+    return result
+
+def trace(txn_hash):
+    """
+    Get the pre and post state of all accounts touched by a transaction
+    """
+    return networks.provider.make_request(
+        'debug_traceTransaction',
+        [txn_hash, {'tracer': 'prestateTracer', 'tracerConfig': {'diffMode': True}}]
+    )
+
+def state_diff(trace, sender=None):
+    """
+    Convert a prestate trace into a dict address => {'balance': (before, after), 'storage': {slot: (before, after)}}.
+    Balance changes of the sender are omitted, as they only reflect the gas cost
+    """
+    pre, post = trace['pre'], trace['post']
+    diff = {}
+    for address in set(pre) | set(post):
+        before = pre.get(address, {})
+        after = post.get(address, {})
+        changes = {}
+
+        # only modified fields are included, cleared slots are omitted from the post state
+        if 'balance' in after and (sender is None or address.lower() != sender.lower()):
+            changes['balance'] = (int(before.get('balance', '0x0'), 16), int(after['balance'], 16))
+        storage = {}
+        slots_before = before.get('storage', {})
+        slots_after = after.get('storage', {})
+        for slot in set(slots_before) | set(slots_after):
+            value_before = int(slots_before.get(slot, '0x0'), 16)
+            value_after = int(slots_after.get(slot, '0x0'), 16)
+            if value_before != value_after:
+                storage[int(slot, 16)] = (value_before, value_after)
+        if len(storage) > 0:
+            changes['storage'] = storage
+        if len(changes) > 0:
+            diff[to_checksum_address(address)] = changes
+    return diff
@@ -0,0 +1,48 @@
+# Index governance events into parquet files.
+#
+#   ape run index_events --network ethereum:mainnet \
+#       --weight-vote <address> --inclusion-vote <address> --generic-governor <address> \
+#       --pool-governor <address> --weight-incentives <address> --inclusion-incentives <address> \
+#       --executor <address> --start-block 19000000 --output events
+#
+# Rerunning with the same output directory resumes from the last indexed block.
+# The contracts have to be the same on every run, use a new directory otherwise.
+# See `governance/_indexer.py` for the layout of the store.
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+from governance._indexer import CHUNK_SIZE, WORKERS, index
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--weight-vote', default=None, help='Address of the weight vote contract')
+@click.option('--inclusion-vote', default=None, help='Address of the inclusion vote contract')
+@click.option('--generic-governor', default=None, help='Address of the generic governor')
+@click.option('--pool-governor', default=None, help='Address of the pool governor')
+@click.option('--weight-incentives', default=None, help='Address of the weight incentives contract')
+@click.option('--inclusion-incentives', default=None, help='Address of the inclusion incentives contract')
+@click.option('--executor', default=None, help='Address of the executor')
+@click.option('--start-block', default=0, help='Block to start indexing from on the first run')
+@click.option('--end-block', default=None, type=int, help='Last block to index, defaults to the confirmed head')
+@click.option('--chunk-size', default=CHUNK_SIZE, help='Initial blocks per request')
+@click.option('--workers', default=WORKERS, help='Number of parallel requests')
+@click.option('--output', default='events', help='Directory to store the events in')
+def cli(weight_vote, inclusion_vote, generic_governor, pool_governor, weight_incentives, inclusion_incentives, executor, start_block, end_block, chunk_size, workers, output):
+    addresses = {
+        'WeightVote': weight_vote,
+        'InclusionVote': inclusion_vote,
+        'GenericGovernor': generic_governor,
+        'PoolGovernor': pool_governor,
+        'WeightIncentives': weight_incentives,
+        'InclusionIncentives': inclusion_incentives,
+        'Executor': executor,
+    }
+    contracts = {name: getattr(project, name).at(address) for name, address in addresses.items() if address is not None}
+    if len(contracts) == 0:
+        raise click.ClickException('no contract supplied')
+
+    def progress(block, num_logs):
+        click.echo(f'indexed up to block {block}: {num_logs} events', err=True)
+
+    stored = index(output, contracts, start_block, end_block, chunk_size, workers, progress)
+    click.echo(f'stored {stored} events in {output}', err=True)
@@ -0,0 +1,42 @@
+# Find the parameters of `PoolGovernor.execute` that minimize arbitrage when adding the inclusion winner.
+#
+#   ape run optimize_execute --network ethereum:mainnet --governor <address>
+#
+# The pool state, inclusion winner, its rate and the ramp are read from chain. The amount is
+# bounded by the balance of the winning token held by the ownership proxy, unless overridden.
+# See `governance/_optimizer.py` for the model.
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+from governance._optimizer import GRID, MIN_BAND, REFINE, SLIPPAGE, STEP, optimize, read_inputs
+
+UNIT = 1_000_000_000_000_000_000
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--governor', required=True, help='Address of the pool governor')
+@click.option('--epoch', default=None, type=int, help='Epoch to execute, defaults to the previous epoch')
+@click.option('--max-amount', default=None, type=float, help='Maximum amount of the new asset to deposit')
+@click.option('--min-amplification', default=None, type=float, help='Lower bound of the amplification search')
+@click.option('--max-amplification', default=None, type=float, help='Upper bound of the amplification search')
+@click.option('--grid', default=GRID, help='Grid points per dimension')
+@click.option('--refine', default=REFINE, help='Number of grid refinements')
+@click.option('--step', default=STEP, help='Seconds between arbitrages during the ramp')
+@click.option('--slippage', default=SLIPPAGE, help='Tolerance on the minimum amount of LP tokens')
+@click.option('--min-band', default=MIN_BAND, help='Minimum weight band of the new asset')
+def cli(governor, epoch, max_amount, min_amplification, max_amplification, grid, refine, step, slippage, min_band):
+    governor = project.PoolGovernor.at(governor)
+    inputs = read_inputs(governor, epoch)
+    if max_amount is not None:
+        inputs['max_amount'] = max_amount
+    if inputs['max_amount'] == 0:
+        raise click.ClickException('no tokens to deposit, transfer them to the ownership proxy first')
+
+    result = optimize(
+        **inputs, min_amplification=min_amplification, max_amplification=max_amplification,
+        grid=grid, refine=refine, step=step, slippage=slippage, min_band=min_band
+    )
+    click.echo(f'leak on deposit: {result["deposit_leak"]:.6f} ETH')
+    click.echo(f'leak during ramp: {result["ramp_leak"]:.6f} ETH\n')
+    for name in ['lower', 'upper', 'amount', 'amplification', 'min_lp_amount']:
+        click.echo(f'{name.rjust(13)}: {result[name]} ({result[name] / UNIT:.6f})')
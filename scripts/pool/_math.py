@@ -0,0 +1,154 @@
+# Vectorized math of the yETH weighted stableswap pool.
+#
+# All quantities are floats in natural units: virtual balances are rate-adjusted balances in ETH,
+# weights are fractions that add up to one and the amplification is the pool's `amplification()`
+# divided by 1e18. Every function broadcasts over leading dimensions, with the assets in the
+# last dimension, so many pool states can be evaluated at once.
+#
+# The invariant relates the supply D to the virtual balances x_i with weights w_i:
+#
+#   A (sum(x) - D) = D (r - 1),   r = prod((w_i D / x_i) ^ (n w_i))
+#
+# The pool is balanced when x_i = w_i D for all assets. In that state all marginal prices
+# equal the rates and the sum of virtual balances equals the supply.
+#
+# The `get_*` functions mirror the pool views of the same name. Token amounts are converted to
+# virtual balances with the rates, swap fees are charged like the pool does: on the input of a
+# swap, at half rate on the imbalanced part of a deposit and on the output of a single sided
+# withdrawal. To evaluate a grid of timestamps and amounts, pass pool arrays with an extra axis,
+# e.g. the result of `pool._state.at` for `timestamps[:, None]` together with amounts of shape (M,).
+
+import numpy as np
+
+ITERATIONS = 32
+BALANCE_ITERATIONS = 64
+
+def supply(vb, weights, amplification, iterations=ITERATIONS):
+    """
+    Solve the invariant for the supply with Newton's method, starting from the sum of balances
+    """
+    vb = np.asarray(vb, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    amplification = np.asarray(amplification, dtype=float)
+    active = weights > 0
+    n = active.sum(axis=-1)
+    vb_sum = vb.sum(axis=-1)
+    # constant part of log(r): n sum(w_i log(w_i / x_i)), r is proportional to D^n
+    log_prod = n * np.where(active, weights * np.log(np.where(active, weights / vb, 1)), 0).sum(axis=-1)
+
+    s = vb_sum
+    for _ in range(iterations):
+        r = np.exp(log_prod + n * np.log(s))
+        f = amplification * (vb_sum - s) - s * (r - 1)
+        df = amplification - 1 + (n + 1) * r
+        s = s + f / df
+    return s
+
+def balanced(supply, weights):
+    """
+    Virtual balances of a balanced pool with the given supply
+    """
+    return np.asarray(supply, dtype=float)[..., None] * np.asarray(weights, dtype=float)
+
+def arb(vb, weights, amplification):
+    """
+    Value an arbitrageur extracts by trading the pool back to balance, in ETH.
+    Trading at constant supply to the balanced state lowers the sum of balances to the supply,
+    the difference is the profit
+    """
+    vb = np.asarray(vb, dtype=float)
+    return vb.sum(axis=-1) - supply(vb, weights, amplification)
+
+def balance(vb, weights, amplification, supply, j, iterations=BALANCE_ITERATIONS):
+    """
+    Solve the invariant for the virtual balance of asset `j` at a given supply, keeping the
+    other balances fixed. Newton's method starts from the current balance of `j`
+    """
+    vb = np.asarray(vb, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    amplification = np.asarray(amplification, dtype=float)
+    supply = np.asarray(supply, dtype=float)
+    active = weights > 0
+    n = active.sum(axis=-1)
+    other = active & (np.arange(vb.shape[-1]) != j)
+    other_sum = np.where(other, vb, 0).sum(axis=-1)
+    w = weights[..., j]
+    # log(r) = log_prod - k log(x_j), the invariant is increasing and concave in x_j
+    log_prod = n * np.where(other, weights * np.log(np.where(other, weights * supply[..., None] / vb, 1)), 0).sum(axis=-1)
+    log_prod = log_prod + n * w * np.log(w * supply)
+    k = n * w
+
+    y = vb[..., j]
+    for _ in range(iterations):
+        r = np.exp(log_prod - k * np.log(y))
+        f = amplification * (other_sum + y - supply) - supply * (r - 1)
+        df = amplification + supply * k * r / y
+        # a step from above the root can overshoot below zero
+        y = np.maximum(y - f / df, y / 16)
+    return y
+
+def ramp(weights, target_weights, amplification, target_amplification, last_time, stop_time, timestamps, step=1):
+    """
+    Weights and amplification at the given timestamps during a `set_ramp` ramp, which
+    interpolates linearly from the values at `last_time` to the targets at `stop_time`.
+    The pool only updates once `step` seconds have passed since the last update.
+    Returns arrays with the shape of the timestamps, weights have the assets appended
+    """
+    weights = np.asarray(weights, dtype=float)
+    target_weights = np.asarray(target_weights, dtype=float)
+    timestamps = np.asarray(timestamps, dtype=float)
+    if last_time == 0 or stop_time <= last_time:
+        f = np.zeros(timestamps.shape)
+    else:
+        elapsed = np.clip(timestamps - last_time, 0, stop_time - last_time)
+        f = np.where(elapsed < step, 0, elapsed) / (stop_time - last_time)
+    return (
+        weights + (target_weights - weights) * f[..., None],
+        amplification + (target_amplification - amplification) * f,
+    )
+
+def get_dy(vb, weights, amplification, rates, i, j, dx, fee=0):
+    """
+    Amount of token `j` received for swapping `dx` of token `i`
+    """
+    vb = np.asarray(vb, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    dx = np.asarray(dx, dtype=float)
+    s = supply(vb, weights, amplification)
+    new = _expand(vb, np.broadcast_shapes(vb.shape[:-1], dx.shape))
+    new[..., i] += dx * (1 - fee) * rates[..., i]
+    y = balance(new, weights, amplification, s, j)
+    return (new[..., j] - y) / rates[..., j]
+
+def get_add_lp(vb, weights, amplification, rates, amounts, fee=0):
+    """
+    Amount of LP tokens minted for depositing `amounts` of every token
+    """
+    vb = np.asarray(vb, dtype=float)
+    dvb = np.asarray(amounts, dtype=float) * np.asarray(rates, dtype=float)
+    lowest = (dvb / vb).min(axis=-1)
+    charge = (dvb - vb * lowest[..., None]) * fee / 2
+    return supply(vb + dvb - charge, weights, amplification) - supply(vb, weights, amplification)
+
+def get_remove_lp(vb, weights, amplification, rates, lp):
+    """
+    Amounts of every token received for withdrawing `lp` LP tokens proportionally
+    """
+    vb = np.asarray(vb, dtype=float)
+    share = np.asarray(lp, dtype=float) / supply(vb, weights, amplification)
+    return vb * share[..., None] / np.asarray(rates, dtype=float)
+
+def get_remove_single_lp(vb, weights, amplification, rates, i, lp, fee=0):
+    """
+    Amount of token `i` received for withdrawing `lp` LP tokens in a single asset
+    """
+    vb = np.asarray(vb, dtype=float)
+    lp = np.asarray(lp, dtype=float)
+    s = supply(vb, weights, amplification)
+    new = _expand(vb, np.broadcast_shapes(vb.shape[:-1], lp.shape))
+    dvb = new[..., i] - balance(new, weights, amplification, s - lp, i)
+    return dvb * (1 - fee / 2) / np.asarray(rates, dtype=float)[..., i]
+
+def _expand(vb, shape):
+    # writable copy of the virtual balances broadcast to leading dimensions
+    return np.array(np.broadcast_to(vb, shape + vb.shape[-1:]))
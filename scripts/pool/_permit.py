@@ -0,0 +1,45 @@
+# Sign the EIP-2612 permits of a `Zap.add_liquidity_permit` deposit.
+#
+# One permit is signed per deposited asset, for the exact amount with the zap as spender.
+# The domain separators and nonces of all assets are read in one batch. Assets without
+# permit support can be skipped, they get an empty signature and have to be approved.
+#
+#   from pool._permit import sign_permits
+#   signatures = sign_permits(account, zap, amounts, deadline)
+#   zap.add_liquidity_permit(amounts, min_lp_amount, deadline, signatures, sender=account)
+
+from ape import Contract
+from eth_abi import encode
+from eth_utils import keccak
+from _multicall import batched
+
+PERMIT_TYPEHASH = keccak(text='Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)')
+EMPTY_SIGNATURE = (0, b'\x00' * 32, b'\x00' * 32)
+
+def permit_digest(domain_separator, owner, spender, value, nonce, deadline):
+    """
+    EIP-712 digest of a permit
+    """
+    struct = keccak(encode(
+        ['bytes32', 'address', 'address', 'uint256', 'uint256', 'uint256'],
+        [PERMIT_TYPEHASH, owner, spender, value, nonce, deadline]
+    ))
+    return keccak(b'\x19\x01' + bytes(domain_separator) + struct)
+
+def sign_permits(account, zap, amounts, deadline, skip=()):
+    """
+    Sign a permit for every nonzero amount, except for the asset indices in `skip`.
+    Returns the `_signatures` argument of `add_liquidity_permit` as (v, r, s) tuples
+    """
+    pool = Contract(zap.pool())
+    signed = [i for i, amount in enumerate(amounts) if amount > 0 and i not in skip]
+    assets = batched([(pool.assets, i) for i in signed])
+    tokens = [Contract(asset) for asset in assets]
+    results = batched([(token.DOMAIN_SEPARATOR,) for token in tokens] + [(token.nonces, account) for token in tokens])
+
+    signatures = [EMPTY_SIGNATURE] * len(amounts)
+    for k, i in enumerate(signed):
+        digest = permit_digest(results[k], account.address, zap.address, amounts[i], results[len(signed) + k], deadline)
+        signature = account.sign_raw_msghash(digest)
+        signatures[i] = (signature.v, bytes(signature.r), bytes(signature.s))
+    return signatures
@@ -0,0 +1,74 @@
+# Read the state of a yETH pool and project it to future timestamps while a ramp is active.
+#
+# `read_state` converts the pool storage to the natural units of `pool/_math.py`. `at` applies
+# the ramp of weights and amplification, returning the pool keyword arguments of the `get_*`
+# functions with the shape of the timestamps as leading dimensions. Rates are kept at their
+# current values and the supply is recomputed by the math functions.
+#
+#   from pool._math import get_dy
+#   from pool._state import at, read_state
+#   state = read_state(Contract(POOL))
+#   timestamps = state['timestamp'] + np.arange(0, WEEK, 3600)
+#   dy = get_dy(**at(state, timestamps[:, None]), i=0, j=1, dx=np.linspace(1, 100, 100), fee=state['fee'])
+
+import numpy as np
+from ape import chain
+from _multicall import batched
+from pool._math import ramp, supply
+
+PRECISION = 10**18
+
+def read_state(pool, block_id=None):
+    """
+    Read the virtual balances, rates, weights and ramp of a pool
+    """
+    num_assets = pool.num_assets(block_id=block_id)
+    calls = [(pool.virtual_balance, i) for i in range(num_assets)]
+    calls += [(pool.rate, i) for i in range(num_assets)]
+    calls += [(pool.weight, i) for i in range(num_assets)]
+    calls += [(pool.amplification,), (pool.target_amplification,), (pool.ramp_last_time,)]
+    calls += [(pool.ramp_stop_time,), (pool.ramp_step,), (pool.swap_fee_rate,), (pool.supply,)]
+    results = batched(calls, block_id=block_id)
+
+    vb = results[:num_assets]
+    rates = results[num_assets:2 * num_assets]
+    weights = results[2 * num_assets:3 * num_assets]
+    amplification, target_amplification, last_time, stop_time, step, fee, pool_supply = results[3 * num_assets:]
+    return {
+        'vb': np.array(vb, dtype=float) / PRECISION,
+        'rates': np.array(rates, dtype=float) / PRECISION,
+        'weights': np.array([w[0] for w in weights], dtype=float) / PRECISION,
+        'target_weights': np.array([w[1] for w in weights], dtype=float) / PRECISION,
+        'amplification': amplification / PRECISION,
+        'target_amplification': target_amplification / PRECISION,
+        'last_time': last_time,
+        'stop_time': stop_time,
+        'step': step,
+        'fee': fee / PRECISION,
+        'supply': pool_supply / PRECISION,
+        'timestamp': chain.blocks[-1 if block_id is None else block_id].timestamp,
+    }
+
+def at(state, timestamps):
+    """
+    Pool arrays at the given timestamps, assuming no trades in between
+    """
+    timestamps = np.asarray(timestamps)
+    weights, amplification = ramp(
+        state['weights'], state['target_weights'], state['amplification'], state['target_amplification'],
+        state['last_time'], state['stop_time'], timestamps, state['step'],
+    )
+    vb = np.broadcast_to(state['vb'], timestamps.shape + state['vb'].shape)
+    return {
+        'vb': vb,
+        'weights': weights,
+        'amplification': amplification,
+        'rates': state['rates'],
+    }
+
+def supply_at(state, timestamps):
+    """
+    Supply at the given timestamps. The difference with the current supply is minted to
+    or burned from the staking contract on the next interaction with the pool
+    """
+    return supply(**{k: v for k, v in at(state, timestamps).items() if k != 'rates'})
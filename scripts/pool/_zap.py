@@ -0,0 +1,75 @@
+# Quote `Zap.add_liquidity` for many candidate deposits at once.
+#
+# The zap deposits the assets into the pool and stakes the minted LP tokens, so a quote is the
+# pair (LP tokens, staking shares). Candidates are an (S, n) array of token amounts in natural
+# units. `quote` evaluates them locally with the pool model in one vectorized call, `quote_chain`
+# uses the `get_add_lp` and `previewDeposit` views of the deployed contracts in multicall batches.
+# The views do not depend on the balances of the caller, so no state overrides are needed.
+#
+#   from pool._zap import best, quote, read_zap
+#   state = read_zap(Contract(ZAP))
+#   lp, shares = quote(state, candidates)
+#   idx = best(state, candidates, shares)
+
+import numpy as np
+from ape import Contract
+from _multicall import batched
+from pool._math import get_add_lp
+from pool._state import PRECISION, at, read_state
+
+def read_zap(zap, block_id=None):
+    """
+    Read the pool state and the share price of the staking contract behind a zap
+    """
+    pool = Contract(zap.pool(block_id=block_id))
+    staking = Contract(zap.staking(block_id=block_id))
+    state = read_state(pool, block_id)
+    total_assets, total_shares = batched([(staking.totalAssets,), (staking.totalSupply,)], block_id=block_id)
+    return {
+        **state,
+        'pool': pool,
+        'staking': staking,
+        'block_id': block_id,
+        'total_assets': total_assets / PRECISION,
+        'total_shares': total_shares / PRECISION,
+    }
+
+def quote(state, amounts, timestamp=None):
+    """
+    Model the LP tokens and staking shares minted for every candidate deposit, optionally
+    at a future timestamp during a ramp. Returns two (S,) arrays
+    """
+    if timestamp is None:
+        timestamp = state['timestamp']
+    amounts = np.atleast_2d(np.asarray(amounts, dtype=float))
+    lp = get_add_lp(**at(state, timestamp), amounts=amounts, fee=state['fee'])
+    return lp, _shares(state, lp)
+
+def quote_chain(state, amounts):
+    """
+    Quote every candidate deposit with the contract views, in two rounds of batched calls
+    at the block the state was read at. Returns two (S,) arrays
+    """
+    amounts = np.atleast_2d(np.asarray(amounts, dtype=float))
+    pool, staking, block_id = state['pool'], state['staking'], state['block_id']
+    lp = batched([(pool.get_add_lp, [int(x * PRECISION) for x in row]) for row in amounts], block_id=block_id)
+    shares = batched([(staking.previewDeposit, x) for x in lp], block_id=block_id)
+    return np.array(lp, dtype=float) / PRECISION, np.array(shares, dtype=float) / PRECISION
+
+def best(state, amounts, shares):
+    """
+    Index of the candidate that mints the most shares per unit of deposited value.
+    Empty candidates are skipped
+    """
+    value = np.atleast_2d(np.asarray(amounts, dtype=float)) @ state['rates']
+    if not np.any(value > 0):
+        raise ValueError('no candidate with a deposit')
+    price = np.full(value.shape, -np.inf)
+    np.divide(np.asarray(shares, dtype=float), value, out=price, where=value > 0)
+    return int(np.argmax(price))
+
+def _shares(state, lp):
+    # ERC4626 conversion, an empty vault mints shares 1:1
+    if state['total_shares'] == 0:
+        return lp
+    return lp * state['total_shares'] / state['total_assets']
@@ -0,0 +1,156 @@
+# Profile the gas usage of `PoolGovernor.execute` on a mainnet fork.
+#
+# The execution is replayed and traced with `debug_traceTransaction`. Gas is attributed
+# to the source lines of the governor and to the external calls it makes. With `--patch`
+# the code of the live governor is swapped for the local build before replaying,
+# so optimizations can be measured against real epoch data.
+#
+# The fork should be pinned to a block where the epoch has been finalized
+# but not yet executed, e.g. the block before the original execute transaction.
+#
+#   ape run pool_governor_gas --network ethereum:mainnet-fork:foundry \
+#       --governor <address> --tx <execute tx hash> --patch --flamegraph execute.folded
+#
+# The flame graph is written in the folded stack format, which can be rendered with
+# `flamegraph.pl` or loaded directly into speedscope.
+
+import click
+from ape import accounts, chain, networks, project
+from ape.cli import ConnectedProviderCommand
+from eth_utils import function_signature_to_4byte_selector
+
+UNIT = 1_000_000_000_000_000_000
+IMMUTABLES_SIZE = 64 # genesis (32) | pool (32)
+CALL_OPS = ['CALL', 'STATICCALL', 'DELEGATECALL', 'CALLCODE']
+SIGNATURES = [
+    'num_assets()',
+    'amplification()',
+    'weight(uint256)',
+    'latest_finalized_epoch()',
+    'winners(uint256)',
+    'winner_rate_providers(uint256)',
+    'total_votes(uint256)',
+    'votes(uint256,uint256)',
+    'execute_single(address,bytes)',
+    'execute(address,bytes)',
+    'approve(address,uint256)',
+    'add_asset(address,address,uint256,uint256,uint256,uint256,uint256,uint256,address)',
+    'set_ramp(uint256,uint256[],uint256)',
+]
+SELECTORS = {function_signature_to_4byte_selector(s).hex(): s.split('(')[0] for s in SIGNATURES}
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--governor', required=True, help='Address of the deployed pool governor')
+@click.option('--tx', default=None, help='Execute transaction to take the parameters from')
+@click.option('--lower', default=0, help='Lower weight band (18 decimals)')
+@click.option('--upper', default=0, help='Upper weight band (18 decimals)')
+@click.option('--amount', default=0, help='Amount of new asset to add')
+@click.option('--amplification', default=0, help='Amplification to set when adding the asset')
+@click.option('--min-lp', default=0, help='Minimum amount of LP tokens')
+@click.option('--patch', is_flag=True, help='Replace the governor code with the local build')
+@click.option('--flamegraph', default=None, help='Write folded stacks to this file')
+def cli(governor, tx, lower, upper, amount, amplification, min_lp, patch, flamegraph):
+    governor = project.PoolGovernor.at(governor)
+    if tx is not None:
+        data = networks.provider.get_receipt(tx).transaction.data
+        _, args = governor.decode_input(data)
+        lower, upper, amount, amplification, min_lp = args.values()
+    elif amplification == 0:
+        amplification = governor.target_amplification()
+
+    if governor.latest_executed_epoch() >= governor.epoch() - 1:
+        raise click.ClickException('latest epoch already executed, fork at an earlier block')
+
+    runtime = project.PoolGovernor.contract_type.runtime_bytecode.bytecode
+    code = networks.provider.get_code(governor.address)
+    if patch:
+        code = bytes.fromhex(runtime[2:]) + code[-IMMUTABLES_SIZE:]
+        networks.provider.set_code(governor.address, code)
+    mapped = code[:-IMMUTABLES_SIZE].hex() == runtime[2:]
+    if not mapped:
+        click.echo('deployed code differs from local build, skipping line attribution')
+
+    operator = accounts[governor.operator()]
+    networks.provider.set_balance(operator.address, UNIT)
+    with chain.isolate():
+        receipt = governor.execute(lower, upper, amount, amplification, min_lp, sender=operator)
+        trace = networks.provider.make_request(
+            'debug_traceTransaction',
+            [receipt.txn_hash, {'enableMemory': True, 'disableStorage': True}]
+        )
+
+    names = {
+        governor.pool(): 'Pool',
+        governor.inclusion_vote(): 'InclusionVote',
+        governor.weight_vote(): 'WeightVote',
+        governor.executor(): 'Executor',
+    }
+    pcmap = project.PoolGovernor.contract_type.pcmap.parse() if mapped else {}
+    lines, calls = profile(trace['structLogs'], pcmap, names)
+
+    source = (project.contracts_folder / 'governance' / 'PoolGovernor.vy').read_text().split('\n')
+    click.echo(f'total gas: {receipt.gas_used}\n')
+    click.echo('gas by source line:')
+    for line, gas in sorted(lines.items(), key=lambda x: -x[1]):
+        text = source[line - 1].strip() if line > 0 else '<unmapped>'
+        click.echo(f'{str(gas).rjust(8)}  L{str(line).ljust(4)} {text}')
+
+    click.echo('\ngas by external call:')
+    for (line, call), (gas, count) in sorted(calls.items(), key=lambda x: -x[1][0]):
+        click.echo(f'{str(gas).rjust(8)}  {str(count).rjust(3)}x L{str(line).ljust(4)} {call}')
+
+    if flamegraph is not None:
+        with open(flamegraph, 'w') as f:
+            for line, gas in lines.items():
+                f.write(f'execute;L{line} {gas}\n')
+            for (line, call), (gas, _) in calls.items():
+                f.write(f'execute;L{line};{call} {gas}\n')
+        click.echo(f'\nfolded stacks written to {flamegraph}')
+
+def profile(logs, pcmap, names):
+    """
+    Attribute gas of the top level frame to source lines. Calls are attributed
+    inclusively, i.e. including all gas spent inside the callee.
+    Returns two dicts: line => gas and (line, call) => (gas, count)
+    """
+    lines = {}
+    calls = {}
+    depth = logs[0]['depth']
+    i = 0
+    while i < len(logs):
+        log = logs[i]
+        j = i + 1
+        while j < len(logs) and logs[j]['depth'] > depth:
+            j += 1
+        if j < len(logs):
+            gas = log['gas'] - logs[j]['gas']
+        else:
+            gas = log['gasCost']
+
+        item = pcmap.get(log['pc'])
+        line = item.line_start if item is not None and item.line_start is not None else 0
+        if log['op'] in CALL_OPS:
+            call = describe_call(log, names)
+            total, count = calls.get((line, call), (0, 0))
+            calls[(line, call)] = (total + gas, count + 1)
+        else:
+            lines[line] = lines.get(line, 0) + gas
+        i = j
+    return lines, calls
+
+def describe_call(log, names):
+    """
+    Describe a call by its target contract and function selector
+    """
+    stack = log['stack']
+    target = '0x' + format(int(stack[-2], 16) & (2**160 - 1), '040x')
+    offset = 3 if log['op'] in ['CALL', 'CALLCODE'] else 2
+    start = int(stack[-1 - offset], 16)
+    memory = ''.join(word.removeprefix('0x') for word in log.get('memory', []))
+    selector = memory[2*start:2*start+8]
+
+    name = target
+    for address, contract in names.items():
+        if address.lower() == target.lower():
+            name = contract
+    return f'{name}.{SELECTORS.get(selector, "0x" + selector)}'
@@ -0,0 +1,34 @@
+# Quote zap deposits for a set of candidate asset mixes.
+#
+#   ape run quote_zap --network ethereum:mainnet --zap <address> \
+#       --amounts 1,0,0,0,0,0,0 --amounts 0.5,0.5,0,0,0,0,0 --chain
+#
+# Amounts are in tokens, one per pool asset. Every candidate is quoted with the local pool
+# model and, with `--chain`, with the contract views. The candidate minting the most staking
+# shares per unit of deposited value is marked. See `pool/_zap.py`.
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+from pool._zap import best, quote, quote_chain, read_zap
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--zap', required=True, help='Address of the zap')
+@click.option('--amounts', required=True, multiple=True, help='Comma separated amounts of each asset, can be repeated')
+@click.option('--chain', is_flag=True, help='Also quote with the contract views')
+def cli(zap, amounts, chain):
+    state = read_zap(project.Zap.at(zap))
+    num_assets = len(state['vb'])
+    candidates = [[float(x) for x in row.split(',')] for row in amounts]
+    if any(len(row) != num_assets for row in candidates):
+        raise click.BadParameter(f'expected {num_assets} amounts per candidate', param_hint='--amounts')
+
+    lp, shares = quote(state, candidates)
+    if chain:
+        lp_chain, shares_chain = quote_chain(state, candidates)
+    idx = best(state, candidates, shares_chain if chain else shares)
+    for i, row in enumerate(candidates):
+        line = f'{"*" if i == idx else " "} {",".join(str(x) for x in row)}: {lp[i]:.6f} LP, {shares[i]:.6f} shares'
+        if chain:
+            line += f' (chain: {lp_chain[i]:.6f} LP, {shares_chain[i]:.6f} shares)'
+        click.echo(line)
@@ -0,0 +1,76 @@
+# Simulate the effects of generic governor proposals on a mainnet fork.
+#
+#   ape run simulate_proposal --network ethereum:mainnet-fork:foundry \
+#       --governor <address> --idx 12 --idx 13 --start-block 19000000
+#
+# Raw scripts can be simulated before they are proposed:
+#
+#   ape run simulate_proposal --network ethereum:mainnet-fork:foundry \
+#       --governor <address> --script 0x... --ipfs 0x...
+#
+# Each script is executed by the governor through the executor and ownership proxy.
+# The fork is restored after every simulation, so all proposals start from the same state.
+# Reported are the calls in the script, gas used, emitted events and the storage diff.
+
+import click
+from ape import project
+from ape.cli import ConnectedProviderCommand
+from governance._script import describe
+from governance._simulate import Simulator, proposal_script
+
+SIGNATURES = [
+    'transfer(address,uint256)',
+    'approve(address,uint256)',
+    'set_access(address,bytes4,uint256)',
+    'whitelist(address,bytes4,address,bool)',
+    'blacklist(address,bytes4,address,bool)',
+    'set_governor(address,bool)',
+    'set_management(address)',
+    'accept_management()',
+]
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--governor', required=True, help='Address of the generic governor')
+@click.option('--idx', multiple=True, type=int, help='Proposal index, can be repeated')
+@click.option('--script', default=None, help='Raw script to simulate instead of a proposal')
+@click.option('--ipfs', default=None, help='IPFS hash of the raw script')
+@click.option('--start-block', default=0, help='Block to start searching for proposals from')
+def cli(governor, idx, script, ipfs, start_block):
+    governor = project.GenericGovernor.at(governor)
+    executor = project.Executor.at(governor.executor())
+    names = {
+        governor.address: 'GenericGovernor',
+        executor.address: 'Executor',
+        executor.proxy(): 'OwnershipProxy',
+    }
+
+    scripts = []
+    for i in idx:
+        proposal_ipfs, proposal = proposal_script(governor, i, start_block)
+        scripts.append((f'proposal {i}', proposal_ipfs, proposal))
+    if script is not None:
+        scripts.append(('script', bytes.fromhex(ipfs.removeprefix('0x')) if ipfs else None, bytes.fromhex(script.removeprefix('0x'))))
+    if len(scripts) == 0:
+        raise click.ClickException('no proposal or script supplied')
+
+    simulator = Simulator(executor, governor)
+    for name, script_ipfs, data in scripts:
+        click.echo(f'=== {name}' + (f' (ipfs 0x{script_ipfs.hex()})' if script_ipfs else ''))
+        click.echo(describe(data, names, SIGNATURES))
+        result = simulator.simulate(data)
+        if result['reverted']:
+            click.echo(f'reverted: {result["error"]}\n')
+            continue
+
+        click.echo(f'gas: {result["gas"]}')
+        click.echo('events:')
+        for address, event, args in result['events']:
+            click.echo(f'  {names.get(address, address)}.{event or "<unknown>"} {args}')
+        click.echo('state diff:')
+        for address, changes in result['diff'].items():
+            click.echo(f'  {names.get(address, address)}')
+            if 'balance' in changes:
+                click.echo(f'    balance: {changes["balance"][0]} -> {changes["balance"][1]}')
+            for slot, (before, after) in changes.get('storage', {}).items():
+                click.echo(f'    0x{slot:064x}: 0x{before:064x} -> 0x{after:064x}')
+        click.echo()
@@ -0,0 +1,33 @@
+# Export the vote weight of a list of accounts to CSV.
+#
+#   ape run vote_weights --network ethereum:mainnet \
+#       --measure <address> --accounts accounts.txt --output weights.csv
+#
+# The accounts file contains one address per line. All weights are read at the same block.
+
+import click
+from ape import chain, project
+from ape.cli import ConnectedProviderCommand
+from governance._measure import CHUNK_SIZE, WORKERS, vote_weights
+
+UNIT = 1_000_000_000_000_000_000
+
+@click.command(cls=ConnectedProviderCommand)
+@click.option('--measure', required=True, help='Address of the vote weight measure')
+@click.option('--accounts', required=True, type=click.File('r'), help='File with one account per line')
+@click.option('--block', default=None, type=int, help='Block to query, defaults to the latest block')
+@click.option('--chunk-size', default=CHUNK_SIZE, help='Accounts per call')
+@click.option('--workers', default=WORKERS, help='Number of parallel calls')
+@click.option('--output', default='-', type=click.File('w'), help='CSV file to write')
+def cli(measure, accounts, block, chunk_size, workers, output):
+    measure = project.DelegateMeasure.at(measure)
+    accounts = [line.strip() for line in accounts if line.strip() != '']
+    if block is None:
+        block = chain.blocks.head.number
+
+    weights = vote_weights(measure, accounts, block, chunk_size, workers)
+    output.write('account,weight\n')
+    for account, weight in weights.items():
+        output.write(f'{account},{weight / UNIT}\n')
+    total = sum(weights.values())
+    click.echo(f'{len(weights)} accounts, total weight {total / UNIT} at block {block}', err=True)
@@ -9,7 +9,7 @@ PREV_WEIGHTS = [2676, 2602, 2459, 1198, 1065]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/1-weight.csv', len(ASSET_NAMES)+1)
+    total, votes = read_weight(1, len(ASSET_NAMES)+1)
 
     redistribute(total, votes)
     incentives(total, votes)
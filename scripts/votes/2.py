@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2657, 2528, 2363, 1382, 1070, 0]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/2-weight.csv', CHOICES)
+    total, votes = read_weight(2, CHOICES)
     redistribute(total, votes)
 
     total, votes = read_multiple_choice('votes/2-inclusion.csv', 4)
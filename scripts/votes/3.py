@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2702, 2284, 2261, 1529, 1124, 100, 0]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/3-weight.csv', CHOICES)
+    total, votes = read_weight(3, CHOICES)
     redistribute(total, votes)
 
 def redistribute(total, votes):
@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2559, 2066, 2087, 1448, 1042, 698, 100]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/4-weight.csv', CHOICES)
+    total, votes = read_weight(4, CHOICES)
     redistribute(total, votes)
     refund_incentives()
 
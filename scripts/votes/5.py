@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2356, 1874, 1883, 1309, 991, 996, 591, 0]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/5-weight.csv', CHOICES)
+    total, votes = read_weight(5, CHOICES)
     redistribute(total, votes)
 
     total, votes = read_multiple_choice('votes/5-inclusion.csv', 3)
@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2213, 1699, 1706, 1187, 925, 1386, 784, 100]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/6-weight.csv', CHOICES)
+    total, votes = read_weight(6, CHOICES)
     redistribute(total, votes)
 
 def redistribute(total, votes):
@@ -10,7 +10,7 @@ PREV_WEIGHTS = [2004, 1541, 1554, 1087, 857, 1881, 819, 257]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/7-weight.csv', CHOICES)
+    total, votes = read_weight(7, CHOICES)
     redistribute(total, votes)
 
 def redistribute(total, votes):
@@ -10,7 +10,7 @@ PREV_WEIGHTS = [1808, 1400, 1420, 999, 772, 2406, 801, 394]
 REDISTRIBUTE = UNIT//10
 
 def main():
-    total, votes = read_multiple_choice('votes/8-weight.csv', CHOICES)
+    total, votes = read_weight(8, CHOICES)
     redistribute(total, votes)
 
 def redistribute(total, votes):
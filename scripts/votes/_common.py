@@ -1,7 +1,10 @@
-from ape import Contract
+import os
+from ape import Contract, chain
+from _multicall import batched
 
 MERKLE_INCENTIVES = '0xAE9De8A3e62e8E2f1e3800d142D23527680a5179'
 UNIT = 1_000_000_000_000_000_000
+VOTE_SCALE = 10_000
 
 def read_multiple_choice(name, choices):
     out = {}
@@ -27,6 +30,37 @@ def read_multiple_choice(name, choices):
         total += sum(points)
     return total, out
 
+def read_weight_votes(voting, epoch, choices, start_block=0):
+    """
+    Rebuild the weight vote tally of an epoch from the on-chain `Vote` events.
+    Returns the same (total, votes) as `read_multiple_choice`, with votes rounded like the contract
+    and the total summed over the rounded votes. The tally is verified against the totals stored
+    in the contract, read in a single batch
+    """
+    out = {}
+    weight = 0
+    for log in voting.Vote.range(start_block, chain.blocks.height + 1, search_topics={'epoch': epoch}):
+        assert len(log.votes) <= choices, f'vote by {log.account} has more than {choices} choices'
+        points = [bps * log.weight // VOTE_SCALE for bps in log.votes]
+        out[log.account] = points + [0] * (choices - len(points))
+        weight += log.weight
+
+    total, *results = batched([(voting.total_votes, epoch)] + [(voting.votes, epoch, i) for i in range(choices)])
+    assert weight == total, 'vote weights do not match on-chain total'
+    assert multiple_choice_result(out, choices) == results, 'tally does not match on-chain votes'
+    return sum(results), out
+
+def read_weight(epoch, choices):
+    """
+    Weight vote tally of an epoch. Read from the on-chain `WeightVote` at `WEIGHT_VOTE` when
+    set, searching events from `WEIGHT_VOTE_START_BLOCK`, otherwise from the Snapshot export
+    """
+    address = os.environ.get('WEIGHT_VOTE')
+    if address:
+        start_block = int(os.environ.get('WEIGHT_VOTE_START_BLOCK', 0))
+        return read_weight_votes(Contract(address), epoch, choices, start_block)
+    return read_multiple_choice(f'votes/{epoch}-weight.csv', choices)
+
 def multiple_choice_result(votes, choices):
     results = [0 for _ in range(choices)]
     for _, vote in votes.items():
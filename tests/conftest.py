@@ -1,17 +1,38 @@
+import os
+import sys
 import pytest
+from pathlib import Path
 
-@pytest.fixture
+UNIT = 1_000_000_000_000_000_000
+
+# make the helper modules under `scripts/` importable, as they are for `ape run`
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+# When running in parallel (`ape test -n auto`), every pytest-xdist worker launches
+# its own anvil node on a random port. All nodes fork from the same upstream,
+# which can be the state pack served by `scripts/fork_state.py`.
+if 'PYTEST_XDIST_WORKER' in os.environ:
+    os.environ['APE_FOUNDRY_HOST'] = 'auto'
+
+@pytest.fixture(scope='session')
 def deployer(accounts):
     return accounts[0]
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def alice(accounts):
     return accounts[1]
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def bob(accounts):
     return accounts[2]
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def charlie(accounts):
     return accounts[3]
+
+@pytest.fixture
+def receiver(networks, accounts):
+    # fresh account without any prior state, funded to send transactions
+    receiver = accounts.generate_test_account()
+    networks.provider.set_balance(receiver.address, UNIT)
+    return receiver
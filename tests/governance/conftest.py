@@ -0,0 +1,60 @@
+import pytest
+
+WEEK = 7 * 24 * 60 * 60
+EPOCH_LENGTH = 4 * WEEK
+PHASES = {
+    'propose': 0, # first three weeks: proposals and applications
+    'vote': 3 * WEEK, # final week: voting
+    'enact': EPOCH_LENGTH, # start of next epoch: finalization and enactment
+}
+
+# The governance stack is deployed once per session and configured once per module.
+# Ape takes a chain snapshot around every test and reverts to it afterwards,
+# so state changes made by a test never leak into the next one.
+
+@pytest.fixture(scope='session')
+def measure(project, deployer):
+    return project.MockMeasure.deploy(sender=deployer)
+
+@pytest.fixture(scope='session')
+def proxy(project, deployer):
+    return project.OwnershipProxy.deploy(sender=deployer)
+
+@pytest.fixture(scope='session')
+def executor(project, deployer, proxy):
+    executor = project.Executor.deploy(proxy, sender=deployer)
+    data = proxy.set_management.encode_input(executor)
+    proxy.execute(proxy, data, sender=deployer)
+    return executor
+
+@pytest.fixture(scope='session')
+def token(project, deployer):
+    return project.MockToken.deploy(sender=deployer)
+
+class Travel:
+    """
+    Move the chain to a named phase of an epoch by setting the timestamp once,
+    instead of accumulating offsets. Snapshots can be stored per phase to branch
+    multiple scenarios off the same point.
+    """
+    def __init__(self, chain, genesis):
+        self.chain = chain
+        self.genesis = genesis
+        self.snapshots = {}
+
+    def __call__(self, epoch, phase='propose', offset=0, mine=False):
+        self.chain.pending_timestamp = self.genesis + epoch * EPOCH_LENGTH + PHASES[phase] + offset
+        if mine:
+            self.chain.mine()
+
+    def snapshot(self, epoch, phase):
+        self.snapshots[(epoch, phase)] = self.chain.snapshot()
+
+    def restore(self, epoch, phase):
+        # snapshots are consumed on restore, take a new one to allow restoring again
+        self.chain.restore(self.snapshots[(epoch, phase)])
+        self.snapshot(epoch, phase)
+
+@pytest.fixture
+def travel(chain, genesis):
+    return Travel(chain, genesis)
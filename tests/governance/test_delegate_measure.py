@@ -12,23 +12,23 @@ DAY_LENGTH = 24 * 60 * 60
 WEEK_LENGTH = 7 * DAY_LENGTH
 EPOCH_LENGTH = 4 * WEEK_LENGTH
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def token():
     return ape.Contract(TOKEN)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def staking():
     return ape.Contract(STAKING)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def bootstrap():
     return ape.Contract(BOOTSTRAP)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dstaking(project, deployer, staking):
-    return project.DelegatedStaking.deploy(staking, sender=deployer)
+    return project.DelegatedStaking.deploy(staking, False, sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def measure(project, deployer, staking, bootstrap, dstaking):
     return project.DelegateMeasure.deploy(staking, bootstrap, dstaking, sender=deployer)
 
@@ -58,6 +58,23 @@ def test_delegate_weight(chain, accounts, deployer, token, staking, dstaking, me
     assert after > before
     assert after == before + UNIT // 2
 
+def test_vote_weights(chain, accounts, deployer, alice, token, staking, bootstrap, dstaking, measure):
+    management = accounts[token.management()]
+    token.set_minter(deployer, sender=management)
+    token.mint(deployer, UNIT, sender=deployer)
+    token.approve(staking, UNIT, sender=deployer)
+    staking.mint(UNIT, sender=deployer)
+    staking.approve(dstaking, UNIT, sender=deployer)
+    dstaking.deposit(UNIT, sender=deployer)
+    measure.set_delegate_multiplier(5000, sender=deployer)
+    measure.delegate(deployer, YCHAD, sender=deployer)
+
+    chain.pending_timestamp += WEEK_LENGTH
+    chain.mine()
+
+    accounts = [YCHAD, deployer, alice, bootstrap]
+    assert measure.vote_weights(accounts) == [measure.vote_weight(account) for account in accounts]
+
 def test_multiple_delegate(deployer, alice, bob, measure):
     measure.delegate(alice, deployer, sender=deployer)
     assert measure.delegator(alice) == deployer
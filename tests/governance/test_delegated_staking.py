@@ -4,13 +4,18 @@ import pytest
 UNIT = 1_000_000_000_000_000_000
 WEEK_LENGTH = 7 * 24 * 60 * 60
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def staking(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dstaking(project, deployer, staking):
-    return project.DelegatedStaking.deploy(staking, sender=deployer)
+    return project.DelegatedStaking.deploy(staking, True, sender=deployer)
+
+@pytest.fixture
+def genesis(chain):
+    # checkpoints are per week, count from the start of the current week
+    return chain.pending_timestamp // WEEK_LENGTH * WEEK_LENGTH
 
 def test_deposit(chain, alice, bob, staking, dstaking):
     assert staking.balanceOf(dstaking) == 0
@@ -296,3 +301,38 @@ def test_redeem_from(chain, alice, bob, charlie, staking, dstaking):
 
     with ape.reverts():
         dstaking.redeem(UNIT, charlie, bob, sender=alice)
+
+def test_vote_weight_at(project, travel, genesis, deployer, alice, bob, staking, dstaking):
+    staking.mint(alice, 10 * UNIT, sender=alice)
+    staking.approve(dstaking, 10 * UNIT, sender=alice)
+    week = genesis // WEEK_LENGTH
+
+    # week 0: deposit 3, week 1: nothing, week 2: deposit 2 and transfer 1, week 3: withdraw 4
+    dstaking.deposit(3 * UNIT, sender=alice)
+    travel(0, offset=2 * WEEK_LENGTH)
+    dstaking.deposit(2 * UNIT, sender=alice)
+    dstaking.transfer(bob, UNIT, sender=alice)
+    travel(0, offset=3 * WEEK_LENGTH)
+    dstaking.withdraw(4 * UNIT, sender=alice)
+    travel(1, mine=True)
+    assert dstaking.num_checkpoints(alice) == 3
+    assert dstaking.num_checkpoints(bob) == 1
+
+    # future weeks are not final
+    with ape.reverts():
+        dstaking.vote_weight_at(alice, week + 4)
+
+    assert dstaking.vote_weight_at(alice, week - 1) == 0
+    assert dstaking.vote_weight_at(alice, week) == 3 * UNIT
+    assert dstaking.vote_weight_at(alice, week + 1) == 3 * UNIT
+    assert dstaking.vote_weight_at(alice, week + 2) == 4 * UNIT
+    assert dstaking.vote_weight_at(alice, week + 3) == 0
+    assert dstaking.vote_weight_at(alice, week + 3) == dstaking.vote_weight(alice)
+    assert dstaking.vote_weight_at(bob, week + 1) == 0
+    assert dstaking.vote_weight_at(bob, week + 2) == UNIT
+    assert dstaking.vote_weight_at(bob, week + 3) == UNIT
+
+    # history is optional
+    dstaking2 = project.DelegatedStaking.deploy(staking, False, sender=deployer)
+    with ape.reverts():
+        dstaking2.vote_weight_at(alice, week)
@@ -7,15 +7,8 @@ ACCESS_NONE = 0
 ACCESS_WHITELIST = 1
 ACCESS_BLACKLIST = 2
 
-@pytest.fixture
-def proxy(project, deployer):
-    return project.OwnershipProxy.deploy(sender=deployer)
-
-@pytest.fixture
-def executor(project, deployer, alice, bob, proxy):
-    executor = project.Executor.deploy(proxy, sender=deployer)
-    data = proxy.set_management.encode_input(executor)
-    proxy.execute(proxy, data, sender=deployer)
+@pytest.fixture(scope='module')
+def executor(deployer, alice, bob, executor):
     assert not executor.governors(alice)
     executor.set_governor(alice, True, sender=deployer)
     assert executor.governors(alice)
@@ -23,10 +16,6 @@ def executor(project, deployer, alice, bob, proxy):
     executor.set_governor(deployer, False, sender=deployer)
     return executor
 
-@pytest.fixture
-def token(project, deployer):
-    return project.MockToken.deploy(sender=deployer)
-
 def test_execute_single(deployer, alice, proxy, executor, token):
     token.mint(proxy, UNIT, sender=deployer)
     data = token.transfer.encode_input(alice, UNIT)
@@ -268,4 +257,48 @@ def test_management_proxy(deployer, alice, bob, proxy, executor, token):
         executor.execute_single(token, data, sender=bob)
     
     executor.execute_single(token, data, sender=alice)
-    assert token.balanceOf(deployer) == UNIT
\ No newline at end of file
+    assert token.balanceOf(deployer) == UNIT
+
+def test_execute_repeated_access_change(deployer, alice, proxy, executor, token):
+    executor.set_management(proxy, sender=deployer)
+    executor.execute_single(executor, executor.accept_management.encode_input(), sender=alice)
+
+    token.mint(proxy, 2 * UNIT, sender=deployer)
+    transfer = token.transfer.encode_input(alice, UNIT)
+    selector = transfer[:4].hex()
+    enable_whitelist = executor.set_access.encode_input(token, selector, ACCESS_WHITELIST)
+    whitelist = executor.whitelist.encode_input(token, selector, alice, True)
+
+    # access change halfway through the script applies to the later calls
+    script = executor.script(token, transfer) + executor.script(executor, enable_whitelist) + executor.script(token, transfer)
+    with ape.reverts():
+        executor.execute(script, sender=alice)
+
+    script = executor.script(token, transfer) + executor.script(executor, enable_whitelist) + \
+        executor.script(executor, whitelist) + executor.script(token, transfer)
+    executor.execute(script, sender=alice)
+    assert token.balanceOf(alice) == 2 * UNIT
+
+def test_check_script(deployer, alice, bob, proxy, executor, token):
+    mint = token.mint.encode_input(proxy, UNIT)
+    transfer = token.transfer.encode_input(alice, UNIT)
+    script = executor.script(token, mint) + executor.script(token, transfer)
+    selector = transfer[:4].hex()
+
+    assert executor.check_script(alice, script)
+    assert executor.check_script(bob, script)
+    assert not executor.check_script(deployer, script)
+
+    executor.set_access(token, selector, ACCESS_BLACKLIST, sender=deployer)
+    executor.blacklist(token, selector, bob, True, sender=deployer)
+    assert executor.check_script(alice, script)
+    assert not executor.check_script(bob, script)
+
+    executor.set_access(token, selector, ACCESS_WHITELIST, sender=deployer)
+    assert not executor.check_script(alice, script)
+    executor.whitelist(token, selector, alice, True, sender=deployer)
+    assert executor.check_script(alice, script)
+
+    # malformed script
+    with ape.reverts():
+        executor.check_script(alice, script[:-1])
@@ -2,7 +2,6 @@ import ape
 import pytest
 
 WEEK = 7 * 24 * 60 * 60
-VOTE_START = 3 * WEEK
 EPOCH_LENGTH = 4 * WEEK
 UNIT = 1_000_000_000_000_000_000
 CID = '0x0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF'
@@ -15,33 +14,22 @@ STATE_RETRACTED = 4
 STATE_CANCELLED = 5
 STATE_ENACTED   = 6
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
-def proxy(project, deployer):
-    return project.OwnershipProxy.deploy(sender=deployer)
-
-@pytest.fixture
-def executor(project, deployer, proxy):
-    executor = project.Executor.deploy(proxy, sender=deployer)
-    data = proxy.set_management.encode_input(executor)
-    proxy.execute(proxy, data, sender=deployer)
+@pytest.fixture(scope='module')
+def executor(deployer, executor):
     executor.set_governor(deployer, False, sender=deployer)
     return executor
 
-@pytest.fixture
-def token(project, deployer):
-    return project.MockToken.deploy(sender=deployer)
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def governor(chain, project, deployer, measure, executor):
     governor = project.GenericGovernor.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, executor, 0, 5000, 0, sender=deployer)
     executor.set_governor(governor, True, sender=deployer)
     return governor
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def genesis(governor):
+    return governor.genesis()
+
+@pytest.fixture(scope='module')
 def script(alice, proxy, executor, token):
     mint = token.mint.encode_input(proxy, UNIT)
     transfer = token.transfer.encode_input(alice, UNIT)
@@ -66,9 +54,8 @@ def test_propose_min_weight(deployer, alice, measure, governor, script):
     assert governor.proposal_state(idx) == STATE_PROPOSED
     assert governor.proposal(idx)['author'] == alice.address
 
-def test_propose_closed(chain, deployer, governor, script):
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+def test_propose_closed(travel, deployer, governor, script):
+    travel(1, 'vote', mine=True)
     assert not governor.propose_open()
     with ape.reverts():
         governor.propose(CID, script, sender=deployer)
@@ -80,9 +67,9 @@ def test_retract_proposal(alice, bob, governor, script):
     governor.retract(idx, sender=alice)
     assert governor.proposal_state(idx) == STATE_RETRACTED
 
-def test_retract_proposal_too_late(chain, alice, governor, script):
+def test_retract_proposal_too_late(travel, alice, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     with ape.reverts():
         governor.retract(idx, sender=alice)
     assert governor.proposal_state(idx) == STATE_PROPOSED
@@ -94,12 +81,11 @@ def test_cancel_proposal(deployer, alice, governor, script):
     governor.cancel(idx, sender=deployer)
     assert governor.proposal_state(idx) == STATE_CANCELLED
 
-def test_vote_yea(chain, alice, bob, measure, governor, script):
+def test_vote_yea(travel, alice, bob, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+    travel(1, 'vote', mine=True)
     assert governor.vote_open()
 
     # no voting power
@@ -121,12 +107,11 @@ def test_vote_yea(chain, alice, bob, measure, governor, script):
     governor.vote_yea(idx, sender=bob)
     assert governor.proposal(idx).yea == 3 * UNIT
 
-def test_vote_nay(chain, alice, bob, measure, governor, script):
+def test_vote_nay(travel, alice, bob, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+    travel(1, 'vote', mine=True)
     assert governor.vote_open()
 
     # no voting power
@@ -148,12 +133,11 @@ def test_vote_nay(chain, alice, bob, measure, governor, script):
     governor.vote_nay(idx, sender=bob)
     assert governor.proposal(idx).nay == 3 * UNIT
 
-def test_vote_abstain(chain, alice, bob, measure, governor, script):
+def test_vote_abstain(travel, alice, bob, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+    travel(1, 'vote', mine=True)
     assert governor.vote_open()
 
     # no voting power
@@ -175,13 +159,12 @@ def test_vote_abstain(chain, alice, bob, measure, governor, script):
     governor.vote_abstain(idx, sender=bob)
     assert governor.proposal(idx).abstain == 3 * UNIT
 
-def test_vote(chain, alice, bob, measure, governor, script):
+def test_vote(travel, alice, bob, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
 
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+    travel(1, 'vote', mine=True)
     assert governor.vote_open()
 
     # no voting power
@@ -216,98 +199,128 @@ def test_vote(chain, alice, bob, measure, governor, script):
     assert governor.proposal(idx).nay == 13 * UNIT
     assert governor.proposal(idx).abstain == 5 * UNIT
 
-def test_vote_retracted(chain, alice, measure, governor, script):
+def test_vote_many(travel, alice, bob, measure, governor, script):
+    idx1 = governor.propose(CID, script, sender=alice).return_value
+    idx2 = governor.propose(CID, script, sender=alice).return_value
+    idx3 = governor.propose(CID, script, sender=alice).return_value
+
+    # vote not open
+    measure.set_vote_weight(bob, UNIT, sender=bob)
+    with ape.reverts():
+        governor.vote_many([idx1], [10000], [0], [0], sender=bob)
+
+    travel(1, 'vote')
+
+    # lengths must match
+    with ape.reverts():
+        governor.vote_many([idx1, idx2], [10000], [0], [0], sender=bob)
+
+    # fractions must add up
+    with ape.reverts():
+        governor.vote_many([idx1, idx2], [10000, 5000], [0, 0], [0, 0], sender=bob)
+
+    # cant vote on the same proposal twice
+    with ape.reverts():
+        governor.vote_many([idx1, idx1], [10000, 10000], [0, 0], [0, 0], sender=bob)
+
+    governor.vote_many([idx1, idx2, idx3], [10000, 0, 2000], [0, 10000, 3000], [0, 0, 5000], sender=bob)
+    assert governor.voted(bob, idx1)
+    assert governor.voted(bob, idx2)
+    assert governor.voted(bob, idx3)
+    assert governor.proposal(idx1).yea == UNIT
+    assert governor.proposal(idx2).nay == UNIT
+    assert governor.proposal(idx3).yea == UNIT * 2 // 10
+    assert governor.proposal(idx3).nay == UNIT * 3 // 10
+    assert governor.proposal(idx3).abstain == UNIT * 5 // 10
+
+    with ape.reverts():
+        governor.vote_yea(idx1, sender=bob)
+
+def test_vote_retracted(travel, alice, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
 
     idx = governor.propose(CID, script, sender=alice).return_value
     governor.retract(idx, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     with ape.reverts():
         governor.vote_yea(idx, sender=alice)
 
-def test_vote_cancelled(chain, deployer, alice, measure, governor, script):
+def test_vote_cancelled(travel, deployer, alice, measure, governor, script):
     assert governor.propose_open()
     assert not governor.vote_open()
 
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.cancel(idx, sender=deployer)
     with ape.reverts():
         governor.vote_yea(idx, sender=alice)
 
-def test_vote_closed_no_votes(chain, alice, governor, script):
+def test_vote_closed_no_votes(travel, alice, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += 4 * WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_no_counted_votes(chain, alice, measure, governor, script):
+def test_vote_closed_no_counted_votes(travel, alice, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_abstain(idx, sender=alice)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_yea(chain, alice, bob, measure, governor, script):
+def test_vote_closed_yea(travel, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, 2 * UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
     measure.set_vote_weight(bob, UNIT, sender=alice)
     governor.vote_nay(idx, sender=bob)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_PASSED
 
     # not executed in same epoch
-    chain.pending_timestamp += 4 * WEEK
-    chain.mine()
+    travel(2, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_yea_abstain(chain, alice, bob, measure, governor, script):
+def test_vote_closed_yea_abstain(travel, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
     measure.set_vote_weight(bob, 4 * UNIT, sender=alice)
     governor.vote_abstain(idx, sender=bob)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_PASSED
 
-def test_vote_closed_nay(chain, alice, bob, measure, governor, script):
+def test_vote_closed_nay(travel, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, 2 * UNIT, sender=alice)
     governor.vote_nay(idx, sender=alice)
     measure.set_vote_weight(bob, UNIT, sender=alice)
     governor.vote_yea(idx, sender=bob)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_nay_abstain(chain, alice, bob, measure, governor, script):
+def test_vote_closed_nay_abstain(travel, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_nay(idx, sender=alice)
     measure.set_vote_weight(bob, 4 * UNIT, sender=alice)
     governor.vote_abstain(idx, sender=bob)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_supermajority_yea(chain, deployer, alice, measure, governor, script):
+def test_vote_closed_supermajority_yea(travel, deployer, alice, measure, governor, script):
     # majority needs to be at least 50%
     with ape.reverts():
         governor.set_majority(4000, sender=deployer)
@@ -318,72 +331,67 @@ def test_vote_closed_supermajority_yea(chain, deployer, alice, measure, governor
     assert governor.previous_majority() == 5000
 
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote(idx, 7000, 3000, 0, sender=alice)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_PASSED
 
-def test_vote_closed_supermajority_nay(chain, deployer, alice, measure, governor, script):
+def test_vote_closed_supermajority_nay(travel, deployer, alice, measure, governor, script):
     governor.set_majority(6666, sender=deployer)
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote(idx, 6000, 4000, 0, sender=alice)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_vote_closed_quorum(chain, deployer, alice, measure, governor, script):
+def test_vote_closed_quorum(travel, deployer, alice, measure, governor, script):
     governor.set_quorum(2 * UNIT, sender=deployer)
     assert governor.previous_quorum() == 0
     governor.set_quorum(UNIT, sender=deployer)
     assert governor.previous_quorum() == 0
 
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, 2 * UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_PASSED
 
-def test_vote_closed_quorum_abstain(chain, deployer, alice, bob, measure, governor, script):
+def test_vote_closed_quorum_abstain(travel, deployer, alice, bob, measure, governor, script):
     governor.set_quorum(2 * UNIT, sender=deployer)
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     measure.set_vote_weight(bob, UNIT, sender=bob)
     governor.vote_yea(idx, sender=alice)
     governor.vote_abstain(idx, sender=bob)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_PASSED
 
-def test_vote_closed_no_quorum(chain, deployer, alice, measure, governor, script):
+def test_vote_closed_no_quorum(travel, deployer, alice, measure, governor, script):
     governor.set_quorum(2 * UNIT, sender=deployer)
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert governor.proposal_state(idx) == STATE_REJECTED
 
-def test_execute(chain, alice, bob, measure, token, governor, script):
+def test_execute(travel, alice, bob, measure, token, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
     # cannot retract after vote closed
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     with ape.reverts():
         governor.retract(idx, sender=alice)
 
@@ -397,14 +405,14 @@ def test_execute(chain, alice, bob, measure, token, governor, script):
     with ape.reverts():
         governor.enact(idx, script, sender=bob)
 
-def test_execute_different(chain, alice, bob, measure, proxy, executor, token, governor, script):
+def test_execute_different(travel, alice, bob, measure, proxy, executor, token, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
     # cant execute different script
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     mint = token.mint.encode_input(proxy, UNIT)
     transfer = token.transfer.encode_input(bob, UNIT)
     script2 = executor.script(token, mint) + executor.script(token, transfer)
@@ -412,54 +420,54 @@ def test_execute_different(chain, alice, bob, measure, proxy, executor, token, g
         governor.enact(idx, script2, sender=bob)
     governor.enact(idx, script, sender=bob)
 
-def test_execute_delay(chain, deployer, alice, bob, measure, token, governor, script):
+def test_execute_delay(travel, deployer, alice, bob, measure, token, governor, script):
     governor.set_delay(100, sender=deployer)
     assert governor.previous_delay() == 0
     governor.set_delay(3600, sender=deployer)
     assert governor.previous_delay() == 0
 
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
     # cant execute before delay
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     with ape.reverts():
         governor.enact(idx, script, sender=bob)
 
-    chain.pending_timestamp += 3600
+    travel(1, 'enact', 3600)
     assert token.balanceOf(alice) == 0
     governor.enact(idx, script, sender=bob)
     assert token.balanceOf(alice) == UNIT
     assert governor.proposal_state(idx) == STATE_ENACTED
 
-def test_execute_cancelled(chain, deployer, alice, bob, measure, governor, script):
+def test_execute_cancelled(travel, deployer, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
     
     # cant execute cancelled proposal
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     governor.cancel(idx, sender=deployer)
     with ape.reverts():
         governor.enact(idx, script, sender=bob)
 
-def test_execute_too_late(chain, alice, bob, measure, governor, script):
+def test_execute_too_late(travel, alice, bob, measure, governor, script):
     idx = governor.propose(CID, script, sender=alice).return_value
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx, sender=alice)
 
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     assert governor.update_proposal_state(idx, sender=alice).return_value == STATE_PASSED
 
-    chain.pending_timestamp += EPOCH_LENGTH
+    travel(2, 'enact')
     with ape.reverts():
         governor.enact(idx, script, sender=bob)
 
-def test_management_proxy(chain, deployer, alice, bob, measure, proxy, executor, governor):
+def test_management_proxy(travel, deployer, alice, bob, measure, proxy, executor, governor):
     # transfer executor+governor management to proxy
     executor.set_management(proxy, sender=deployer)
     governor.set_management(proxy, sender=deployer)
@@ -476,7 +484,7 @@ def test_management_proxy(chain, deployer, alice, bob, measure, proxy, executor,
     idx_accept2 = governor.propose(CID, accept2, sender=alice).return_value
     idx_delay = governor.propose(CID, delay, sender=alice).return_value
 
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote_yea(idx_accept1, sender=alice)
     governor.vote_yea(idx_set_governor, sender=alice)
@@ -484,7 +492,7 @@ def test_management_proxy(chain, deployer, alice, bob, measure, proxy, executor,
     governor.vote_yea(idx_delay, sender=alice)
 
     # cannot add governor before accepting executor management
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     with ape.reverts():
         governor.enact(idx_set_governor, set_governor, sender=bob)
 
@@ -497,7 +505,7 @@ def test_management_proxy(chain, deployer, alice, bob, measure, proxy, executor,
     assert executor.governors(alice)
 
     # cannot set delay before accepting governor management
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact', WEEK)
     with ape.reverts():
         governor.enact(idx_delay, delay, sender=bob)
 
@@ -509,7 +517,7 @@ def test_management_proxy(chain, deployer, alice, bob, measure, proxy, executor,
     governor.enact(idx_delay, delay, sender=bob)
     assert governor.delay() == 3600
 
-def test_ordering(chain, deployer, alice, measure, token, proxy, executor, governor, script):
+def test_ordering(chain, travel, deployer, alice, measure, token, proxy, executor, governor, script):
     # setting parameters on governor should not affect this epoch
     executor.set_governor(deployer, True, sender=deployer)
     governor.set_management(proxy, sender=deployer)
@@ -520,11 +528,11 @@ def test_ordering(chain, deployer, alice, measure, token, proxy, executor, gover
     script2 = executor.script(governor, governor.set_majority.encode_input(8000))
     idx2 = governor.propose(CID, script2, sender=alice).return_value
 
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     governor.vote(idx1, 5000, 5000, 0, sender=alice)
     governor.vote_yea(idx2, sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
 
     # transfer tokens first, set majority after
     with chain.isolate():
@@ -536,3 +544,16 @@ def test_ordering(chain, deployer, alice, measure, token, proxy, executor, gover
     governor.enact(idx2, script2, sender=alice)
     governor.enact(idx1, script, sender=alice)
     assert token.balanceOf(alice) == UNIT
+
+def test_vote_branches(travel, alice, measure, governor, script):
+    # branch multiple outcomes off the same vote phase
+    idx = governor.propose(CID, script, sender=alice).return_value
+    travel(1, 'vote')
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    travel.snapshot(1, 'vote')
+
+    for yea, nay, state in [(10000, 0, STATE_PASSED), (0, 10000, STATE_REJECTED), (5000, 5000, STATE_REJECTED)]:
+        travel.restore(1, 'vote')
+        governor.vote(idx, yea, nay, 0, sender=alice)
+        travel(1, 'enact', mine=True)
+        assert governor.proposal_state(idx) == state
@@ -10,29 +10,25 @@ RATE_PROVIDER = '0x1234123412341234123412341234123412341234'
 RATE_PROVIDER2 = '0x5678567856785678567856785678567856785678'
 APPLICATION_DISABLED = '0x0000000000000000000000000000000000000001'
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
-def token(project, deployer):
-    return project.MockToken.deploy(sender=deployer)
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def token2(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def incentive_token(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def voting(chain, project, deployer, measure):
     voting = project.InclusionVote.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, ZERO_ADDRESS, sender=deployer)
     voting.set_enable_epoch(1, sender=deployer)
     return voting
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def genesis(voting):
+    return voting.genesis()
+
+@pytest.fixture(scope='module')
 def incentives(project, deployer, voting):
     return project.InclusionIncentives.deploy(voting, sender=deployer)
 
@@ -48,16 +44,34 @@ def test_deposit(alice, token, incentive_token, incentives):
     assert incentives.incentives_depositor(alice, epoch, token, incentive_token) == UNIT
     assert incentives.unclaimed(epoch, incentive_token) == UNIT
 
-def test_deposit_deadline(chain, deployer, alice, token, incentive_token, incentives):
+def test_deposit_register(alice, token, token2, incentive_token, incentives):
+    epoch = incentives.epoch()
+    incentive_token.mint(alice, 3 * UNIT, sender=alice)
+    incentive_token.approve(incentives, 3 * UNIT, sender=alice)
+    token2.mint(alice, UNIT, sender=alice)
+    token2.approve(incentives, UNIT, sender=alice)
+    assert incentives.num_tokens(epoch) == 0
+
+    # tokens are registered once per epoch
+    incentives.deposit(token, incentive_token, UNIT, sender=alice)
+    incentives.deposit(token2, incentive_token, UNIT, sender=alice)
+    incentives.deposit(ZERO_ADDRESS, token2, UNIT, sender=alice)
+    incentives.deposit(token, incentive_token, UNIT, sender=alice)
+    assert incentives.num_tokens(epoch) == 2
+    assert incentives.tokens(epoch, 0) == incentive_token.address
+    assert incentives.tokens(epoch, 1) == token2.address
+    assert incentives.token_registered(epoch, token2)
+
+def test_deposit_deadline(travel, deployer, alice, token, incentive_token, incentives):
     incentive_token.mint(alice, UNIT, sender=alice)
     incentive_token.approve(incentives, UNIT, sender=alice)
     incentives.set_deposit_deadline(VOTE_START, sender=deployer)
 
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     with ape.reverts():
         incentives.deposit(token, incentive_token, UNIT, sender=alice)
 
-def test_claim(chain, deployer, alice, bob, measure, token, incentive_token, voting, incentives):
+def test_claim(travel, deployer, alice, bob, measure, token, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentive_token.mint(alice, 6 * UNIT, sender=alice)
     incentive_token.approve(incentives, 6 * UNIT, sender=alice)
@@ -66,10 +80,10 @@ def test_claim(chain, deployer, alice, bob, measure, token, incentive_token, vot
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
     measure.set_vote_weight(bob, 2 * UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([10000, 0], sender=alice)
     voting.vote([0, 10000], sender=bob)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=alice)
     assert voting.winners(epoch) == token.address
 
@@ -90,7 +104,37 @@ def test_claim(chain, deployer, alice, bob, measure, token, incentive_token, vot
     incentives.claim(epoch, incentive_token, bob, sender=bob)
     assert incentive_token.balanceOf(bob) == 4 * UNIT
 
-def test_claim_fee(chain, deployer, alice, measure, token, incentive_token, voting, incentives):
+def test_claimable_all(travel, deployer, alice, bob, measure, token, token2, incentive_token, voting, incentives):
+    epoch = incentives.epoch()
+    incentive_token.mint(alice, 6 * UNIT, sender=alice)
+    incentive_token.approve(incentives, 6 * UNIT, sender=alice)
+    incentives.deposit(token, incentive_token, 6 * UNIT, sender=alice)
+    token2.mint(alice, 3 * UNIT, sender=alice)
+    token2.approve(incentives, 3 * UNIT, sender=alice)
+    incentives.deposit(token, token2, 3 * UNIT, sender=alice)
+    voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
+    voting.apply(token, sender=alice)
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, 2 * UNIT, sender=alice)
+    travel(1, 'vote')
+    voting.vote([10000, 0], sender=alice)
+    voting.vote([0, 10000], sender=bob)
+
+    # nothing claimable before finalization
+    tokens = [incentive_token.address, token2.address]
+    assert incentives.claimable_all(alice, epoch) == (tokens, [0, 0])
+
+    travel(1, 'enact')
+    voting.finalize_epochs(sender=alice)
+    assert incentives.claimable_all(alice, epoch) == (tokens, [2 * UNIT, UNIT])
+    assert incentives.claimable_all(bob, epoch) == (tokens, [4 * UNIT, 2 * UNIT])
+    assert incentives.claimable_all(bob, epoch, 1) == ([token2.address], [2 * UNIT])
+    assert incentives.claimable_all(bob, epoch, 2) == ([], [])
+
+    incentives.claim(epoch, incentive_token, sender=bob)
+    assert incentives.claimable_all(bob, epoch) == (tokens, [0, 2 * UNIT])
+
+def test_claim_fee(travel, deployer, alice, measure, token, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentives.set_fee_rate(1000, sender=deployer)
     incentive_token.mint(alice, 10 * UNIT, sender=alice)
@@ -99,9 +143,9 @@ def test_claim_fee(chain, deployer, alice, measure, token, incentive_token, voti
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([0, 10000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=alice)
 
     assert incentives.claimable(epoch, incentive_token, alice) == 9 * UNIT
@@ -111,13 +155,12 @@ def test_claim_fee(chain, deployer, alice, measure, token, incentive_token, voti
     assert incentives.unclaimed(epoch, incentive_token) == UNIT
 
     # claim fee through a sweep
-    chain.pending_timestamp += EPOCH_LENGTH
-    chain.mine()
+    travel(2, 'enact', mine=True)
     assert incentives.sweepable(epoch, incentive_token) == UNIT
     incentives.sweep(epoch, incentive_token, sender=deployer)
     assert incentive_token.balanceOf(deployer) == UNIT
 
-def test_refund(chain, deployer, alice, bob, measure, token, incentive_token, voting, incentives):
+def test_refund(travel, deployer, alice, bob, measure, token, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentive_token.mint(alice, UNIT, sender=alice)
     incentive_token.approve(incentives, UNIT, sender=alice)
@@ -125,9 +168,9 @@ def test_refund(chain, deployer, alice, bob, measure, token, incentive_token, vo
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([10000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=alice)
     assert voting.winners(epoch) == ZERO_ADDRESS
 
@@ -143,7 +186,7 @@ def test_refund(chain, deployer, alice, bob, measure, token, incentive_token, vo
     assert incentives.unclaimed(epoch, incentive_token) == 0
     assert incentive_token.balanceOf(alice) == UNIT
 
-def test_sweep(chain, deployer, alice, bob, charlie, measure, token, incentive_token, voting, incentives):
+def test_sweep(travel, deployer, alice, bob, charlie, measure, token, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentive_token.mint(alice, 6 * UNIT, sender=alice)
     incentive_token.approve(incentives, 6 * UNIT, sender=alice)
@@ -152,10 +195,10 @@ def test_sweep(chain, deployer, alice, bob, charlie, measure, token, incentive_t
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
     measure.set_vote_weight(bob, 2 * UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([10000, 0], sender=alice)
     voting.vote([0, 10000], sender=bob)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=alice)
     incentives.claim(epoch, incentive_token, alice, sender=bob)
 
@@ -165,8 +208,7 @@ def test_sweep(chain, deployer, alice, bob, charlie, measure, token, incentive_t
         incentives.sweep(epoch, incentive_token, sender=deployer)
 
     # sweep unclaimed incentives next epoch
-    chain.pending_timestamp += EPOCH_LENGTH
-    chain.mine()
+    travel(2, 'enact', mine=True)
     assert incentives.sweepable(epoch, incentive_token) == 4 * UNIT
     incentives.sweep(epoch, incentive_token, charlie, sender=deployer)
     assert incentives.sweepable(epoch, incentive_token) == 0
@@ -186,4 +228,41 @@ def test_transfer_management(deployer, alice, bob, incentives):
 
     incentives.accept_management(sender=alice)
     assert incentives.management() == alice.address
-    assert incentives.pending_management() == ZERO_ADDRESS
\ No newline at end of file
+    assert incentives.pending_management() == ZERO_ADDRESS
+
+def test_claim_many_gas(project, travel, deployer, alice, bob, charlie, measure, token, token2, voting, incentives):
+    # vote results are read once per run of consecutive entries with the same epoch
+    tokens = [project.MockToken.deploy(sender=deployer) for _ in range(8)]
+    for account in [alice, bob, charlie]:
+        measure.set_vote_weight(account, UNIT, sender=account)
+
+    epochs = []
+    for candidate, provider in [(token, RATE_PROVIDER), (token2, RATE_PROVIDER2)]:
+        if len(epochs) > 0:
+            voting.finalize_epochs(sender=alice)
+            voting.set_enable_epoch(incentives.epoch(), sender=deployer)
+        epochs.append(incentives.epoch())
+        for incentive_token in tokens:
+            incentive_token.mint(alice, 3 * UNIT, sender=alice)
+            incentive_token.approve(incentives, 3 * UNIT, sender=alice)
+            incentives.deposit(candidate, incentive_token, 3 * UNIT, sender=alice)
+        voting.set_rate_provider(candidate, provider, sender=deployer)
+        voting.apply(candidate, sender=alice)
+        travel(epochs[-1], 'vote')
+        for account in [alice, bob, charlie]:
+            voting.vote([0, 10000], sender=account)
+        travel(epochs[-1], 'enact')
+    voting.finalize_epochs(sender=alice)
+
+    # same claims, grouped by epoch or alternating between epochs.
+    # charlie does not claim, so no balance is cleared by either claimer
+    grouped = [epochs[0]] * len(tokens) + [epochs[1]] * len(tokens)
+    alternating = epochs * len(tokens)
+    grouped_gas = incentives.claim_many(grouped, tokens + tokens, sender=alice).gas_used
+    alternating_gas = incentives.claim_many(alternating, [t for t in tokens for _ in epochs], sender=bob).gas_used
+    for incentive_token in tokens:
+        assert incentive_token.balanceOf(alice) == 2 * UNIT
+        assert incentive_token.balanceOf(bob) == 2 * UNIT
+
+    # alternating reads the vote results 14 more times
+    assert grouped_gas < alternating_gas - 14 * 2000
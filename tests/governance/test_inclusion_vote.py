@@ -11,28 +11,24 @@ RATE_PROVIDER = '0x1234123412341234123412341234123412341234'
 RATE_PROVIDER2 = '0x5678567856785678567856785678567856785678'
 APPLICATION_DISABLED = '0x0000000000000000000000000000000000000001'
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
-def token(project, deployer):
-    return project.MockToken.deploy(sender=deployer)
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def token2(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def fee_token(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def voting(chain, project, deployer, measure, fee_token):
     voting = project.InclusionVote.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, fee_token, sender=deployer)
     voting.set_enable_epoch(1, sender=deployer)
     return voting
 
+@pytest.fixture(scope='module')
+def genesis(voting):
+    return voting.genesis()
+
 def test_apply(alice, token, voting):
     assert not voting.has_applied(token)
     assert voting.apply_open()
@@ -54,12 +50,12 @@ def test_apply_initial_fee(deployer, alice, fee_token, token, voting):
     assert voting.has_applied(token)
     assert fee_token.balanceOf(voting) == 2 * UNIT
 
-def test_apply_subsequent_fee(chain, deployer, alice, bob, fee_token, token, voting):
+def test_apply_subsequent_fee(travel, deployer, alice, bob, fee_token, token, voting):
     voting.set_application_fees(2 * UNIT, UNIT, sender=deployer)
     fee_token.mint(alice, 2 * UNIT, sender=deployer)
     fee_token.approve(voting, 2 * UNIT, sender=alice)
     voting.apply(token, sender=alice)
-    chain.pending_timestamp += EPOCH_LENGTH
+    travel(2)
     voting.finalize_epochs(sender=alice)
 
     # apply again next epoch
@@ -68,8 +64,8 @@ def test_apply_subsequent_fee(chain, deployer, alice, bob, fee_token, token, vot
     voting.apply(token, sender=bob)
     assert fee_token.balanceOf(voting) == 3 * UNIT
 
-def test_apply_disabled(chain, deployer, alice, token, voting):
-    chain.pending_timestamp += EPOCH_LENGTH
+def test_apply_disabled(travel, deployer, alice, token, voting):
+    travel(2)
     voting.finalize_epochs(sender=alice)
 
     assert voting.applications(token) == 0
@@ -158,7 +154,7 @@ def test_apply_whitelist_multiple(deployer, alice, token, token2, voting):
     assert voting.candidates_map(epoch, token) == 1
     assert voting.candidates_map(epoch, token2) == 2
 
-def test_vote(chain, deployer, alice, bob, measure, token, token2, voting):
+def test_vote(travel, deployer, alice, bob, measure, token, token2, voting):
     epoch = voting.epoch()
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.set_rate_provider(token2, RATE_PROVIDER, sender=deployer)
@@ -170,8 +166,7 @@ def test_vote(chain, deployer, alice, bob, measure, token, token2, voting):
     with ape.reverts():
         voting.vote([4000, 6000], sender=alice)
 
-    chain.pending_timestamp += VOTE_START
-    chain.mine()
+    travel(1, 'vote', mine=True)
     assert voting.vote_open()
 
     # votes need to add up
@@ -203,14 +198,14 @@ def test_vote(chain, deployer, alice, bob, measure, token, token2, voting):
     assert voting.votes(epoch, 1) == 20 * UNIT
     assert voting.votes(epoch, 2) == 6 * UNIT
 
-def test_finalize(chain, deployer, alice, bob, measure, token, token2, voting):
+def test_finalize(travel, deployer, alice, bob, measure, token, token2, voting):
     epoch = voting.epoch()
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.set_rate_provider(token2, RATE_PROVIDER2, sender=deployer)
     voting.apply(token, sender=alice)
     voting.apply(token2, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([1000, 6000, 3000], sender=alice)
 
     # cant finalize before epoch is over
@@ -222,7 +217,7 @@ def test_finalize(chain, deployer, alice, bob, measure, token, token2, voting):
         voting.apply(token2, sender=alice)
 
     # finalize
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=bob)
     assert voting.latest_finalized_epoch() == epoch
     assert voting.winners(epoch) == token.address
@@ -236,41 +231,40 @@ def test_finalize(chain, deployer, alice, bob, measure, token, token2, voting):
     # can apply again if not a winner
     voting.apply(token2, sender=alice)
 
-def test_auto_finalize(chain, deployer, alice, bob, measure, token, token2, voting):
+def test_auto_finalize(travel, deployer, alice, bob, measure, token, token2, voting):
     epoch = voting.epoch()
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.set_rate_provider(token2, RATE_PROVIDER2, sender=deployer)
     voting.apply(token, sender=alice)
     voting.apply(token2, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([1000, 6000, 3000], sender=alice)
 
-    chain.pending_timestamp += 3 * EPOCH_LENGTH
-    chain.mine()
+    travel(4, 'vote', mine=True)
     assert voting.latest_finalized_epoch() == epoch - 1
     voting.finalize_epochs(sender=bob)
     assert voting.latest_finalized_epoch() == epoch + 2
 
-def test_blank_winner(chain, deployer, alice, bob, measure, token, voting):
+def test_blank_winner(travel, deployer, alice, bob, measure, token, voting):
     epoch = voting.epoch()
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([6000, 4000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     voting.finalize_epochs(sender=bob)
     assert voting.latest_finalized_epoch() == epoch
     assert voting.winners(epoch) == ZERO_ADDRESS
     assert voting.winner_rate_providers(epoch) == ZERO_ADDRESS
 
-def test_change_rate_provider(chain, deployer, alice, measure, token, voting):
+def test_change_rate_provider(chain, travel, deployer, alice, measure, token, voting):
     voting.set_rate_provider(token, RATE_PROVIDER, sender=deployer)
     voting.apply(token, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
 
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([0, 10000], sender=alice)
 
     # cant change rate provider when voting has started
@@ -282,7 +276,7 @@ def test_change_rate_provider(chain, deployer, alice, measure, token, voting):
         voting.set_rate_provider(token, ZERO_ADDRESS, sender=deployer)
 
     # cant change rate provider before epoch has finalized
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     with ape.reverts():
         voting.set_rate_provider(token, RATE_PROVIDER2, sender=deployer)
 
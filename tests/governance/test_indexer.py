@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip('pyarrow')
+from governance._indexer import index, load
+
+WEEK = 7 * 24 * 60 * 60
+EPOCH_LENGTH = 4 * WEEK
+UNIT = 1_000_000_000_000_000_000
+
+@pytest.fixture(scope='module')
+def genesis(chain):
+    return chain.pending_timestamp - EPOCH_LENGTH
+
+@pytest.fixture(scope='module')
+def pool(project, deployer):
+    pool = project.MockPool.deploy(sender=deployer)
+    pool.set_num_assets(2, sender=deployer)
+    return pool
+
+@pytest.fixture(scope='module')
+def voting(project, deployer, genesis, pool, measure):
+    return project.WeightVote.deploy(genesis, pool, measure, sender=deployer)
+
+def test_index(tmp_path, chain, travel, alice, bob, measure, voting):
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, 2 * UNIT, sender=bob)
+    start = chain.blocks.head.number
+    travel(1, 'vote')
+    voting.vote([10000], sender=alice)
+
+    assert index(tmp_path, {'WeightVote': voting}, start, chain.blocks.head.number, chunk_size=1) == 1
+    votes = load(tmp_path, 'WeightVote.Vote').to_pylist()
+    assert len(votes) == 1
+    assert votes[0]['account'] == alice.address
+    assert votes[0]['epoch'] == '1'
+    assert votes[0]['weight'] == str(UNIT)
+    assert votes[0]['votes'] == ['10000']
+
+    # resume from the last indexed block
+    voting.vote([5000, 5000], sender=bob)
+    assert index(tmp_path, {'WeightVote': voting}, start, chain.blocks.head.number) == 1
+    votes = load(tmp_path, 'WeightVote.Vote').to_pylist()
+    assert [vote['account'] for vote in votes] == [alice.address, bob.address]
+
+    # contracts of a store cannot be changed
+    with pytest.raises(ValueError):
+        index(tmp_path, {'WeightVote': voting, 'Executor': measure}, start)
+
+    assert load(tmp_path, 'GenericGovernor.Vote').num_rows == 0
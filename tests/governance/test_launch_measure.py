@@ -5,15 +5,15 @@ STAKING = '0x583019fF0f430721aDa9cfb4fac8F06cA104d0B4'
 BOOTSTRAP = '0x7cf484D9d16BA26aB3bCdc8EC4a73aC50136d491'
 YCHAD = '0xFEB4acf3df3cDEA7399794D0869ef76A6EfAff52'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def staking():
     return ape.Contract(STAKING)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def bootstrap():
     return ape.Contract(BOOTSTRAP)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def measure(project, deployer, staking, bootstrap):
     return project.LaunchMeasure.deploy(staking, bootstrap, sender=deployer)
 
@@ -21,3 +21,8 @@ def test_bootstrap_weight(staking, bootstrap, measure):
     weight = measure.vote_weight(YCHAD)
     assert weight > 0
     assert weight == staking.vote_weight(bootstrap) * bootstrap.deposits(YCHAD) // bootstrap.deposited()
+
+def test_vote_weights(alice, bootstrap, measure):
+    accounts = [YCHAD, alice, bootstrap]
+    assert measure.vote_weights(accounts) == [measure.vote_weight(account) for account in accounts]
+    assert measure.vote_weights([]) == []
@@ -0,0 +1,51 @@
+import numpy as np
+from governance._optimizer import optimize, ramp_leak
+from pool._math import arb, balanced, supply
+
+UNIT = 1_000_000_000_000_000_000
+WEEK = 7 * 24 * 60 * 60
+WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1])
+TARGETS = np.array([0.39, 0.3, 0.2, 0.1, 0.01])
+
+def inputs(max_amount):
+    return {
+        'vb': WEIGHTS * 1000,
+        'weights': WEIGHTS,
+        'amplification': 450,
+        'rate': 1.1,
+        'max_amount': max_amount,
+        'initial_weight': 0.001,
+        'targets': TARGETS,
+        'target_amplification': 450,
+        'ramp_duration': WEEK,
+    }
+
+def test_supply():
+    # balanced pool
+    assert np.isclose(supply(WEIGHTS * 1000, WEIGHTS, 450), 1000)
+    assert np.isclose(arb(WEIGHTS * 1000, WEIGHTS, 450), 0)
+
+    # imbalanced pool leaks more at low amplification
+    vb = WEIGHTS * 1000 + np.array([10, 0, 0, 0])
+    assert 0 < arb(vb, WEIGHTS, 450) < arb(vb, WEIGHTS, 10)
+    assert np.allclose(balanced(supply(vb, WEIGHTS, 450), WEIGHTS).sum(), supply(vb, WEIGHTS, 450))
+
+def test_ramp_leak():
+    weights = np.append(WEIGHTS * 0.999, 0.001)
+    assert ramp_leak(weights, weights, [450], 450, 10)[0] == 0
+    # more frequent arbitrage leaks less
+    leak = ramp_leak(weights, TARGETS, [450], 450, 10)[0]
+    assert 0 < ramp_leak(weights, TARGETS, [450], 450, 100)[0] < leak
+
+def test_optimize():
+    # deposit matching the initial weight of the new asset does not leak
+    balanced_amount = 1000 * 0.001 / 0.999 / 1.1
+    result = optimize(**inputs(10))
+    assert abs(result['amount'] / UNIT - balanced_amount) < 0.01
+    assert result['deposit_leak'] < 1e-6
+    assert result['min_lp_amount'] < result['amount'] * 1.1
+
+    # not enough tokens available
+    result = optimize(**inputs(balanced_amount / 2))
+    assert np.isclose(result['amount'] / UNIT, balanced_amount / 2)
+    assert result['deposit_leak'] > 0
@@ -4,7 +4,7 @@ import pytest
 UNIT = 1_000_000_000_000_000_000
 ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def proxy(project, deployer):
     return project.OwnershipProxy.deploy(sender=deployer)
 
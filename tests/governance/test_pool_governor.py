@@ -1,8 +1,8 @@
 import ape
 import pytest
+from governance._pool_governor import execute_weights, predict, read_state, sweep, STATUS_NOOP, STATUS_OK, STATUS_REVERT
 
 WEEK = 7 * 24 * 60 * 60
-VOTE_START = 3 * WEEK
 EPOCH_LENGTH = 4 * WEEK
 UNIT = 1_000_000_000_000_000_000
 ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
@@ -10,45 +10,34 @@ POOL = '0x2cced4ffA804ADbe1269cDFc22D7904471aBdE63'
 YETH = '0x1BED97CBC3c24A4fb5C069C6E311a967386131f7'
 APPLICATION_DISABLED = '0x0000000000000000000000000000000000000001'
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
-def proxy(project, deployer):
-    return project.OwnershipProxy.deploy(sender=deployer)
-
-@pytest.fixture
-def executor(project, deployer, proxy):
-    executor = project.Executor.deploy(proxy, sender=deployer)
-    data = proxy.set_management.encode_input(executor)
-    proxy.execute(proxy, data, sender=deployer)
-    return executor
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def candidate(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def fee_token(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def ivoting(chain, project, deployer, measure, fee_token):
     ivoting = project.InclusionVote.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, fee_token, sender=deployer)
     ivoting.set_enable_epoch(1, sender=deployer)
     return ivoting
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def genesis(ivoting):
+    return ivoting.genesis()
+
+@pytest.fixture(scope='module')
 def provider(project, deployer):
     return project.MockProvider.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def pool(networks, accounts, deployer, proxy, executor):
     # modify deployed pool slots to 2 assets with 50% weight
     pool = ape.Contract(POOL)
     management = accounts[pool.management()]
-    accounts[0].transfer(management, UNIT)
+    networks.provider.set_balance(management.address, UNIT)
     pool.stop_ramp(sender=management)
     networks.provider.set_storage(pool.address, 1, int(10**18).to_bytes(32))
     networks.provider.set_storage(pool.address, 4, int(2).to_bytes(32))
@@ -67,11 +56,11 @@ def pool(networks, accounts, deployer, proxy, executor):
     executor.set_governor(deployer, False, sender=deployer)
     return pool
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def wvoting(project, deployer, measure, ivoting, pool):
     return project.WeightVote.deploy(ivoting.genesis(), pool, measure, sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def governor(project, deployer, executor, ivoting, pool, wvoting):
     governor = project.PoolGovernor.deploy(ivoting.genesis(), pool, executor, sender=deployer)
     governor.set_inclusion_vote(ivoting, sender=deployer)
@@ -81,42 +70,42 @@ def governor(project, deployer, executor, ivoting, pool, wvoting):
     executor.set_governor(governor, True, sender=deployer)
     return governor
 
-def test_weight_redistribute(chain, deployer, alice, measure, pool, ivoting, wvoting, governor):
-    chain.pending_timestamp += VOTE_START
+def test_weight_redistribute(travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     wvoting.vote([0, 2000, 8000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
     governor.execute(0, UNIT//100, 0, 450 * UNIT, 0, sender=deployer)
     assert pool.weight(0)[1] == UNIT * 47 // 100
     assert pool.weight(1)[1] == UNIT * 53 // 100
 
-def test_weight_redistribute_blank(chain, deployer, alice, measure, pool, ivoting, wvoting, governor):
-    chain.pending_timestamp += VOTE_START
+def test_weight_redistribute_blank(travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     wvoting.vote([4000, 2000, 4000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
     governor.execute(0, UNIT//100, 0, 450 * UNIT, 0, sender=deployer)
     assert pool.weight(0)[1] == UNIT * 49 // 100
     assert pool.weight(1)[1] == UNIT * 51 // 100
 
-def test_weight_redistribute_full_blank(chain, deployer, alice, measure, pool, ivoting, wvoting, governor):
-    chain.pending_timestamp += VOTE_START
+def test_weight_redistribute_full_blank(travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     wvoting.vote([10000], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
     governor.execute(0, UNIT//100, 0, 450 * UNIT, 0, sender=deployer)
     assert pool.weight(0)[1] == UNIT // 2
     assert pool.weight(1)[1] == UNIT // 2
 
-def test_weight_redistribute_min(chain, deployer, alice, measure, pool, ivoting, wvoting, governor):
+def test_weight_redistribute_min(chain, travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
     governor.set_redistribute_weight(UNIT * 98 // 100, sender=deployer)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     wvoting.vote([0, 10000, 0], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
 
     with chain.isolate():
@@ -130,12 +119,12 @@ def test_weight_redistribute_min(chain, deployer, alice, measure, pool, ivoting,
     assert pool.weight(0)[1] == UNIT * 9 // 10
     assert pool.weight(1)[1] == UNIT // 10
 
-def test_weight_redistribute_max(chain, deployer, alice, measure, pool, ivoting, wvoting, governor):
+def test_weight_redistribute_max(chain, travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
     governor.set_redistribute_weight(UNIT * 4 // 10, sender=deployer)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     wvoting.vote([0, 2500, 7500], sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
 
     with chain.isolate():
@@ -149,15 +138,58 @@ def test_weight_redistribute_max(chain, deployer, alice, measure, pool, ivoting,
     assert pool.weight(0)[1] == UNIT * 45 // 100
     assert pool.weight(1)[1] == UNIT * 55 // 100
 
-def test_inclusion(chain, deployer, alice, proxy, measure, candidate, provider, pool, ivoting, governor):
+def test_predict(chain, travel, deployer, alice, measure, pool, ivoting, wvoting, governor):
+    governor.set_redistribute_weight(UNIT * 4 // 10, sender=deployer)
+    governor.set_weight_clamp(0, UNIT * 55 // 100, sender=deployer)
+    travel(1, 'vote')
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    wvoting.vote([1000, 2500, 6500], sender=alice)
+    travel(1, 'enact')
+    ivoting.finalize_epochs(sender=alice)
+
+    # model matches the weights of the executed ramp
+    weights = predict(governor)
+
+    # historical predictions read all state at the same block
+    block = chain.blocks.head.number
+    governor.set_redistribute_weight(UNIT // 10, sender=deployer)
+    assert predict(governor) != weights
+    assert predict(governor, block_id=block) == weights
+    governor.set_redistribute_weight(UNIT * 4 // 10, sender=deployer)
+
+    governor.execute(0, UNIT//100, 0, 450 * UNIT, 0, sender=deployer)
+    assert [pool.weight(i)[1] for i in range(2)] == weights
+
+    # scenarios are evaluated identically when vectorized
+    state = read_state(governor, 1)
+    redistribute = list(range(0, UNIT // 2, UNIT // 100))
+    new, status = sweep(**{**state, 'redistribute_weight': redistribute})
+    for i, r in enumerate(redistribute):
+        assert status[i] == STATUS_OK
+        assert list(new[i][:2]) == execute_weights(**{**state, 'redistribute_weight': r})
+
+    # without votes and new asset there is no ramp, an empty ramp reverts
+    for scenario, expected in [
+        ({'votes': [0, 0, 0], 'total_votes': 0, 'included': False}, STATUS_NOOP),
+        ({'weights': [], 'votes': [0], 'total_votes': UNIT, 'included': False}, STATUS_REVERT),
+    ]:
+        scenario = {**state, **scenario}
+        assert sweep(**scenario)[1][0] == expected
+        if expected == STATUS_NOOP:
+            assert execute_weights(**scenario) is None
+        else:
+            with pytest.raises(ValueError):
+                execute_weights(**scenario)
+
+def test_inclusion(travel, deployer, alice, proxy, measure, candidate, provider, pool, ivoting, governor):
     provider.set_rate(candidate, UNIT, sender=deployer)
     ivoting.set_rate_provider(candidate, provider, sender=deployer)
     ivoting.apply(candidate, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     ivoting.vote([0, 10000], sender=alice)
     candidate.mint(proxy, UNIT, sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
     
     n = pool.num_assets()
@@ -179,17 +211,17 @@ def test_inclusion(chain, deployer, alice, proxy, measure, candidate, provider,
     assert pool.weight(1)[1] == UNIT * 495 // 1000
     assert pool.weight(2)[1] == UNIT *  10 // 1000
 
-def test_inclusion_redistribute(chain, deployer, alice, proxy, measure, candidate, provider, pool, ivoting, wvoting, governor):
+def test_inclusion_redistribute(travel, deployer, alice, proxy, measure, candidate, provider, pool, ivoting, wvoting, governor):
     governor.set_redistribute_weight(UNIT * 9 // 100, sender=deployer) # make math easier
     provider.set_rate(candidate, UNIT, sender=deployer)
     ivoting.set_rate_provider(candidate, provider, sender=deployer)
     ivoting.apply(candidate, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     measure.set_vote_weight(alice, UNIT, sender=alice)
     ivoting.vote([0, 10000], sender=alice)
     wvoting.vote([0, 0, 10000], sender=alice)
     candidate.mint(proxy, UNIT, sender=alice)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     ivoting.finalize_epochs(sender=alice)
     governor.execute(UNIT, UNIT, UNIT//100, 450 * UNIT, 0, sender=deployer)
 
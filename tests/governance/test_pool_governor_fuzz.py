@@ -0,0 +1,138 @@
+import ape
+import os
+import pytest
+from governance._pool_governor import execute_weights
+from hypothesis import HealthCheck, event, given, settings, strategies as st
+
+# Differential fuzzing of `PoolGovernor.execute` against the python model.
+# Every case runs on an isolated chain snapshot. The cases are split over shards by number
+# of assets, so they can run in parallel with `ape test -n auto`. The number of cases per
+# shard is set through `FUZZ_EXAMPLES`.
+
+WEEK = 7 * 24 * 60 * 60
+EPOCH_LENGTH = 4 * WEEK
+UNIT = 1_000_000_000_000_000_000
+RATE_PROVIDER = '0x1234123412341234123412341234123412341234'
+VOTE_SCALE = 10_000
+MAX_ASSETS = 32
+MAX_VOTERS = 4
+SHARDS = 8
+EXAMPLES = int(os.environ.get('FUZZ_EXAMPLES', 25))
+
+@pytest.fixture(scope='module')
+def candidate(project, deployer):
+    return project.MockToken.deploy(sender=deployer)
+
+@pytest.fixture(scope='module')
+def pool(project, deployer):
+    return project.MockPool.deploy(sender=deployer)
+
+@pytest.fixture(scope='module')
+def ivoting(chain, project, deployer, measure, token):
+    ivoting = project.InclusionVote.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, token, sender=deployer)
+    ivoting.set_enable_epoch(1, sender=deployer)
+    return ivoting
+
+@pytest.fixture(scope='module')
+def genesis(ivoting):
+    return ivoting.genesis()
+
+@pytest.fixture(scope='module')
+def wvoting(project, deployer, measure, ivoting, pool):
+    return project.WeightVote.deploy(ivoting.genesis(), pool, measure, sender=deployer)
+
+@pytest.fixture(scope='module')
+def governor(project, deployer, executor, ivoting, pool, wvoting):
+    governor = project.PoolGovernor.deploy(ivoting.genesis(), pool, executor, sender=deployer)
+    governor.set_inclusion_vote(ivoting, sender=deployer)
+    governor.set_weight_vote(wvoting, sender=deployer)
+    executor.set_governor(governor, True, sender=deployer)
+    return governor
+
+@pytest.fixture(scope='module')
+def voters(accounts):
+    return [accounts[4 + i] for i in range(MAX_VOTERS)]
+
+def normalize(values, total):
+    # scale to an exact total, rounding error is added to the largest value
+    s = sum(values)
+    scaled = [v * total // s for v in values]
+    scaled[values.index(max(values))] += total - sum(scaled)
+    return scaled
+
+@st.composite
+def cases(draw, shard):
+    num_assets = draw(st.integers(0, MAX_ASSETS // SHARDS - 1)) * SHARDS + shard + 1
+    proportions = st.lists(st.integers(0, 1000), min_size=num_assets, max_size=num_assets).filter(lambda x: sum(x) > 0)
+    weights = normalize(draw(proportions), UNIT)
+    ballot = st.lists(st.integers(0, 1000), min_size=num_assets + 1, max_size=num_assets + 1).filter(lambda x: sum(x) > 0)
+    votes = draw(st.lists(
+        st.tuples(st.integers(1, 10**6 * UNIT), ballot.map(lambda x: normalize(x, VOTE_SCALE))),
+        min_size=0, max_size=MAX_VOTERS
+    ))
+    return {
+        'weights': weights,
+        'votes': votes,
+        # the ramp has room for one extra asset, unless the pool is full
+        'included': num_assets < MAX_ASSETS and draw(st.booleans()),
+        'redistribute_weight': draw(st.integers(0, UNIT)),
+        'min_weight': draw(st.integers(0, UNIT // 10)),
+        'max_weight': draw(st.integers(UNIT // 5, UNIT)),
+    }
+
+@pytest.mark.parametrize('shard', range(SHARDS))
+@settings(max_examples=EXAMPLES, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow])
+@given(data=st.data())
+def test_execute_model(chain, travel, deployer, alice, measure, candidate, pool, ivoting, wvoting, governor, voters, shard, data):
+    case = data.draw(cases(shard))
+    num_assets = len(case['weights'])
+    with chain.isolate():
+        pool.set_weights(case['weights'], sender=deployer)
+        governor.set_redistribute_weight(case['redistribute_weight'], sender=deployer)
+        governor.set_weight_clamp(case['min_weight'], case['max_weight'], sender=deployer)
+        if case['included']:
+            ivoting.set_rate_provider(candidate, RATE_PROVIDER, sender=deployer)
+            ivoting.apply(candidate, sender=alice)
+
+        travel(1, 'vote')
+        if case['included']:
+            measure.set_vote_weight(alice, UNIT, sender=alice)
+            ivoting.vote([0, 10000], sender=alice)
+        for voter, (weight, votes) in zip(voters, case['votes']):
+            measure.set_vote_weight(voter, weight, sender=voter)
+            wvoting.vote(votes, sender=voter)
+        travel(1, 'enact')
+        ivoting.finalize_epochs(sender=alice)
+        assert (ivoting.winners(1) == candidate.address) == case['included']
+
+        state = {
+            'weights': case['weights'],
+            'votes': [wvoting.votes(1, i) for i in range(num_assets + 1)],
+            'total_votes': wvoting.total_votes(1),
+            'included': case['included'],
+            'redistribute_weight': case['redistribute_weight'],
+            'ramp_weight': governor.ramp_weight(),
+            'min_weight': case['min_weight'],
+            'max_weight': case['max_weight'],
+        }
+        try:
+            expected = execute_weights(**state)
+        except ValueError:
+            # the model and contract have to agree on reverts, e.g. when all assets are clamped
+            event('revert')
+            with ape.reverts():
+                governor.execute(0, 0, 0, 0, 0, sender=deployer)
+            return
+
+        governor.execute(0, 0, 0, 0, 0, sender=deployer)
+        if expected is None:
+            event('no ramp')
+            assert pool.ramp_duration() == 0
+            return
+        event('inclusion' if case['included'] else 'ramp')
+        if case['included']:
+            assert pool.num_assets() == num_assets + 1
+            assert pool.assets(num_assets) == candidate.address
+            assert pool.weight(num_assets) == governor.initial_weight()
+        assert [pool.ramp_weights(i) for i in range(len(expected))] == expected
+        assert sum(expected) == UNIT
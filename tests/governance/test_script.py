@@ -0,0 +1,45 @@
+import ape
+import pytest
+from governance._script import describe, pack, script, unpack
+
+UNIT = 1_000_000_000_000_000_000
+
+def test_script(alice, proxy, executor, token):
+    # offline encoding is identical to the executor
+    mint = token.mint.encode_input(proxy, UNIT)
+    assert script(token, mint) == executor.script(token, mint)
+    transfer = token.transfer.encode_input(alice, UNIT)
+    packed = pack([(token, mint), (token, transfer)])
+    assert packed == executor.script(token, mint) + executor.script(token, transfer)
+    assert unpack(packed) == [(token.address, bytes(mint)), (token.address, bytes(transfer))]
+
+def test_execute(deployer, alice, proxy, executor, token):
+    mint = token.mint.encode_input(proxy, UNIT)
+    transfer = token.transfer.encode_input(alice, UNIT)
+    executor.execute(pack([(token, mint), (token, transfer)]), sender=deployer)
+    assert token.balanceOf(alice) == UNIT
+
+def test_limits(token):
+    with pytest.raises(ValueError):
+        script(token, b'\x01\x02\x03')
+    with pytest.raises(ValueError):
+        script(token, b'\x01' * 2049)
+    with pytest.raises(ValueError):
+        pack([(token, b'\x01' * 4)] * 33)
+    with pytest.raises(ValueError):
+        pack([(token, b'\x01' * 1024)] * 2)
+
+def test_unpack_invalid(deployer, alice, executor, token):
+    # scripts rejected offline are also rejected by the executor
+    packed = pack([(token, token.transfer.encode_input(alice, UNIT))])
+    for invalid in [packed[:-1], packed + b'\x00' * 4, packed[:8] + b'\x00' * 24]:
+        with pytest.raises(ValueError):
+            unpack(invalid)
+        with ape.reverts():
+            executor.execute(invalid, sender=deployer)
+
+def test_describe(alice, token):
+    packed = pack([(token, token.transfer.encode_input(alice, UNIT))])
+    description = describe(packed, names={token: 'token'}, signatures=['transfer(address,uint256)'])
+    assert description.split('\n')[0] == f'[0] token ({token.address}).transfer(address,uint256)'
+    assert description.split('\n')[2].endswith(f'{UNIT:064x}')
@@ -0,0 +1,68 @@
+import pytest
+from governance._simulate import Simulator, proposal_script
+
+WEEK = 7 * 24 * 60 * 60
+EPOCH_LENGTH = 4 * WEEK
+UNIT = 1_000_000_000_000_000_000
+CID = '0x0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF'
+ACCESS_WHITELIST = 1
+
+@pytest.fixture(scope='module')
+def governor(chain, project, deployer, measure, executor):
+    governor = project.GenericGovernor.deploy(chain.pending_timestamp - EPOCH_LENGTH, measure, executor, 0, 5000, 0, sender=deployer)
+    executor.set_governor(governor, True, sender=deployer)
+    return governor
+
+@pytest.fixture(scope='module')
+def script(alice, proxy, executor, token):
+    mint = token.mint.encode_input(proxy, UNIT)
+    transfer = token.transfer.encode_input(alice, UNIT)
+    return executor.script(token, mint) + executor.script(token, transfer)
+
+def test_proposal_script(alice, governor, script):
+    governor.propose(CID, b'', sender=alice)
+    idx = governor.propose(CID, script, sender=alice).return_value
+    ipfs, proposal = proposal_script(governor, idx)
+    assert ipfs == bytes.fromhex(CID[2:])
+    assert proposal == script
+
+    with pytest.raises(ValueError):
+        proposal_script(governor, idx + 1)
+
+def test_proposal_script_start_block(chain, alice, governor, script):
+    governor.propose(CID, b'', sender=alice)
+    start = chain.blocks.head.number + 1
+    idx = governor.propose(CID, script, sender=alice).return_value
+
+    # proposals are searched from the start block onwards
+    assert proposal_script(governor, idx, start)[1] == script
+    with pytest.raises(ValueError):
+        proposal_script(governor, idx - 1, start)
+
+def test_simulate(chain, alice, executor, governor, token, script):
+    balance = chain.provider.get_balance(governor.address)
+    simulator = Simulator(executor, governor)
+    result = simulator.simulate(script)
+    assert not result['reverted']
+    assert len(result['calls']) == 2
+    assert result['gas'] > 0
+    assert [event for _, event, _ in result['events']].count('Execute') == 2
+    assert token.address in result['diff']
+    assert len(result['diff'][token.address]['storage']) > 0
+
+    # state is restored after the simulation
+    assert token.balanceOf(alice) == 0
+    assert chain.provider.get_balance(governor.address) == balance
+    assert simulator.simulate(script)['gas'] == result['gas']
+
+def test_simulate_revert(deployer, alice, executor, governor, token, script):
+    selector = token.transfer.encode_input(alice, UNIT)[:4].hex()
+    executor.set_access(token, selector, ACCESS_WHITELIST, sender=deployer)
+    simulator = Simulator(executor, governor)
+    result = simulator.simulate(script)
+    assert result['reverted']
+    assert 'gas' not in result
+
+def test_not_governor(alice, executor):
+    with pytest.raises(ValueError):
+        Simulator(executor, alice)
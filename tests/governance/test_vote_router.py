@@ -0,0 +1,179 @@
+import ape
+import pytest
+from governance._router import option_votes, proposal_votes, router_args, to_bps
+
+WEEK = 7 * 24 * 60 * 60
+EPOCH_LENGTH = 4 * WEEK
+UNIT = 1_000_000_000_000_000_000
+CID = '0x0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF0123456789ABCDEF'
+ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
+@pytest.fixture(scope='module')
+def genesis(chain):
+    return chain.pending_timestamp - EPOCH_LENGTH
+
+@pytest.fixture(scope='module')
+def router(project, deployer, measure):
+    return project.VoteRouter.deploy(measure, sender=deployer)
+
+@pytest.fixture(scope='module')
+def pool(project, deployer):
+    pool = project.MockPool.deploy(sender=deployer)
+    pool.set_num_assets(2, sender=deployer)
+    return pool
+
+@pytest.fixture(scope='module')
+def wvoting(project, deployer, genesis, pool, router):
+    wvoting = project.WeightVote.deploy(genesis, pool, router, sender=deployer)
+    wvoting.set_router(router, sender=deployer)
+    router.set_weight_vote(wvoting, sender=deployer)
+    return wvoting
+
+@pytest.fixture(scope='module')
+def ivoting(project, deployer, genesis, token, router):
+    ivoting = project.InclusionVote.deploy(genesis, router, token, sender=deployer)
+    ivoting.set_enable_epoch(1, sender=deployer)
+    ivoting.set_router(router, sender=deployer)
+    router.set_inclusion_vote(ivoting, sender=deployer)
+    return ivoting
+
+@pytest.fixture(scope='module')
+def governor(project, deployer, genesis, executor, router):
+    governor = project.GenericGovernor.deploy(genesis, router, executor, 0, 5000, 0, sender=deployer)
+    governor.set_router(router, sender=deployer)
+    router.set_governor(governor, sender=deployer)
+    return governor
+
+def test_vote(travel, alice, measure, router, wvoting, ivoting, governor):
+    measure.set_vote_weight(alice, 10 * UNIT, sender=alice)
+    idx1 = governor.propose(CID, b'', sender=alice).return_value
+    idx2 = governor.propose(CID, b'', sender=alice).return_value
+
+    # weight is forwarded outside of a routed vote
+    assert router.vote_weight(alice) == 10 * UNIT
+
+    travel(1, 'vote')
+    router.vote([2000, 8000], [10000], [idx1, idx2], [10000, 0], [0, 5000], [0, 5000], sender=alice)
+    assert wvoting.votes_user(alice, 1, 0) == 2 * UNIT
+    assert wvoting.votes_user(alice, 1, 1) == 8 * UNIT
+    assert ivoting.votes_user(alice, 1) == 10 * UNIT
+    assert governor.proposal(idx1).yea == 10 * UNIT
+    assert governor.proposal(idx2).nay == 5 * UNIT
+    assert governor.proposal(idx2).abstain == 5 * UNIT
+
+    # cannot vote twice
+    with ape.reverts():
+        router.vote([10000], [], [], [], [], [], sender=alice)
+    with ape.reverts():
+        wvoting.vote([10000], sender=alice)
+
+def to_hex(value):
+    return (value.hex() if isinstance(value, bytes) else str(value)).lower().removeprefix('0x')
+
+def calls_to(node, address, selector):
+    # number of calls with the selector to the address in a call tree
+    count = int(to_hex(node.address) == to_hex(address) and to_hex(node.calldata).startswith(selector))
+    return count + sum(calls_to(call, address, selector) for call in node.calls)
+
+def test_vote_measure_once(travel, alice, measure, router, wvoting, ivoting, governor):
+    # all three votes use the weight cached by the router
+    measure.set_vote_weight(alice, 10 * UNIT, sender=alice)
+    idx = governor.propose(CID, b'', sender=alice).return_value
+    travel(1, 'vote')
+    receipt = router.vote(*router_args(weight={0: 1}, inclusion={}, inclusion_blank=1, proposals={idx: 'yea'}), sender=alice)
+    assert wvoting.votes_user(alice, 1, 1) == 10 * UNIT
+    assert ivoting.votes_user(alice, 1) == 10 * UNIT
+    assert governor.proposal(idx).yea == 10 * UNIT
+
+    selector = to_hex(measure.vote_weight.encode_input(alice))[:8]
+    calltree = receipt.trace.get_calltree()
+    assert calls_to(calltree, measure.address, selector) == 1
+    assert calls_to(calltree, router.address, selector) == 3
+
+def test_router_args():
+    assert to_bps([1, 1, 1]) == [3334, 3333, 3333]
+    assert option_votes({}) == []
+    assert option_votes({1: 1, 2: 3}, blank=4) == [5000, 0, 1250, 3750]
+    assert proposal_votes({5: (1, 1, 0), 4: 'nay'}) == ([4, 5], [0, 5000], [10000, 5000], [0, 0])
+    assert router_args(inclusion={0: 1}) == ([], [0, 10000], [], [], [], [])
+
+def test_vote_partial(travel, alice, bob, measure, router, wvoting, ivoting, governor):
+    measure.set_vote_weight(bob, UNIT, sender=bob)
+    travel(1, 'vote')
+
+    # empty lists are skipped
+    router.vote([], [10000], [], [], [], [], sender=bob)
+    assert not wvoting.voted(bob, 1)
+    assert ivoting.votes_user(bob, 1) == UNIT
+
+    # remaining votes can be cast directly
+    wvoting.vote([10000], sender=bob)
+    assert wvoting.votes_user(bob, 1, 0) == UNIT
+
+    # no weight
+    with ape.reverts():
+        router.vote([10000], [], [], [], [], [], sender=alice)
+
+def test_vote_for(deployer, alice, router, wvoting, ivoting, governor):
+    # only the router can vote on behalf of accounts
+    with ape.reverts():
+        wvoting.vote_for(alice, [10000], sender=alice)
+    with ape.reverts():
+        ivoting.vote_for(alice, [10000], sender=alice)
+    with ape.reverts():
+        governor.vote_many_for(alice, [0], [10000], [0], [0], sender=alice)
+
+    with ape.reverts():
+        wvoting.set_router(alice, sender=alice)
+    wvoting.set_router(ZERO_ADDRESS, sender=deployer)
+    assert wvoting.router() == ZERO_ADDRESS
+
+def test_set_router_vote_open(travel, deployer, alice, wvoting, ivoting, governor):
+    # router cannot be replaced during the vote
+    travel(1, 'vote')
+    for voting in [wvoting, ivoting, governor]:
+        with ape.reverts():
+            voting.set_router(alice, sender=deployer)
+
+    travel(2, 'propose')
+    for voting in [wvoting, ivoting, governor]:
+        voting.set_router(alice, sender=deployer)
+        assert voting.router() == alice.address
+
+def test_set_measure_vote_open(travel, deployer, alice, router, wvoting, ivoting, governor):
+    # measure cannot be replaced while any routed vote is open
+    travel(1, 'vote')
+    with ape.reverts():
+        router.set_measure(alice, sender=deployer)
+
+    travel(2, 'propose')
+    router.set_measure(alice, sender=deployer)
+    assert router.measure() == alice.address
+
+def test_set_contracts(deployer, alice, bob, router):
+    for setter, getter in [
+        (router.set_measure, router.measure),
+        (router.set_weight_vote, router.weight_vote),
+        (router.set_inclusion_vote, router.inclusion_vote),
+        (router.set_governor, router.governor),
+    ]:
+        with ape.reverts():
+            setter(bob, sender=alice)
+        setter(bob, sender=deployer)
+        assert getter() == bob.address
+
+def test_transfer_management(deployer, alice, bob, router):
+    assert router.management() == deployer.address
+    assert router.pending_management() == ZERO_ADDRESS
+    with ape.reverts():
+        router.set_management(alice, sender=alice)
+
+    router.set_management(alice, sender=deployer)
+    assert router.pending_management() == alice.address
+
+    with ape.reverts():
+        router.accept_management(sender=bob)
+
+    router.accept_management(sender=alice)
+    assert router.management() == alice.address
+    assert router.pending_management() == ZERO_ADDRESS
@@ -1,5 +1,6 @@
 import ape
 import pytest
+from governance._incentives import PAGE_SIZE, claimable_matrix, voters
 
 WEEK = 7 * 24 * 60 * 60
 VOTE_START = 3 * WEEK
@@ -7,25 +8,25 @@ EPOCH_LENGTH = 4 * WEEK
 UNIT = 1_000_000_000_000_000_000
 ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def pool(project, deployer):
     pool = project.MockPool.deploy(sender=deployer)
     pool.set_num_assets(2, sender=deployer)
     return pool
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def incentive_token(project, deployer):
     return project.MockToken.deploy(sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def voting(chain, project, deployer, measure, pool):
     return project.WeightVote.deploy(chain.pending_timestamp - EPOCH_LENGTH, pool, measure, sender=deployer)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def genesis(voting):
+    return voting.genesis()
+
+@pytest.fixture(scope='module')
 def incentives(project, deployer, pool, voting):
     return project.WeightIncentives.deploy(pool, voting, sender=deployer)
 
@@ -43,27 +44,44 @@ def test_deposit(alice, incentive_token, incentives):
     assert incentives.incentives(epoch, 2, incentive_token) == UNIT
     assert incentives.unclaimed(epoch, incentive_token) == UNIT
 
-def test_deposit_deadline(chain, deployer, alice, incentive_token, incentives):
+def test_deposit_register(project, deployer, alice, incentive_token, incentives):
+    epoch = incentives.epoch()
+    incentive_token2 = project.MockToken.deploy(sender=deployer)
+    for token in [incentive_token, incentive_token2]:
+        token.mint(alice, 2 * UNIT, sender=alice)
+        token.approve(incentives, 2 * UNIT, sender=alice)
+    assert incentives.num_tokens(epoch) == 0
+
+    # tokens are registered once per epoch
+    incentives.deposit(0, incentive_token, UNIT, sender=alice)
+    incentives.deposit(1, incentive_token, UNIT, sender=alice)
+    incentives.deposit(1, incentive_token2, UNIT, sender=alice)
+    incentives.deposit(2, incentive_token2, UNIT, sender=alice)
+    assert incentives.num_tokens(epoch) == 2
+    assert incentives.tokens(epoch, 0) == incentive_token.address
+    assert incentives.tokens(epoch, 1) == incentive_token2.address
+    assert incentives.token_registered(epoch, incentive_token)
+
+def test_deposit_deadline(travel, deployer, alice, incentive_token, incentives):
     incentive_token.mint(alice, UNIT, sender=alice)
     incentive_token.approve(incentives, UNIT, sender=alice)
     incentives.set_deposit_deadline(VOTE_START, sender=deployer)
 
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     with ape.reverts():
         incentives.deposit(2, incentive_token, UNIT, sender=alice)
 
-def test_claim(chain, alice, bob, measure, incentive_token, voting, incentives):
+def test_claim(travel, alice, bob, measure, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentive_token.mint(alice, 6 * UNIT, sender=alice)
     incentive_token.approve(incentives, 6 * UNIT, sender=alice)
     incentives.deposit(2, incentive_token, 6 * UNIT, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
     measure.set_vote_weight(bob, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([5000, 0, 5000], sender=alice)
     voting.vote([0, 0, 10000], sender=bob)
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
 
     # incentives are distributed over those who voted for the choice
     assert incentives.claimable(epoch, 2, incentive_token, alice) == 2 * UNIT
@@ -82,17 +100,127 @@ def test_claim(chain, alice, bob, measure, incentive_token, voting, incentives):
     incentives.claim(epoch, 2, incentive_token, bob, sender=bob)
     assert incentive_token.balanceOf(bob) == 4 * UNIT
 
-def test_claim_fee(chain, deployer, alice, measure, incentive_token, voting, incentives):
+def test_claim_all(project, travel, deployer, alice, bob, measure, incentive_token, voting, incentives):
+    epoch = incentives.epoch()
+    incentive_token2 = project.MockToken.deploy(sender=deployer)
+    for token in [incentive_token, incentive_token2]:
+        token.mint(alice, 12 * UNIT, sender=alice)
+        token.approve(incentives, 12 * UNIT, sender=alice)
+        incentives.deposit(0, token, 2 * UNIT, sender=alice)
+        incentives.deposit(2, token, 10 * UNIT, sender=alice)
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, UNIT, sender=alice)
+    travel(1, 'vote')
+    voting.vote([5000, 0, 5000], sender=alice)
+    voting.vote([0, 0, 10000], sender=bob)
+
+    # cannot claim before epoch is over
+    with ape.reverts():
+        incentives.claim_all(epoch, [incentive_token, incentive_token2], sender=bob)
+
+    travel(1, 'enact', mine=True)
+
+    # bob's share of blank and asset 2 incentives, in both tokens
+    assert incentives.claimable(epoch, 0, incentive_token, bob) == 0
+    assert incentives.claimable(epoch, 2, incentive_token, bob) == 20 * UNIT // 3
+    incentives.claim_all(epoch, [incentive_token, incentive_token2], sender=bob)
+    assert incentive_token.balanceOf(bob) == 20 * UNIT // 3
+    assert incentive_token2.balanceOf(bob) == 20 * UNIT // 3
+
+    # alice's share, claimed on her behalf
+    incentives.claim(epoch, 0, incentive_token, alice, sender=bob)
+    assert incentive_token.balanceOf(alice) == 2 * UNIT
+    incentives.claim_all(epoch, [incentive_token, incentive_token2], alice, sender=bob)
+    assert incentive_token.balanceOf(alice) == 2 * UNIT + 10 * UNIT // 3
+    assert incentive_token2.balanceOf(alice) == 2 * UNIT + 10 * UNIT // 3
+
+    # claiming a second time does nothing
+    incentives.claim_all(epoch, [incentive_token, incentive_token2], sender=bob)
+    assert incentive_token.balanceOf(bob) == 20 * UNIT // 3
+    for token in [incentive_token, incentive_token2]:
+        assert incentives.unclaimed(epoch, token) == 12 * UNIT - 2 * UNIT - 10 * UNIT // 3 - 20 * UNIT // 3
+
+def test_claimable_all(project, travel, deployer, alice, bob, measure, incentive_token, voting, incentives):
+    epoch = incentives.epoch()
+    incentive_token2 = project.MockToken.deploy(sender=deployer)
+    for token in [incentive_token, incentive_token2]:
+        token.mint(alice, 12 * UNIT, sender=alice)
+        token.approve(incentives, 12 * UNIT, sender=alice)
+        incentives.deposit(0, token, 2 * UNIT, sender=alice)
+        incentives.deposit(2, token, 10 * UNIT, sender=alice)
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, UNIT, sender=alice)
+    travel(1, 'vote')
+    voting.vote([5000, 0, 5000], sender=alice)
+    voting.vote([0, 0, 10000], sender=bob)
+
+    # nothing claimable during the epoch
+    tokens = [incentive_token.address, incentive_token2.address]
+    assert incentives.claimable_all(alice, epoch) == (tokens, [0, 0])
+
+    travel(1, 'enact', mine=True)
+
+    # amounts are summed over all assets
+    alice_amount = 2 * UNIT + 10 * UNIT // 3
+    assert incentives.claimable_all(alice, epoch) == (tokens, [alice_amount, alice_amount])
+    assert incentives.claimable_all(bob, epoch, 1) == ([incentive_token2.address], [20 * UNIT // 3])
+    assert incentives.claimable_all(bob, epoch, 2) == ([], [])
+
+    incentives.claim(epoch, 0, incentive_token, sender=alice)
+    assert incentives.claimable_all(alice, epoch) == (tokens, [10 * UNIT // 3, alice_amount])
+
+def test_claimable_matrix(project, travel, deployer, alice, bob, charlie, measure, voting, incentives):
+    # more tokens than fit in a single `claimable_all` page
+    epoch = incentives.epoch()
+    tokens = [project.MockToken.deploy(sender=deployer) for _ in range(PAGE_SIZE + 2)]
+    for i, token in enumerate(tokens):
+        token.mint(alice, (i + 1) * UNIT, sender=alice)
+        token.approve(incentives, (i + 1) * UNIT, sender=alice)
+        incentives.deposit(2, token, (i + 1) * UNIT, sender=alice)
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, 2 * UNIT, sender=alice)
+    travel(1, 'vote')
+    voting.vote([5000, 0, 5000], sender=alice)
+    voting.vote([0, 0, 10000], sender=bob)
+    travel(1, 'enact', mine=True)
+    incentives.claim(epoch, 2, tokens[0], sender=bob)
+
+    # zero amounts and accounts without incentives are omitted
+    matrix = claimable_matrix(incentives, [alice.address, bob.address, charlie.address], [epoch, epoch + 1])
+    assert set(matrix) == {(alice.address, epoch), (bob.address, epoch)}
+    assert len(matrix[(alice.address, epoch)]) == len(tokens)
+    assert len(matrix[(bob.address, epoch)]) == len(tokens) - 1
+    for account in [alice, bob]:
+        expected = {}
+        for offset in range(0, len(tokens), PAGE_SIZE):
+            for token, amount in zip(*incentives.claimable_all(account, epoch, offset)):
+                if amount > 0:
+                    expected[token] = amount
+        assert matrix[(account.address, epoch)] == expected
+
+def test_voters(chain, travel, alice, bob, measure, voting):
+    epoch = voting.epoch()
+    measure.set_vote_weight(alice, UNIT, sender=alice)
+    measure.set_vote_weight(bob, UNIT, sender=alice)
+    travel(1, 'vote')
+    voting.vote([10000], sender=alice)
+    start = chain.blocks.head.number + 1
+    voting.vote([0, 10000], sender=bob)
+
+    # only votes from the start block onwards are found
+    assert voters(voting, epoch) == [alice.address, bob.address]
+    assert voters(voting, epoch, start) == [bob.address]
+
+def test_claim_fee(travel, deployer, alice, measure, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentives.set_fee_rate(1000, sender=deployer)
     incentive_token.mint(alice, 10 * UNIT, sender=alice)
     incentive_token.approve(incentives, 10 * UNIT, sender=alice)
     incentives.deposit(2, incentive_token, 10 * UNIT, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([5000, 0, 5000], sender=alice)
-    chain.pending_timestamp += WEEK
-    chain.mine()
+    travel(1, 'enact', mine=True)
     assert incentives.claimable(epoch, 2, incentive_token, alice) == 9 * UNIT
     incentives.claim(epoch, 2, incentive_token, sender=alice)
     assert incentives.claimable(epoch, 2, incentive_token, alice) == 0
@@ -100,23 +228,22 @@ def test_claim_fee(chain, deployer, alice, measure, incentive_token, voting, inc
     assert incentives.unclaimed(epoch, incentive_token) == UNIT
 
     # claim fee through a sweep
-    chain.pending_timestamp += EPOCH_LENGTH
-    chain.mine()
+    travel(2, 'enact', mine=True)
     assert incentives.sweepable(epoch, incentive_token) == UNIT
     incentives.sweep(epoch, incentive_token, sender=deployer)
     assert incentive_token.balanceOf(deployer) == UNIT
 
-def test_sweep(chain, deployer, alice, bob, charlie, measure, incentive_token, voting, incentives):
+def test_sweep(travel, deployer, alice, bob, charlie, measure, incentive_token, voting, incentives):
     epoch = incentives.epoch()
     incentive_token.mint(alice, 6 * UNIT, sender=alice)
     incentive_token.approve(incentives, 6 * UNIT, sender=alice)
     incentives.deposit(2, incentive_token, 6 * UNIT, sender=alice)
     measure.set_vote_weight(alice, UNIT, sender=alice)
     measure.set_vote_weight(bob, UNIT, sender=alice)
-    chain.pending_timestamp += VOTE_START
+    travel(1, 'vote')
     voting.vote([5000, 0, 5000], sender=alice)
     voting.vote([0, 0, 10000], sender=bob)
-    chain.pending_timestamp += WEEK
+    travel(1, 'enact')
     incentives.claim(epoch, 2, incentive_token, alice, sender=bob)
 
     # unclaimed incentives cannot be swept yet
@@ -125,8 +252,7 @@ def test_sweep(chain, deployer, alice, bob, charlie, measure, incentive_token, v
         incentives.sweep(epoch, incentive_token, sender=deployer)
 
     # sweep unclaimed incentives next epoch
-    chain.pending_timestamp += EPOCH_LENGTH
-    chain.mine()
+    travel(2, 'enact', mine=True)
     assert incentives.sweepable(epoch, incentive_token) == 4 * UNIT
     incentives.sweep(epoch, incentive_token, charlie, sender=deployer)
     assert incentives.sweepable(epoch, incentive_token) == 0
@@ -1,5 +1,6 @@
 import ape
 import pytest
+from votes._common import multiple_choice_result, read_weight, read_weight_votes
 
 WEEK = 7 * 24 * 60 * 60
 VOTE_START = 3 * WEEK
@@ -7,23 +8,23 @@ EPOCH_LENGTH = 4 * WEEK
 UNIT = 1_000_000_000_000_000_000
 ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
 
-@pytest.fixture
-def measure(project, deployer):
-    return project.MockMeasure.deploy(sender=deployer)
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def pool(project, deployer):
     pool = project.MockPool.deploy(sender=deployer)
     pool.set_num_assets(2, sender=deployer)
     return pool
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def voting(project, chain, deployer, measure, pool):
     return project.WeightVote.deploy(chain.pending_timestamp, pool, measure, sender=deployer)
 
-def test_vote(chain, alice, bob, measure, voting):
+@pytest.fixture(scope='module')
+def genesis(voting):
+    return voting.genesis()
+
+def test_vote(travel, alice, bob, measure, voting):
     epoch = voting.epoch()
-    chain.pending_timestamp += VOTE_START
+    travel(0, 'vote')
     measure.set_vote_weight(alice, 10 * UNIT, sender=alice)
 
     # votes must add up
@@ -38,6 +39,9 @@ def test_vote(chain, alice, bob, measure, voting):
     assert voting.votes(epoch, 0) == 6 * UNIT
     assert voting.votes(epoch, 1) == 4 * UNIT
     assert voting.votes(epoch, 2) == 0
+    assert voting.votes_user(alice, epoch, 0) == 6 * UNIT
+    assert voting.votes_user(alice, epoch, 1) == 4 * UNIT
+    assert voting.votes_user(alice, epoch, 2) == 0
 
     # cannot vote twice
     with ape.reverts():
@@ -50,6 +54,45 @@ def test_vote(chain, alice, bob, measure, voting):
     assert voting.votes(epoch, 1) == 10 * UNIT
     assert voting.votes(epoch, 2) == 14 * UNIT
 
+def test_vote_packed(travel, deployer, alice, measure, pool, voting):
+    # user votes are packed over multiple slots
+    epoch = voting.epoch()
+    pool.set_num_assets(32, sender=deployer)
+    travel(0, 'vote')
+    measure.set_vote_weight(alice, 10 * UNIT, sender=alice)
+    votes = [0] * 33
+    votes[0] = 1
+    votes[17] = 2999
+    votes[18] = 4000
+    votes[32] = 3000
+    voting.vote(votes, sender=alice)
+    for i in range(33):
+        assert voting.votes_user(alice, epoch, i) == votes[i] * 10 * UNIT // 10_000
+        assert voting.votes(epoch, i) == votes[i] * 10 * UNIT // 10_000
+
+def test_read_weight_votes(monkeypatch, chain, travel, alice, bob, measure, voting):
+    # tally is rebuilt from the vote events
+    epoch = voting.epoch()
+    start = chain.blocks.head.number
+    travel(0, 'vote')
+    measure.set_vote_weight(alice, 10 * UNIT, sender=alice)
+    measure.set_vote_weight(bob, 3 * UNIT + 1, sender=bob)
+    voting.vote([6000, 4000], sender=alice)
+    voting.vote([3333, 3333, 3334], sender=bob)
+
+    total, votes = read_weight_votes(voting, epoch, 3, start)
+    # total is summed over the rounded votes, like the Snapshot export
+    assert total == sum(voting.votes(epoch, i) for i in range(3))
+    assert total < voting.total_votes(epoch)
+    assert votes[alice.address] == [6 * UNIT, 4 * UNIT, 0]
+    assert votes[bob.address] == [voting.votes_user(bob, epoch, i) for i in range(3)]
+    assert multiple_choice_result(votes, 3) == [voting.votes(epoch, i) for i in range(3)]
+
+    # epoch scripts read the on-chain tally when configured
+    monkeypatch.setenv('WEIGHT_VOTE', voting.address)
+    monkeypatch.setenv('WEIGHT_VOTE_START_BLOCK', str(start))
+    assert read_weight(epoch, 3) == (total, votes)
+
 def test_transfer_management(deployer, alice, bob, voting):
     assert voting.management() == deployer.address
     assert voting.pending_management() == ZERO_ADDRESS
@@ -0,0 +1,80 @@
+import ape
+import numpy as np
+import pytest
+from pool._math import get_add_lp, get_dy, get_remove_lp, get_remove_single_lp, supply
+from pool._state import at, read_state
+
+POOL = '0x2cced4ffA804ADbe1269cDFc22D7904471aBdE63'
+UNIT = 1_000_000_000_000_000_000
+WEEK = 7 * 24 * 60 * 60
+AMOUNTS = np.array([0.01, 1, 10])
+
+@pytest.fixture(scope='module')
+def pool(alice):
+    pool = ape.Contract(POOL)
+    pool.update_rates(list(range(pool.num_assets())), sender=alice)
+    return pool
+
+@pytest.fixture(scope='module')
+def management(networks, accounts, pool):
+    management = accounts[pool.management()]
+    networks.provider.set_balance(management.address, UNIT)
+    return management
+
+def test_invariant():
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+    vb = weights * 1000 * np.array([1.05, 0.97, 1, 1.02])
+    rates = np.array([1, 1.05, 1.1, 1])
+    dy = get_dy(vb, weights, 450, rates, 0, 3, AMOUNTS)
+
+    # swaps keep the supply constant
+    new = np.tile(vb, (len(AMOUNTS), 1))
+    new[:, 0] += AMOUNTS * rates[0]
+    new[:, 3] -= dy * rates[3]
+    assert np.allclose(supply(new, weights, 450), supply(vb, weights, 450), rtol=1e-12)
+
+    # fees only reduce the output
+    assert np.all(get_dy(vb, weights, 450, rates, 0, 3, AMOUNTS, fee=0.001) < dy)
+    assert np.all(get_remove_single_lp(vb, weights, 450, rates, 2, AMOUNTS, fee=0.001) < get_remove_single_lp(vb, weights, 450, rates, 2, AMOUNTS))
+
+def test_views(pool):
+    state = read_state(pool)
+    args = at(state, state['timestamp'])
+    num_assets = len(state['vb'])
+
+    for i, j in [(0, 1), (1, 0), (num_assets - 1, 0)]:
+        expected = get_dy(**args, i=i, j=j, dx=AMOUNTS, fee=state['fee'])
+        actual = [pool.get_dy(i, j, int(dx * UNIT)) / UNIT for dx in AMOUNTS]
+        assert np.allclose(expected, actual, rtol=1e-6)
+
+    amounts = state['vb'] / state['rates'] / 1000
+    amounts[0] *= 2
+    expected = get_add_lp(**args, amounts=amounts, fee=state['fee'])
+    assert np.isclose(expected, pool.get_add_lp([int(x * UNIT) for x in amounts]) / UNIT, rtol=1e-6)
+
+    expected = get_remove_lp(**args, lp=1)
+    assert np.allclose(expected, np.array(pool.get_remove_lp(UNIT)) / UNIT, rtol=1e-6)
+
+    expected = get_remove_single_lp(**args, i=0, lp=AMOUNTS, fee=state['fee'])
+    actual = [pool.get_remove_single_lp(0, int(lp * UNIT)) / UNIT for lp in AMOUNTS]
+    assert np.allclose(expected, actual, rtol=1e-6)
+
+def test_ramp(chain, pool, management):
+    pool.stop_ramp(sender=management)
+    num_assets = pool.num_assets()
+    weights = [pool.weight(i)[0] for i in range(num_assets)]
+    weights[0] -= UNIT // 1000
+    weights[1] += UNIT // 1000
+    pool.set_ramp(pool.amplification() * 21 // 20, weights, WEEK, sender=management)
+
+    state = read_state(pool)
+    timestamps = state['timestamp'] + np.array([WEEK // 4, WEEK // 2, WEEK, 2 * WEEK])
+    expected = get_dy(**at(state, timestamps[:, None]), i=0, j=1, dx=AMOUNTS, fee=state['fee'])
+    assert expected.shape == (len(timestamps), len(AMOUNTS))
+
+    for k, timestamp in enumerate(timestamps):
+        with chain.isolate():
+            chain.mine(timestamp=int(timestamp))
+            actual = [pool.get_dy(0, 1, int(dx * UNIT)) / UNIT for dx in AMOUNTS]
+        # weights are packed with 6 decimals during the ramp
+        assert np.allclose(expected[k], actual, rtol=1e-4)
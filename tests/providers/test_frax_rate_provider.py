@@ -9,13 +9,13 @@ UNIT = 1_000_000_000_000_000_000
 def provider(project, deployer):
     return project.FraxRateProvider.deploy(sender=deployer)
 
-def test_rate_provider(provider, accounts):
+def test_rate_provider(provider, accounts, receiver):
     asset = Contract(ASSET)
     account = accounts['0x78bB3aEC3d855431bd9289fD98dA13F9ebB7ef15']
     underlying = Contract(UNDERLYING)
-    asset.redeem(UNIT, accounts[0], account, sender=account)
+    asset.redeem(UNIT, receiver, account, sender=account)
 
     rate = provider.rate(ASSET)
     assert rate > UNIT and rate < UNIT * 12 // 10
     assert asset.pricePerShare() == rate
-    assert underlying.balanceOf(accounts[0]) == rate
+    assert underlying.balanceOf(receiver) == rate
@@ -8,11 +8,11 @@ UNIT = 1_000_000_000_000_000_000
 def provider(project, deployer):
     return project.MetaPoolRateProvider.deploy(sender=deployer)
 
-def test_rate_provider(provider, accounts):
+def test_rate_provider(provider, accounts, receiver):
     account = accounts['0x49A323CC2fa5F9A138f30794B9348e43065D8dA2']
     asset = Contract(ASSET)
-    asset.transfer(accounts[0], UNIT, sender=account)
-    asset.redeem(UNIT, accounts[0], accounts[0], sender=accounts[0])
+    asset.transfer(receiver, UNIT, sender=account)
+    asset.redeem(UNIT, receiver, receiver, sender=receiver)
     rate = provider.rate(ASSET)
     withdrawal = Contract(asset.withdrawal())
-    assert withdrawal.pendingWithdraws(accounts[0]).amount == rate
+    assert withdrawal.pendingWithdraws(receiver).amount == rate
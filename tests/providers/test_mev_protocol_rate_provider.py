@@ -8,11 +8,11 @@ UNIT = 1_000_000_000_000_000_000
 def provider(project, deployer):
     return project.MevProtocolRateProvider.deploy(sender=deployer)
 
-def test_rate_provider(provider, accounts):
+def test_rate_provider(networks, provider, accounts, receiver):
     asset = Contract(ASSET)
     before = provider.rate(ASSET)
     vault = accounts[asset.mevEthShareVault()]
-    accounts[0].transfer(vault, 10 * UNIT)
+    networks.provider.set_balance(vault.address, vault.balance + 10 * UNIT)
     asset.grantRewards(value=10*UNIT, sender=vault)
     rate = provider.rate(ASSET)
     assert rate > before
@@ -21,6 +21,6 @@ def test_rate_provider(provider, accounts):
     asset.setMinWithdrawal(0, sender=admin)
     
     account = accounts['0x6D5a7597896A703Fe8c85775B23395a48f971305']
-    asset.redeem(UNIT, accounts[0], account, sender=account)
+    asset.redeem(UNIT, receiver, account, sender=account)
     weth = Contract('0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2')
-    assert weth.balanceOf(accounts[0]) == rate * 9999 // 10000
+    assert weth.balanceOf(receiver) == rate * 9999 // 10000
@@ -9,12 +9,12 @@ UNIT = 1_000_000_000_000_000_000
 def provider(project, deployer):
     return project.PirexRateProvider.deploy(sender=deployer)
 
-def test_rate_provider(provider, accounts):
+def test_rate_provider(provider, accounts, receiver):
     asset = Contract(ASSET)
     account = accounts['0x3A8EAF3fE0082e478293917F2E81F4fEED97ace2']
     underlying = Contract(UNDERLYING)
-    asset.redeem(UNIT, accounts[0], account, sender=account)
+    asset.redeem(UNIT, receiver, account, sender=account)
 
     rate = provider.rate(ASSET)
     assert rate > UNIT and rate < UNIT * 12 // 10
-    assert underlying.balanceOf(accounts[0]) == rate
+    assert underlying.balanceOf(receiver) == rate
@@ -15,13 +15,13 @@ def provider(project, deployer):
 def test_balances_contract(provider, deployer):
     assert provider.verify_balances_contract(sender=deployer)
 
-def test_rate_provider(provider, accounts):
+def test_rate_provider(provider, accounts, receiver):
     asset = Contract(ASSET)
     rate = provider.rate(ASSET)
     assert Contract(ASSET).getExchangeRate() == rate
 
     account = accounts['0xCc9EE9483f662091a1de4795249E24aC0aC2630f']
-    asset.transfer(accounts[0], UNIT, sender=account)
-    before = accounts[0].balance
-    asset.burn(UNIT, sender=accounts[0])
-    assert accounts[0].balance - before == rate
+    asset.transfer(receiver, UNIT, sender=account)
+    before = receiver.balance
+    asset.burn(UNIT, sender=receiver)
+    assert receiver.balance - before == rate
@@ -0,0 +1,60 @@
+import numpy as np
+from ape import Contract
+from pool._zap import best, quote, quote_chain, read_zap
+from pytest import fixture
+
+TOKEN = '0x1BED97CBC3c24A4fb5C069C6E311a967386131f7'
+POOL = '0x2cced4ffA804ADbe1269cDFc22D7904471aBdE63'
+STAKING = '0x583019fF0f430721aDa9cfb4fac8F06cA104d0B4'
+UNIT = 1_000_000_000_000_000_000
+
+@fixture
+def pool(alice):
+    pool = Contract(POOL)
+    pool.update_rates(list(range(pool.num_assets())), sender=alice)
+    return pool
+
+@fixture
+def staking():
+    return Contract(STAKING)
+
+@fixture
+def zap(project, deployer, pool, staking):
+    return project.Zap.deploy(TOKEN, pool, staking, sender=deployer)
+
+def test_quote(zap, pool, staking):
+    state = read_zap(zap)
+    num_assets = pool.num_assets()
+    candidates = np.zeros((num_assets + 1, num_assets))
+    for i in range(num_assets):
+        candidates[i, i] = 1
+    candidates[num_assets] = state['vb'] / state['rates'] / state['vb'].sum()
+
+    lp, shares = quote(state, candidates)
+    lp_chain, shares_chain = quote_chain(state, candidates)
+    assert lp.shape == shares.shape == (num_assets + 1,)
+    assert np.allclose(lp, lp_chain, rtol=1e-6)
+    assert np.allclose(shares, shares_chain, rtol=1e-6)
+
+    expected = pool.get_add_lp([int(x * UNIT) for x in candidates[0]])
+    assert lp_chain[0] == expected / UNIT
+    assert shares_chain[0] == staking.previewDeposit(expected) / UNIT
+
+def test_best():
+    # in a balanced pool, a single sided deposit pays slippage and fees
+    weights = np.array([0.5, 0.3, 0.2])
+    state = {
+        'vb': weights * 1000, 'rates': np.array([1, 1.1, 1.05]), 'weights': weights, 'target_weights': weights,
+        'amplification': 450, 'target_amplification': 450, 'last_time': 0, 'stop_time': 0, 'step': 1,
+        'fee': 0.0003, 'timestamp': 0, 'total_assets': 1100, 'total_shares': 1000,
+    }
+    candidates = np.array([[10, 0, 0], [0, 10, 0], weights * 10 / state['rates']])
+    lp, shares = quote(state, candidates)
+    assert np.allclose(shares, lp * 1000 / 1100)
+    assert best(state, candidates, shares) == 2
+    assert np.isclose(lp[2], 10)
+
+    # an empty candidate is never the best
+    candidates = np.vstack([np.zeros(3), candidates])
+    lp, shares = quote(state, candidates)
+    assert best(state, candidates, shares) == 3
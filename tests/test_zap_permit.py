@@ -0,0 +1,72 @@
+from ape import reverts
+from pool._permit import EMPTY_SIGNATURE, sign_permits
+from pytest import fixture
+
+UNIT = 1_000_000_000_000_000_000
+AMOUNTS = [UNIT, 2 * UNIT, 3 * UNIT]
+
+@fixture
+def lp(project, deployer):
+    return project.MockToken.deploy(sender=deployer)
+
+@fixture
+def assets(project, deployer, alice):
+    assets = [project.MockToken.deploy(sender=deployer) for _ in AMOUNTS]
+    for asset in assets:
+        asset.mint(alice, 10 * UNIT, sender=deployer)
+    return assets
+
+@fixture
+def pool(project, deployer, lp, assets):
+    pool = project.MockPool.deploy(sender=deployer)
+    pool.set_assets(lp, assets, sender=deployer)
+    return pool
+
+@fixture
+def staking(project, deployer, lp):
+    return project.MockStaking.deploy(lp, sender=deployer)
+
+@fixture
+def zap(project, deployer, lp, pool, staking):
+    zap = project.Zap.deploy(lp, pool, staking, sender=deployer)
+    for i in range(len(AMOUNTS)):
+        zap.approve(i, sender=deployer)
+    return zap
+
+@fixture
+def deadline(chain):
+    return chain.pending_timestamp + 3600
+
+def test_add_liquidity_permit(alice, bob, assets, staking, zap, deadline):
+    signatures = sign_permits(alice, zap, AMOUNTS, deadline)
+    assert zap.add_liquidity_permit(AMOUNTS, 6 * UNIT, deadline, signatures, bob, sender=alice).return_value == (6 * UNIT, 6 * UNIT)
+    assert staking.balanceOf(bob) == 6 * UNIT
+    for asset, amount in zip(assets, AMOUNTS):
+        assert asset.balanceOf(alice) == 10 * UNIT - amount
+        assert asset.nonces(alice) == 1
+        assert asset.allowance(alice, zap) == 0
+
+def test_add_liquidity_permit_skip(alice, assets, staking, zap, deadline):
+    # assets without signature need an approval
+    signatures = sign_permits(alice, zap, AMOUNTS, deadline, skip=[2])
+    assert signatures[2] == EMPTY_SIGNATURE
+    with reverts():
+        zap.add_liquidity_permit(AMOUNTS, 0, deadline, signatures, sender=alice)
+
+    assets[2].approve(zap, AMOUNTS[2], sender=alice)
+    zap.add_liquidity_permit(AMOUNTS, 0, deadline, signatures, sender=alice)
+    assert staking.balanceOf(alice) == 6 * UNIT
+    assert assets[2].nonces(alice) == 0
+
+def test_add_liquidity_permit_frontrun(alice, bob, assets, staking, zap, deadline):
+    # a permit used by someone else does not block the deposit
+    signatures = sign_permits(alice, zap, AMOUNTS, deadline)
+    assets[0].permit(alice, zap, AMOUNTS[0], deadline, *signatures[0], sender=bob)
+    zap.add_liquidity_permit(AMOUNTS, 0, deadline, signatures, sender=alice)
+    assert staking.balanceOf(alice) == 6 * UNIT
+
+def test_add_liquidity_permit_expired(chain, alice, zap, deadline):
+    signatures = sign_permits(alice, zap, AMOUNTS, deadline)
+    chain.pending_timestamp = deadline + 1
+    with reverts():
+        zap.add_liquidity_permit(AMOUNTS, 0, deadline, signatures, sender=alice)